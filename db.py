@@ -1,217 +1,319 @@
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import orjson
 import psycopg2
+import psycopg2.extras
+from psycopg2.pool import ThreadedConnectionPool
+
+# psycopg2's pool closes a returned connection once DB_POOL_MIN_CONN are
+# already idle, so any borrow past that would reconnect (TCP+TLS+auth).
+# The minimum therefore defaults to the maximum (all opened with the pool), so
+# every borrow reuses an open connection. It never hands out more than
+# DB_POOL_MAX_CONN
+DB_POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", "10"))
+DB_POOL_MIN_CONN = min(int(os.getenv("DB_POOL_MIN_CONN", str(DB_POOL_MAX_CONN))), DB_POOL_MAX_CONN)
+
+# json/jsonb columns are decoded with orjson on every connection
+psycopg2.extras.register_default_json(globally=True, loads=orjson.loads)
+psycopg2.extras.register_default_jsonb(globally=True, loads=orjson.loads)
+
+
+class Json(psycopg2.extras.Json):
+    """psycopg2's Json adapter, encoding parameters with orjson."""
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises when exhausted; callers wait for a slot instead
+_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX_CONN)
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                db_url = os.getenv("DATABASE_URL")
+                if not db_url:
+                    raise RuntimeError("DATABASE_URL is missing")
+                _pool = ThreadedConnectionPool(
+                    DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, db_url, connect_timeout=5
+                )
+    return _pool
+
+
+@contextmanager
+def get_conn() -> Iterator["psycopg2.extensions.connection"]:
+    """
+    Borrow a pooled connection. Uncommitted work is rolled back when it is
+    returned, and connections that broke while in use are dropped.
+    """
+    pool = _get_pool()
+    with _pool_slots:
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
 
 
-def get_conn():
-    db_url = os.getenv("DATABASE_URL")
-    if not db_url:
-        raise RuntimeError("DATABASE_URL is missing")
-    return psycopg2.connect(db_url, connect_timeout=5)
+def close_pool() -> None:
+    """Called from the app shutdown hook."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+# DDL already applied by this process; the statements are all IF NOT EXISTS,
+# so repeating one only costs a round trip
+_ddl_done: set = set()
+# Every worker runs the DDL at startup; concurrent CREATE ... IF NOT EXISTS of
+# the same object can still fail on a catalog unique index, so the workers
+# take this advisory lock and run it one at a time
+_DDL_LOCK_ID = 0x71A2C_DD1
+
+
+def new_id() -> str:
+    """
+    Time-ordered UUIDv7 (RFC 9562) for primary keys. New rows land at the
+    right-hand edge of the index instead of on a random B-tree page.
+    """
+    ms = time.time_ns() // 1_000_000
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def _run_ddl(*statements: str) -> None:
+    pending = [sql for sql in statements if sql not in _ddl_done]
+    if not pending:
+        return
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_xact_lock(%s);" % _DDL_LOCK_ID + "".join(pending))
+        conn.commit()
+    _ddl_done.update(pending)
 
 
 # -------------------------------------------------------------------
 # Legacy tables (keep for compatibility)
 # -------------------------------------------------------------------
+_AI_PROJECTS_DDL = """
+CREATE TABLE IF NOT EXISTS ai_projects (
+  id UUID PRIMARY KEY,
+  website TEXT NOT NULL,
+  topics JSONB NOT NULL DEFAULT '[]'::jsonb,
+  competitors JSONB NOT NULL DEFAULT '[]'::jsonb,
+  questions JSONB NOT NULL DEFAULT '[]'::jsonb,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+
 def ensure_ai_projects_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS ai_projects (
-          id UUID PRIMARY KEY,
-          website TEXT NOT NULL,
-          topics JSONB NOT NULL DEFAULT '[]'::jsonb,
-          competitors JSONB NOT NULL DEFAULT '[]'::jsonb,
-          questions JSONB NOT NULL DEFAULT '[]'::jsonb,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-        );
-        """
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_AI_PROJECTS_DDL)
+
+
+_AI_PREVIEW_RUNS_DDL = """
+CREATE TABLE IF NOT EXISTS ai_preview_runs (
+  id UUID PRIMARY KEY,
+  project_id UUID NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  result JSONB NOT NULL,
+  CONSTRAINT fk_ai_preview_runs_project
+    FOREIGN KEY (project_id) REFERENCES ai_projects(id) ON DELETE CASCADE
+);
+-- Serves latest-preview (newest run per project) as a single index probe;
+-- also covers project_id lookups. Databases that still have the old
+-- idx_ai_preview_runs_project_id drop it with
+-- scripts/drop_preview_project_index.py; startup DDL stays additive
+CREATE INDEX IF NOT EXISTS idx_ai_preview_runs_project_created
+  ON ai_preview_runs(project_id, created_at DESC);
+"""
 
 
 def ensure_ai_preview_runs_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS ai_preview_runs (
-          id UUID PRIMARY KEY,
-          project_id UUID NOT NULL,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-          result JSONB NOT NULL,
-          CONSTRAINT fk_ai_preview_runs_project
-            FOREIGN KEY (project_id) REFERENCES ai_projects(id) ON DELETE CASCADE
-        );
-        """
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_ai_preview_runs_project_id ON ai_preview_runs(project_id);"
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_AI_PREVIEW_RUNS_DDL)
 
 
 # -------------------------------------------------------------------
 # Phase 1: reproducible data model tables
 # -------------------------------------------------------------------
+_PROJECTS_DDL = """
+CREATE TABLE IF NOT EXISTS projects (
+  id UUID PRIMARY KEY,
+  owner_id TEXT NULL,
+  name TEXT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+
 def ensure_projects_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS projects (
-          id UUID PRIMARY KEY,
-          owner_id TEXT NULL,
-          name TEXT NULL,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-        );
-        """
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_PROJECTS_DDL)
+
+
+_ENTITIES_DDL = """
+CREATE TABLE IF NOT EXISTS entities (
+  id UUID PRIMARY KEY,
+  project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+  type TEXT NOT NULL CHECK (type IN ('customer','competitor')),
+  name TEXT NOT NULL,
+  website TEXT NULL,
+  brand_terms JSONB NOT NULL DEFAULT '[]'::jsonb,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_entities_project_id ON entities(project_id);
+"""
 
 
 def ensure_entities_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS entities (
-          id UUID PRIMARY KEY,
-          project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
-          type TEXT NOT NULL CHECK (type IN ('customer','competitor')),
-          name TEXT NOT NULL,
-          website TEXT NULL,
-          brand_terms JSONB NOT NULL DEFAULT '[]'::jsonb,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-        );
-        """
-    )
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_entities_project_id ON entities(project_id);")
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_ENTITIES_DDL)
+
+
+_QUESTION_SETS_DDL = """
+CREATE TABLE IF NOT EXISTS question_sets (
+  id UUID PRIMARY KEY,
+  project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+  version TEXT NOT NULL,
+  questions JSONB NOT NULL DEFAULT '[]'::jsonb,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  UNIQUE(project_id, version)
+);
+CREATE INDEX IF NOT EXISTS idx_question_sets_project_id ON question_sets(project_id);
+"""
 
 
 def ensure_question_sets_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS question_sets (
-          id UUID PRIMARY KEY,
-          project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
-          version TEXT NOT NULL,
-          questions JSONB NOT NULL DEFAULT '[]'::jsonb,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-          UNIQUE(project_id, version)
-        );
-        """
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_question_sets_project_id ON question_sets(project_id);"
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_QUESTION_SETS_DDL)
+
+
+_RUNS_DDL = """
+CREATE TABLE IF NOT EXISTS runs (
+  id UUID PRIMARY KEY,
+  project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+  question_set_version TEXT NOT NULL,
+  model TEXT NOT NULL,
+  prompt_version TEXT NOT NULL,
+  status TEXT NOT NULL CHECK (status IN ('queued','running','succeeded','failed','cancelled')),
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  started_at TIMESTAMPTZ NULL,
+  finished_at TIMESTAMPTZ NULL,
+  input_snapshot JSONB NOT NULL DEFAULT '{}'::jsonb
+);
+CREATE INDEX IF NOT EXISTS idx_runs_project_id ON runs(project_id);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC);
+"""
 
 
 def ensure_runs_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS runs (
-          id UUID PRIMARY KEY,
-          project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
-          question_set_version TEXT NOT NULL,
-          model TEXT NOT NULL,
-          prompt_version TEXT NOT NULL,
-          status TEXT NOT NULL CHECK (status IN ('queued','running','succeeded','failed','cancelled')),
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-          started_at TIMESTAMPTZ NULL,
-          finished_at TIMESTAMPTZ NULL,
-          input_snapshot JSONB NOT NULL DEFAULT '{}'::jsonb
-        );
-        """
-    )
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_runs_project_id ON runs(project_id);")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC);")
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_RUNS_DDL)
+
+
+# Live counters of a running run, kept out of runs.input_snapshot so each
+# progress write is a small in-place row update, not a JSONB rewrite
+_RUN_PROGRESS_DDL = """
+CREATE TABLE IF NOT EXISTS run_progress (
+  run_id UUID PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+  total INT NOT NULL,
+  done INT NOT NULL DEFAULT 0,
+  errors INT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+
+def ensure_run_progress_table():
+    _run_ddl(_RUN_PROGRESS_DDL)
+
+
+_RUN_ITEMS_DDL = """
+CREATE TABLE IF NOT EXISTS run_items (
+  id UUID PRIMARY KEY,
+  run_id UUID NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+  entity_id UUID NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+  question_index INT NOT NULL,
+  question_text TEXT NOT NULL,
+  raw_answer TEXT NULL,
+  raw_meta JSONB NOT NULL DEFAULT '{}'::jsonb,
+  error JSONB NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  UNIQUE(run_id, entity_id, question_index)
+);
+CREATE INDEX IF NOT EXISTS idx_run_items_run_id ON run_items(run_id);
+CREATE INDEX IF NOT EXISTS idx_run_items_entity_id ON run_items(entity_id);
+"""
 
 
 def ensure_run_items_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS run_items (
-          id UUID PRIMARY KEY,
-          run_id UUID NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
-          entity_id UUID NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
-          question_index INT NOT NULL,
-          question_text TEXT NOT NULL,
-          raw_answer TEXT NULL,
-          raw_meta JSONB NOT NULL DEFAULT '{}'::jsonb,
-          error JSONB NULL,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-          UNIQUE(run_id, entity_id, question_index)
-        );
-        """
-    )
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_run_items_run_id ON run_items(run_id);")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_run_items_entity_id ON run_items(entity_id);")
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_RUN_ITEMS_DDL)
+
+
+_ANALYSIS_ITEMS_DDL = """
+CREATE TABLE IF NOT EXISTS analysis_items (
+  id UUID PRIMARY KEY,
+  run_item_id UUID NOT NULL REFERENCES run_items(id) ON DELETE CASCADE,
+  analyzer_version TEXT NOT NULL,
+  brand_mentioned BOOLEAN NULL,
+  competitors_mentioned JSONB NOT NULL DEFAULT '[]'::jsonb,
+  strength_score DOUBLE PRECISION NULL,
+  evidence_snippet TEXT NULL,
+  summary TEXT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  UNIQUE(run_item_id, analyzer_version)
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_items_run_item_id ON analysis_items(run_item_id);
+CREATE INDEX IF NOT EXISTS idx_analysis_items_analyzer_version ON analysis_items(analyzer_version);
+"""
 
 
 def ensure_analysis_items_table():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS analysis_items (
-          id UUID PRIMARY KEY,
-          run_item_id UUID NOT NULL REFERENCES run_items(id) ON DELETE CASCADE,
-          analyzer_version TEXT NOT NULL,
-          brand_mentioned BOOLEAN NULL,
-          competitors_mentioned JSONB NOT NULL DEFAULT '[]'::jsonb,
-          strength_score DOUBLE PRECISION NULL,
-          evidence_snippet TEXT NULL,
-          summary TEXT NULL,
-          created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-          UNIQUE(run_item_id, analyzer_version)
-        );
-        """
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_analysis_items_run_item_id ON analysis_items(run_item_id);"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_analysis_items_analyzer_version ON analysis_items(analyzer_version);"
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    _run_ddl(_ANALYSIS_ITEMS_DDL)
+
+
+# -------------------------------------------------------------------
+# LLM answer cache (shared by every worker, survives restarts)
+# -------------------------------------------------------------------
+_LLM_RESPONSE_CACHE_DDL = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+  key TEXT PRIMARY KEY,
+  model TEXT NOT NULL,
+  response JSONB NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+
+def ensure_llm_response_cache_table():
+    _run_ddl(_LLM_RESPONSE_CACHE_DDL)
+
+
+# Creation order matters for the foreign keys
+_ALL_DDL = (
+    _AI_PROJECTS_DDL,
+    _AI_PREVIEW_RUNS_DDL,
+    _PROJECTS_DDL,
+    _ENTITIES_DDL,
+    _QUESTION_SETS_DDL,
+    _RUNS_DDL,
+    _RUN_PROGRESS_DDL,
+    _RUN_ITEMS_DDL,
+    _ANALYSIS_ITEMS_DDL,
+    _LLM_RESPONSE_CACHE_DDL,
+)
 
 
 def ensure_tables():
-    # Keep one entry-point called from FastAPI startup
-    ensure_ai_projects_table()
-    ensure_ai_preview_runs_table()
-
-    # Phase 1 tables
-    ensure_projects_table()
-    ensure_entities_table()
-    ensure_question_sets_table()
-    ensure_runs_table()
-    ensure_run_items_table()
-    ensure_analysis_items_table()
\ No newline at end of file
+    # Keep one entry-point called from FastAPI startup: every table and index
+    # in a single round trip and a single transaction
+    _run_ddl(*_ALL_DDL)
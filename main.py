@@ -1,23 +1,45 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
 import os
+from typing import Any, NamedTuple
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
-from db import get_conn, ensure_tables
-from tools.ai_answer_presence import router as ai_answer_presence_router
-from tools.arc_rank_checker import router as arc_rank_checker_router
+from db import close_pool, ensure_tables, get_conn
+from tools.ai_answer_presence import (
+    router as ai_answer_presence_router,
+    close_clients as close_ai_answer_presence_clients,
+)
+from tools.arc_rank_checker import (
+    router as arc_rank_checker_router,
+    close_clients as close_arc_rank_checker_clients,
+)
 
 # -------------------------------------------------------------------
 # Config
 # -------------------------------------------------------------------
 load_dotenv()
 
-app = FastAPI()
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (much faster on the large tool reports)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # -------------------------------------------------------------------
 # CORS (single middleware)
@@ -40,6 +62,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if Accept-Encoding allows gzip; a q=0 coding is a refusal."""
+    wildcard = False
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    return wildcard
+
+
+class _GZipMiddleware(GZipMiddleware):
+    # Starlette only looks for "gzip" in the header, so "gzip;q=0" would
+    # still get a compressed body
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not _accepts_gzip(Headers(scope=scope).get("accept-encoding", "")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Large JSON reports compress well. Responses that already carry a
+# Content-Encoding (the pre-gzipped legacy pages) pass through untouched, and
+# NDJSON streams are left alone so each event still flushes as it is produced.
+app.add_middleware(
+    _GZipMiddleware,
+    minimum_size=1024,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/x-ndjson",),
+)
+
 # -------------------------------------------------------------------
 # Routers
 # -------------------------------------------------------------------
@@ -50,32 +113,33 @@ app.include_router(arc_rank_checker_router)
 # Health + DB
 # -------------------------------------------------------------------
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
 
-@app.get("/db-health")
-def db_health():
-    try:
-        conn = get_conn()
-        cur = conn.cursor()
+# /db-health serves the last result of a background check, so frequent
+# probes never reach Postgres
+DB_HEALTH_REFRESH_S = 5
+_db_status: dict = {"db": "unknown"}
+_db_status_task: asyncio.Task | None = None
 
-        cur.execute("SELECT 1;")
-        val = cur.fetchone()[0]
 
-        cur.execute("SELECT current_database(), inet_server_addr(), inet_server_port();")
-        db_name, server_addr, server_port = cur.fetchone()
+def _check_db() -> dict:
+    try:
+        with get_conn() as conn, conn.cursor() as cur:
+            cur.execute("SELECT 1;")
+            val = cur.fetchone()[0]
 
-        cur.execute("""
-            select tablename
-            from pg_tables
-            where schemaname = 'public'
-              and tablename in ('projects','entities','question_sets','runs','run_items','analysis_items')
-            order by tablename;
-        """)
-        phase1_tables = [r[0] for r in cur.fetchall()]
+            cur.execute("SELECT current_database(), inet_server_addr(), inet_server_port();")
+            db_name, server_addr, server_port = cur.fetchone()
 
-        cur.close()
-        conn.close()
+            cur.execute("""
+                select tablename
+                from pg_tables
+                where schemaname = 'public'
+                  and tablename in ('projects','entities','question_sets','runs','run_items','analysis_items')
+                order by tablename;
+            """)
+            phase1_tables = [r[0] for r in cur.fetchall()]
 
         return {
             "db": "ok",
@@ -88,6 +152,18 @@ def db_health():
     except Exception as e:
         return {"db": "error", "detail": str(e)}
 
+
+async def _refresh_db_status() -> None:
+    global _db_status
+    while True:
+        _db_status = await asyncio.to_thread(_check_db)
+        await asyncio.sleep(DB_HEALTH_REFRESH_S)
+
+
+@app.get("/db-health")
+async def db_health():
+    return _db_status
+
 @app.on_event("startup")
 def on_startup():
     """
@@ -102,6 +178,24 @@ def on_startup():
         return
     ensure_tables()
 
+@app.on_event("startup")
+async def start_db_status_refresh():
+    global _db_status, _db_status_task
+    if not os.getenv("DATABASE_URL"):
+        # Local/dev without a DB: nothing to poll
+        _db_status = {"db": "error", "detail": "DATABASE_URL is missing"}
+        return
+    # The first check runs in the task too, so startup doesn't wait on it
+    _db_status_task = asyncio.create_task(_refresh_db_status())
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if _db_status_task is not None:
+        _db_status_task.cancel()
+    await close_arc_rank_checker_clients()
+    await close_ai_answer_presence_clients()
+    close_pool()
+
 # -------------------------------------------------------------------
 # Root behavior (API-only)
 # -------------------------------------------------------------------
@@ -115,65 +209,87 @@ def root():
 # -------------------------------------------------------------------
 SERVE_LEGACY_UI = os.getenv("SERVE_LEGACY_UI", "").lower() in ("1", "true", "yes")
 
+BASE_DIR = os.path.dirname(__file__)
+
+# Browsers may reuse a legacy page for this long, then revalidate by ETag
+LEGACY_PAGE_MAX_AGE_S = 300
+
+
+class _LegacyPage(NamedTuple):
+    body: bytes
+    gzip_body: bytes
+    status: int
+    etag: str
+
+
+def _load_legacy_page(rel_path: str, missing_html: str) -> _LegacyPage:
+    """Read (and gzip) a legacy HTML page once; requests are served from memory."""
+    try:
+        with open(os.path.join(BASE_DIR, rel_path), "rb") as f:
+            body = f.read()
+    except OSError:
+        return _LegacyPage(missing_html.encode("utf-8"), b"", 500, "")
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+    return _LegacyPage(body, gzip.compress(body, compresslevel=6), 200, etag)
+
+
+def _legacy_page_response(page: _LegacyPage, request: Request) -> Response:
+    if page.status != 200:
+        return HTMLResponse(content=page.body, status_code=page.status)
+
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    # Each encoding is a different representation, so it gets its own ETag
+    etag = page.etag[:-1] + '-gzip"' if use_gzip else page.etag
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={LEGACY_PAGE_MAX_AGE_S}",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=page.gzip_body, headers=headers)
+    return HTMLResponse(content=page.body, headers=headers)
+
+
 if SERVE_LEGACY_UI:
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
+    _TOOLS_HTML = _load_legacy_page(
+        os.path.join("static", "tools.html"),
+        "<h1>tools.html not found</h1><p>Place it inside /static.</p>",
+    )
+    _SITE_HTML = _load_legacy_page(
+        os.path.join("website", "index.html"),
+        "<h1>Marketing site not found</h1><p>Place index.html inside /website folder.</p>",
+    )
+    _ARC_RANK_CHECKER_HTML = _load_legacy_page(
+        "index.html",
+        "<h1>index.html not found</h1><p>Place index.html next to main.py.</p>",
+    )
+    _AI_ANSWER_PRESENCE_HTML = _load_legacy_page(
+        os.path.join("static", "ai_answer_presence.html"),
+        "<h1>ai_answer_presence.html not found</h1><p>Place it inside /static.</p>",
+    )
+
     @app.head("/ai_answer_presence")
     def head_ai_answer_presence():
         return
 
     @app.get("/tools", response_class=HTMLResponse)
-    def serve_tools_home():
-        base_dir = os.path.dirname(__file__)
-        path = os.path.join(base_dir, "static", "tools.html")
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            return HTMLResponse(
-                content="<h1>tools.html not found</h1><p>Place it inside /static.</p>",
-                status_code=500,
-            )
+    def serve_tools_home(request: Request):
+        return _legacy_page_response(_TOOLS_HTML, request)
 
     @app.get("/site", response_class=HTMLResponse)
-    def serve_marketing_site():
-        base_dir = os.path.dirname(__file__)
-        path = os.path.join(base_dir, "website", "index.html")
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception:
-            return HTMLResponse(
-                "<h1>Marketing site not found</h1><p>Place index.html inside /website folder.</p>",
-                status_code=500,
-            )
+    def serve_marketing_site(request: Request):
+        return _legacy_page_response(_SITE_HTML, request)
 
     @app.get("/arc-rank-checker", response_class=HTMLResponse, include_in_schema=False)
-    def serve_arc_rank_checker():
-        base_dir = os.path.dirname(__file__)
-        index_path = os.path.join(base_dir, "index.html")
-
-        try:
-            with open(index_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            return HTMLResponse(
-                content="<h1>index.html not found</h1><p>Place index.html next to main.py.</p>",
-                status_code=500,
-            )
+    def serve_arc_rank_checker(request: Request):
+        return _legacy_page_response(_ARC_RANK_CHECKER_HTML, request)
 
     @app.get("/ai_answer_presence", response_class=HTMLResponse)
-    def serve_ai_answer_presence():
-        base_dir = os.path.dirname(__file__)
-        path = os.path.join(base_dir, "static", "ai_answer_presence.html")
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            return HTMLResponse(
-                content="<h1>ai_answer_presence.html not found</h1><p>Place it inside /static.</p>",
-                status_code=500,
-            )
\ No newline at end of file
+    def serve_ai_answer_presence(request: Request):
+        return _legacy_page_response(_AI_ANSWER_PRESENCE_HTML, request)
@@ -0,0 +1,70 @@
+"""
+JSON schemas for ai-answer-presence LLM output: one preview answer, and the
+answers of a /run call that asks several questions at once.
+
+Sent to the Responses API as strict structured-output formats, so every
+property is required and extra keys are forbidden.
+"""
+
+from typing import Any, Dict
+
+PREVIEW_ANSWER_SCHEMA_NAME = "presence"
+
+PREVIEW_ANSWER_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "brand_mentioned": {"type": "boolean"},
+        "competitors_mentioned": {"type": "array", "items": {"type": "string"}},
+        "recommendation_strength": {"type": "number", "description": "0.0-1.0"},
+        "short_summary": {"type": "string", "description": "one sentence"},
+        "evidence_snippet": {"type": "string", "description": "short quote from the answer"},
+    },
+    "required": [
+        "brand_mentioned",
+        "competitors_mentioned",
+        "recommendation_strength",
+        "short_summary",
+        "evidence_snippet",
+    ],
+    "additionalProperties": False,
+}
+
+# /run with questions_per_call > 1: one answer per question, tagged with
+# the question index from the prompt
+RUN_ANSWERS_SCHEMA_NAME = "answers"
+
+RUN_ANSWERS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "answers": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "qi": {"type": "integer"},
+                    "answer": {"type": "string"},
+                },
+                "required": ["qi", "answer"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["answers"],
+    "additionalProperties": False,
+}
+
+
+def _text_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    # Responses API shape: text={"format": {...}}
+    return {
+        "format": {
+            "type": "json_schema",
+            "name": name,
+            "schema": schema,
+            "strict": True,
+        }
+    }
+
+
+PREVIEW_TEXT_FORMAT = _text_format(PREVIEW_ANSWER_SCHEMA_NAME, PREVIEW_ANSWER_SCHEMA)
+RUN_ANSWERS_TEXT_FORMAT = _text_format(RUN_ANSWERS_SCHEMA_NAME, RUN_ANSWERS_SCHEMA)
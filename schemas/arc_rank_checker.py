@@ -0,0 +1,169 @@
+"""
+JSON schema for the arc-rank-checker LLM report.
+
+Sent to OpenAI as a strict structured-output schema, so every object lists
+all of its properties as required and forbids extra keys. page_metadata and
+raw_data are not part of it: the server fills those in after the call.
+
+FINISHED_REPORT_SCHEMA is the server-side check of the finished report: the
+same shape plus the two server-filled blocks. Its validator is generated
+ahead of time into schemas/arc_rank_checker_validator.py by
+scripts/gen_validator.py; rerun the script after editing these schemas.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+REPORT_SCHEMA_NAME = "seo_report"
+
+
+def _obj(**props: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": props,
+        "required": list(props),
+        "additionalProperties": False,
+    }
+
+
+def _arr(items: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "array", "items": items}
+
+
+_STR = {"type": "string"}
+_BOOL = {"type": "boolean"}
+_SCORE = {"type": "integer", "description": "0-10"}
+_PERCENT = {"type": "integer", "description": "0-100"}
+_STR_LIST = _arr(_STR)
+
+
+REPORT_SCHEMA: Dict[str, Any] = _obj(
+    executive_summary=_obj(
+        overall_llm_readiness_score=_PERCENT,
+        verdict={"type": "string", "enum": ["Ready", "Partially Ready", "Needs Work", "Poor"]},
+        main_issue=_STR,
+        top_3_fixes=_STR_LIST,
+    ),
+    llm_interpretation=_obj(
+        primary_topic=_STR,
+        secondary_topics=_STR_LIST,
+        detected_intent=_STR,
+        summary_llm_generated=_STR,
+        key_claims_llm_detected=_STR_LIST,
+        confidence_level=_STR,
+    ),
+    summary_block=_obj(
+        score=_SCORE,
+        found=_BOOL,
+        quality=_STR,
+        problems=_STR_LIST,
+        recommended_summary_block=_STR,
+    ),
+    definitions_block=_obj(
+        score=_SCORE,
+        found=_BOOL,
+        missing_critical_terms=_STR_LIST,
+        quality_problems=_STR_LIST,
+        recommended_definitions=_arr(_obj(term=_STR, definition=_STR)),
+    ),
+    fanout_query_analysis=_obj(
+        sub_questions_generated=_arr(
+            _obj(
+                question=_STR,
+                matched_content=_STR,
+                match_quality=_STR,
+                missing_answer_note=_STR,
+            )
+        ),
+        coverage_score=_SCORE,
+        main_gaps=_STR_LIST,
+    ),
+    faq_block=_obj(
+        score=_SCORE,
+        found=_BOOL,
+        quality_problems=_STR_LIST,
+        recommended_faqs=_arr(_obj(q=_STR, a=_STR)),
+    ),
+    canonical_resources_block=_obj(
+        score=_SCORE,
+        found=_BOOL,
+        missing_resources=_STR_LIST,
+        why_it_matters=_STR,
+        recommended_resources=_arr(_obj(title=_STR, url=_STR)),
+    ),
+    content_structure=_obj(
+        score=_SCORE,
+        headings_quality=_STR,
+        visual_structure=_STR,
+        problems=_STR_LIST,
+        recommended_structure_changes=_STR_LIST,
+    ),
+    clarity_readability=_obj(
+        score=_SCORE,
+        issues=_STR_LIST,
+        fixes=_STR_LIST,
+    ),
+    eeat_block=_obj(
+        score=_SCORE,
+        author_info_found=_BOOL,
+        expertise_visibility=_STR,
+        experience_signals=_STR,
+        trust_signals=_STR,
+        missing_elements=_STR_LIST,
+    ),
+    score_matrix=_obj(
+        summary_block=_SCORE,
+        definitions=_SCORE,
+        faq=_SCORE,
+        fanout_match=_SCORE,
+        canonical_resources=_SCORE,
+        structure=_SCORE,
+        clarity=_SCORE,
+        eeat=_SCORE,
+        final_score=_PERCENT,
+    ),
+    fix_roadmap=_obj(
+        immediate_fixes_next_24h=_STR_LIST,
+        medium_priority_next_7_days=_STR_LIST,
+        long_term_next_30_days=_STR_LIST,
+    ),
+)
+
+# /analyze-batch: one report per page, tagged with the page id from the prompt
+BATCH_REPORT_SCHEMA_NAME = "seo_report_batch"
+
+BATCH_REPORT_SCHEMA: Dict[str, Any] = _obj(
+    results=_arr(_obj(id={"type": "integer"}, **REPORT_SCHEMA["properties"])),
+)
+
+
+def _response_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": schema,
+            "strict": True,
+        },
+    }
+
+
+REPORT_RESPONSE_FORMAT = _response_format(REPORT_SCHEMA_NAME, REPORT_SCHEMA)
+BATCH_REPORT_RESPONSE_FORMAT = _response_format(BATCH_REPORT_SCHEMA_NAME, BATCH_REPORT_SCHEMA)
+
+
+FINISHED_REPORT_SCHEMA: Dict[str, Any] = {
+    **REPORT_SCHEMA,
+    "properties": {
+        **REPORT_SCHEMA["properties"],
+        "page_metadata": {"type": "object"},
+        "raw_data": {"type": "object"},
+    },
+    "required": [*REPORT_SCHEMA["required"], "page_metadata", "raw_data"],
+}
+
+# Stamped into the generated validator so a stale one is detected at import
+FINISHED_REPORT_SCHEMA_SHA256 = hashlib.sha256(
+    json.dumps(FINISHED_REPORT_SCHEMA, sort_keys=True).encode("utf-8")
+).hexdigest()
@@ -0,0 +1,690 @@
+"""
+Generated by scripts/gen_validator.py from FINISHED_REPORT_SCHEMA. Do not edit.
+"""
+# fmt: off
+SCHEMA_SHA256 = "fa55e5004fe49121514f5e99356c660f991a4e4341e21bf88a72609707802dfd"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'executive_summary': {'type': 'object', 'properties': {'overall_llm_readiness_score': {'type': 'integer', 'description': '0-100'}, 'verdict': {'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, 'main_issue': {'type': 'string'}, 'top_3_fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes'], 'additionalProperties': False}, 'llm_interpretation': {'type': 'object', 'properties': {'primary_topic': {'type': 'string'}, 'secondary_topics': {'type': 'array', 'items': {'type': 'string'}}, 'detected_intent': {'type': 'string'}, 'summary_llm_generated': {'type': 'string'}, 'key_claims_llm_detected': {'type': 'array', 'items': {'type': 'string'}}, 'confidence_level': {'type': 'string'}}, 'required': ['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level'], 'additionalProperties': False}, 'summary_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_summary_block': {'type': 'string'}}, 'required': ['score', 'found', 'quality', 'problems', 'recommended_summary_block'], 'additionalProperties': False}, 'definitions_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_critical_terms': {'type': 'array', 'items': {'type': 'string'}}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_definitions': {'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions'], 'additionalProperties': False}, 'fanout_query_analysis': {'type': 'object', 'properties': {'sub_questions_generated': {'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, 'coverage_score': {'type': 'integer', 'description': '0-10'}, 'main_gaps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sub_questions_generated', 'coverage_score', 'main_gaps'], 'additionalProperties': False}, 'faq_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_faqs': {'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'quality_problems', 'recommended_faqs'], 'additionalProperties': False}, 'canonical_resources_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_resources': {'type': 'array', 'items': {'type': 'string'}}, 'why_it_matters': {'type': 'string'}, 'recommended_resources': {'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources'], 'additionalProperties': False}, 'content_structure': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'headings_quality': {'type': 'string'}, 'visual_structure': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_structure_changes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes'], 'additionalProperties': False}, 'clarity_readability': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'issues': {'type': 'array', 'items': {'type': 'string'}}, 'fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'issues', 'fixes'], 'additionalProperties': False}, 'eeat_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'author_info_found': {'type': 'boolean'}, 'expertise_visibility': {'type': 'string'}, 'experience_signals': {'type': 'string'}, 'trust_signals': {'type': 'string'}, 'missing_elements': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements'], 'additionalProperties': False}, 'score_matrix': {'type': 'object', 'properties': {'summary_block': {'type': 'integer', 'description': '0-10'}, 'definitions': {'type': 'integer', 'description': '0-10'}, 'faq': {'type': 'integer', 'description': '0-10'}, 'fanout_match': {'type': 'integer', 'description': '0-10'}, 'canonical_resources': {'type': 'integer', 'description': '0-10'}, 'structure': {'type': 'integer', 'description': '0-10'}, 'clarity': {'type': 'integer', 'description': '0-10'}, 'eeat': {'type': 'integer', 'description': '0-10'}, 'final_score': {'type': 'integer', 'description': '0-100'}}, 'required': ['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score'], 'additionalProperties': False}, 'fix_roadmap': {'type': 'object', 'properties': {'immediate_fixes_next_24h': {'type': 'array', 'items': {'type': 'string'}}, 'medium_priority_next_7_days': {'type': 'array', 'items': {'type': 'string'}}, 'long_term_next_30_days': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days'], 'additionalProperties': False}, 'page_metadata': {'type': 'object'}, 'raw_data': {'type': 'object'}}, 'required': ['executive_summary', 'llm_interpretation', 'summary_block', 'definitions_block', 'fanout_query_analysis', 'faq_block', 'canonical_resources_block', 'content_structure', 'clarity_readability', 'eeat_block', 'score_matrix', 'fix_roadmap', 'page_metadata', 'raw_data'], 'additionalProperties': False}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['executive_summary', 'llm_interpretation', 'summary_block', 'definitions_block', 'fanout_query_analysis', 'faq_block', 'canonical_resources_block', 'content_structure', 'clarity_readability', 'eeat_block', 'score_matrix', 'fix_roadmap', 'page_metadata', 'raw_data']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'executive_summary': {'type': 'object', 'properties': {'overall_llm_readiness_score': {'type': 'integer', 'description': '0-100'}, 'verdict': {'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, 'main_issue': {'type': 'string'}, 'top_3_fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes'], 'additionalProperties': False}, 'llm_interpretation': {'type': 'object', 'properties': {'primary_topic': {'type': 'string'}, 'secondary_topics': {'type': 'array', 'items': {'type': 'string'}}, 'detected_intent': {'type': 'string'}, 'summary_llm_generated': {'type': 'string'}, 'key_claims_llm_detected': {'type': 'array', 'items': {'type': 'string'}}, 'confidence_level': {'type': 'string'}}, 'required': ['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level'], 'additionalProperties': False}, 'summary_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_summary_block': {'type': 'string'}}, 'required': ['score', 'found', 'quality', 'problems', 'recommended_summary_block'], 'additionalProperties': False}, 'definitions_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_critical_terms': {'type': 'array', 'items': {'type': 'string'}}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_definitions': {'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions'], 'additionalProperties': False}, 'fanout_query_analysis': {'type': 'object', 'properties': {'sub_questions_generated': {'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, 'coverage_score': {'type': 'integer', 'description': '0-10'}, 'main_gaps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sub_questions_generated', 'coverage_score', 'main_gaps'], 'additionalProperties': False}, 'faq_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_faqs': {'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'quality_problems', 'recommended_faqs'], 'additionalProperties': False}, 'canonical_resources_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_resources': {'type': 'array', 'items': {'type': 'string'}}, 'why_it_matters': {'type': 'string'}, 'recommended_resources': {'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources'], 'additionalProperties': False}, 'content_structure': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'headings_quality': {'type': 'string'}, 'visual_structure': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_structure_changes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes'], 'additionalProperties': False}, 'clarity_readability': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'issues': {'type': 'array', 'items': {'type': 'string'}}, 'fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'issues', 'fixes'], 'additionalProperties': False}, 'eeat_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'author_info_found': {'type': 'boolean'}, 'expertise_visibility': {'type': 'string'}, 'experience_signals': {'type': 'string'}, 'trust_signals': {'type': 'string'}, 'missing_elements': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements'], 'additionalProperties': False}, 'score_matrix': {'type': 'object', 'properties': {'summary_block': {'type': 'integer', 'description': '0-10'}, 'definitions': {'type': 'integer', 'description': '0-10'}, 'faq': {'type': 'integer', 'description': '0-10'}, 'fanout_match': {'type': 'integer', 'description': '0-10'}, 'canonical_resources': {'type': 'integer', 'description': '0-10'}, 'structure': {'type': 'integer', 'description': '0-10'}, 'clarity': {'type': 'integer', 'description': '0-10'}, 'eeat': {'type': 'integer', 'description': '0-10'}, 'final_score': {'type': 'integer', 'description': '0-100'}}, 'required': ['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score'], 'additionalProperties': False}, 'fix_roadmap': {'type': 'object', 'properties': {'immediate_fixes_next_24h': {'type': 'array', 'items': {'type': 'string'}}, 'medium_priority_next_7_days': {'type': 'array', 'items': {'type': 'string'}}, 'long_term_next_30_days': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days'], 'additionalProperties': False}, 'page_metadata': {'type': 'object'}, 'raw_data': {'type': 'object'}}, 'required': ['executive_summary', 'llm_interpretation', 'summary_block', 'definitions_block', 'fanout_query_analysis', 'faq_block', 'canonical_resources_block', 'content_structure', 'clarity_readability', 'eeat_block', 'score_matrix', 'fix_roadmap', 'page_metadata', 'raw_data'], 'additionalProperties': False}, rule='required')
+        data_keys = set(data.keys())
+        if "executive_summary" in data_keys:
+            data_keys.remove("executive_summary")
+            data__executivesummary = data["executive_summary"]
+            if not isinstance(data__executivesummary, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary must be object", value=data__executivesummary, name="" + (name_prefix or "data") + ".executive_summary", definition={'type': 'object', 'properties': {'overall_llm_readiness_score': {'type': 'integer', 'description': '0-100'}, 'verdict': {'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, 'main_issue': {'type': 'string'}, 'top_3_fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes'], 'additionalProperties': False}, rule='type')
+            data__executivesummary_is_dict = isinstance(data__executivesummary, dict)
+            if data__executivesummary_is_dict:
+                data__executivesummary__missing_keys = set(['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes']) - data__executivesummary.keys()
+                if data__executivesummary__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary must contain " + (str(sorted(data__executivesummary__missing_keys)) + " properties"), value=data__executivesummary, name="" + (name_prefix or "data") + ".executive_summary", definition={'type': 'object', 'properties': {'overall_llm_readiness_score': {'type': 'integer', 'description': '0-100'}, 'verdict': {'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, 'main_issue': {'type': 'string'}, 'top_3_fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes'], 'additionalProperties': False}, rule='required')
+                data__executivesummary_keys = set(data__executivesummary.keys())
+                if "overall_llm_readiness_score" in data__executivesummary_keys:
+                    data__executivesummary_keys.remove("overall_llm_readiness_score")
+                    data__executivesummary__overallllmreadinessscore = data__executivesummary["overall_llm_readiness_score"]
+                    if not isinstance(data__executivesummary__overallllmreadinessscore, (int)) and not (isinstance(data__executivesummary__overallllmreadinessscore, float) and data__executivesummary__overallllmreadinessscore.is_integer()) or isinstance(data__executivesummary__overallllmreadinessscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary.overall_llm_readiness_score must be integer", value=data__executivesummary__overallllmreadinessscore, name="" + (name_prefix or "data") + ".executive_summary.overall_llm_readiness_score", definition={'type': 'integer', 'description': '0-100'}, rule='type')
+                if "verdict" in data__executivesummary_keys:
+                    data__executivesummary_keys.remove("verdict")
+                    data__executivesummary__verdict = data__executivesummary["verdict"]
+                    if not isinstance(data__executivesummary__verdict, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary.verdict must be string", value=data__executivesummary__verdict, name="" + (name_prefix or "data") + ".executive_summary.verdict", definition={'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, rule='type')
+                    if not (isinstance(data__executivesummary__verdict, str) and data__executivesummary__verdict == 'Ready' or isinstance(data__executivesummary__verdict, str) and data__executivesummary__verdict == 'Partially Ready' or isinstance(data__executivesummary__verdict, str) and data__executivesummary__verdict == 'Needs Work' or isinstance(data__executivesummary__verdict, str) and data__executivesummary__verdict == 'Poor'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary.verdict must be one of ['Ready', 'Partially Ready', 'Needs Work', 'Poor']", value=data__executivesummary__verdict, name="" + (name_prefix or "data") + ".executive_summary.verdict", definition={'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, rule='enum')
+                if "main_issue" in data__executivesummary_keys:
+                    data__executivesummary_keys.remove("main_issue")
+                    data__executivesummary__mainissue = data__executivesummary["main_issue"]
+                    if not isinstance(data__executivesummary__mainissue, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary.main_issue must be string", value=data__executivesummary__mainissue, name="" + (name_prefix or "data") + ".executive_summary.main_issue", definition={'type': 'string'}, rule='type')
+                if "top_3_fixes" in data__executivesummary_keys:
+                    data__executivesummary_keys.remove("top_3_fixes")
+                    data__executivesummary__top3fixes = data__executivesummary["top_3_fixes"]
+                    if not isinstance(data__executivesummary__top3fixes, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary.top_3_fixes must be array", value=data__executivesummary__top3fixes, name="" + (name_prefix or "data") + ".executive_summary.top_3_fixes", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__executivesummary__top3fixes_is_list = isinstance(data__executivesummary__top3fixes, (list, tuple))
+                    if data__executivesummary__top3fixes_is_list:
+                        data__executivesummary__top3fixes_len = len(data__executivesummary__top3fixes)
+                        for data__executivesummary__top3fixes_x, data__executivesummary__top3fixes_item in enumerate(data__executivesummary__top3fixes):
+                            if not isinstance(data__executivesummary__top3fixes_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary.top_3_fixes[{data__executivesummary__top3fixes_x}]".format(**locals()) + " must be string", value=data__executivesummary__top3fixes_item, name="" + (name_prefix or "data") + ".executive_summary.top_3_fixes[{data__executivesummary__top3fixes_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__executivesummary_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".executive_summary must not contain "+str(data__executivesummary_keys)+" properties", value=data__executivesummary, name="" + (name_prefix or "data") + ".executive_summary", definition={'type': 'object', 'properties': {'overall_llm_readiness_score': {'type': 'integer', 'description': '0-100'}, 'verdict': {'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, 'main_issue': {'type': 'string'}, 'top_3_fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes'], 'additionalProperties': False}, rule='additionalProperties')
+        if "llm_interpretation" in data_keys:
+            data_keys.remove("llm_interpretation")
+            data__llminterpretation = data["llm_interpretation"]
+            if not isinstance(data__llminterpretation, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation must be object", value=data__llminterpretation, name="" + (name_prefix or "data") + ".llm_interpretation", definition={'type': 'object', 'properties': {'primary_topic': {'type': 'string'}, 'secondary_topics': {'type': 'array', 'items': {'type': 'string'}}, 'detected_intent': {'type': 'string'}, 'summary_llm_generated': {'type': 'string'}, 'key_claims_llm_detected': {'type': 'array', 'items': {'type': 'string'}}, 'confidence_level': {'type': 'string'}}, 'required': ['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level'], 'additionalProperties': False}, rule='type')
+            data__llminterpretation_is_dict = isinstance(data__llminterpretation, dict)
+            if data__llminterpretation_is_dict:
+                data__llminterpretation__missing_keys = set(['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level']) - data__llminterpretation.keys()
+                if data__llminterpretation__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation must contain " + (str(sorted(data__llminterpretation__missing_keys)) + " properties"), value=data__llminterpretation, name="" + (name_prefix or "data") + ".llm_interpretation", definition={'type': 'object', 'properties': {'primary_topic': {'type': 'string'}, 'secondary_topics': {'type': 'array', 'items': {'type': 'string'}}, 'detected_intent': {'type': 'string'}, 'summary_llm_generated': {'type': 'string'}, 'key_claims_llm_detected': {'type': 'array', 'items': {'type': 'string'}}, 'confidence_level': {'type': 'string'}}, 'required': ['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level'], 'additionalProperties': False}, rule='required')
+                data__llminterpretation_keys = set(data__llminterpretation.keys())
+                if "primary_topic" in data__llminterpretation_keys:
+                    data__llminterpretation_keys.remove("primary_topic")
+                    data__llminterpretation__primarytopic = data__llminterpretation["primary_topic"]
+                    if not isinstance(data__llminterpretation__primarytopic, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.primary_topic must be string", value=data__llminterpretation__primarytopic, name="" + (name_prefix or "data") + ".llm_interpretation.primary_topic", definition={'type': 'string'}, rule='type')
+                if "secondary_topics" in data__llminterpretation_keys:
+                    data__llminterpretation_keys.remove("secondary_topics")
+                    data__llminterpretation__secondarytopics = data__llminterpretation["secondary_topics"]
+                    if not isinstance(data__llminterpretation__secondarytopics, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.secondary_topics must be array", value=data__llminterpretation__secondarytopics, name="" + (name_prefix or "data") + ".llm_interpretation.secondary_topics", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__llminterpretation__secondarytopics_is_list = isinstance(data__llminterpretation__secondarytopics, (list, tuple))
+                    if data__llminterpretation__secondarytopics_is_list:
+                        data__llminterpretation__secondarytopics_len = len(data__llminterpretation__secondarytopics)
+                        for data__llminterpretation__secondarytopics_x, data__llminterpretation__secondarytopics_item in enumerate(data__llminterpretation__secondarytopics):
+                            if not isinstance(data__llminterpretation__secondarytopics_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.secondary_topics[{data__llminterpretation__secondarytopics_x}]".format(**locals()) + " must be string", value=data__llminterpretation__secondarytopics_item, name="" + (name_prefix or "data") + ".llm_interpretation.secondary_topics[{data__llminterpretation__secondarytopics_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "detected_intent" in data__llminterpretation_keys:
+                    data__llminterpretation_keys.remove("detected_intent")
+                    data__llminterpretation__detectedintent = data__llminterpretation["detected_intent"]
+                    if not isinstance(data__llminterpretation__detectedintent, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.detected_intent must be string", value=data__llminterpretation__detectedintent, name="" + (name_prefix or "data") + ".llm_interpretation.detected_intent", definition={'type': 'string'}, rule='type')
+                if "summary_llm_generated" in data__llminterpretation_keys:
+                    data__llminterpretation_keys.remove("summary_llm_generated")
+                    data__llminterpretation__summaryllmgenerated = data__llminterpretation["summary_llm_generated"]
+                    if not isinstance(data__llminterpretation__summaryllmgenerated, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.summary_llm_generated must be string", value=data__llminterpretation__summaryllmgenerated, name="" + (name_prefix or "data") + ".llm_interpretation.summary_llm_generated", definition={'type': 'string'}, rule='type')
+                if "key_claims_llm_detected" in data__llminterpretation_keys:
+                    data__llminterpretation_keys.remove("key_claims_llm_detected")
+                    data__llminterpretation__keyclaimsllmdetected = data__llminterpretation["key_claims_llm_detected"]
+                    if not isinstance(data__llminterpretation__keyclaimsllmdetected, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.key_claims_llm_detected must be array", value=data__llminterpretation__keyclaimsllmdetected, name="" + (name_prefix or "data") + ".llm_interpretation.key_claims_llm_detected", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__llminterpretation__keyclaimsllmdetected_is_list = isinstance(data__llminterpretation__keyclaimsllmdetected, (list, tuple))
+                    if data__llminterpretation__keyclaimsllmdetected_is_list:
+                        data__llminterpretation__keyclaimsllmdetected_len = len(data__llminterpretation__keyclaimsllmdetected)
+                        for data__llminterpretation__keyclaimsllmdetected_x, data__llminterpretation__keyclaimsllmdetected_item in enumerate(data__llminterpretation__keyclaimsllmdetected):
+                            if not isinstance(data__llminterpretation__keyclaimsllmdetected_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.key_claims_llm_detected[{data__llminterpretation__keyclaimsllmdetected_x}]".format(**locals()) + " must be string", value=data__llminterpretation__keyclaimsllmdetected_item, name="" + (name_prefix or "data") + ".llm_interpretation.key_claims_llm_detected[{data__llminterpretation__keyclaimsllmdetected_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "confidence_level" in data__llminterpretation_keys:
+                    data__llminterpretation_keys.remove("confidence_level")
+                    data__llminterpretation__confidencelevel = data__llminterpretation["confidence_level"]
+                    if not isinstance(data__llminterpretation__confidencelevel, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation.confidence_level must be string", value=data__llminterpretation__confidencelevel, name="" + (name_prefix or "data") + ".llm_interpretation.confidence_level", definition={'type': 'string'}, rule='type')
+                if data__llminterpretation_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".llm_interpretation must not contain "+str(data__llminterpretation_keys)+" properties", value=data__llminterpretation, name="" + (name_prefix or "data") + ".llm_interpretation", definition={'type': 'object', 'properties': {'primary_topic': {'type': 'string'}, 'secondary_topics': {'type': 'array', 'items': {'type': 'string'}}, 'detected_intent': {'type': 'string'}, 'summary_llm_generated': {'type': 'string'}, 'key_claims_llm_detected': {'type': 'array', 'items': {'type': 'string'}}, 'confidence_level': {'type': 'string'}}, 'required': ['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level'], 'additionalProperties': False}, rule='additionalProperties')
+        if "summary_block" in data_keys:
+            data_keys.remove("summary_block")
+            data__summaryblock = data["summary_block"]
+            if not isinstance(data__summaryblock, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block must be object", value=data__summaryblock, name="" + (name_prefix or "data") + ".summary_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_summary_block': {'type': 'string'}}, 'required': ['score', 'found', 'quality', 'problems', 'recommended_summary_block'], 'additionalProperties': False}, rule='type')
+            data__summaryblock_is_dict = isinstance(data__summaryblock, dict)
+            if data__summaryblock_is_dict:
+                data__summaryblock__missing_keys = set(['score', 'found', 'quality', 'problems', 'recommended_summary_block']) - data__summaryblock.keys()
+                if data__summaryblock__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block must contain " + (str(sorted(data__summaryblock__missing_keys)) + " properties"), value=data__summaryblock, name="" + (name_prefix or "data") + ".summary_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_summary_block': {'type': 'string'}}, 'required': ['score', 'found', 'quality', 'problems', 'recommended_summary_block'], 'additionalProperties': False}, rule='required')
+                data__summaryblock_keys = set(data__summaryblock.keys())
+                if "score" in data__summaryblock_keys:
+                    data__summaryblock_keys.remove("score")
+                    data__summaryblock__score = data__summaryblock["score"]
+                    if not isinstance(data__summaryblock__score, (int)) and not (isinstance(data__summaryblock__score, float) and data__summaryblock__score.is_integer()) or isinstance(data__summaryblock__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block.score must be integer", value=data__summaryblock__score, name="" + (name_prefix or "data") + ".summary_block.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "found" in data__summaryblock_keys:
+                    data__summaryblock_keys.remove("found")
+                    data__summaryblock__found = data__summaryblock["found"]
+                    if not isinstance(data__summaryblock__found, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block.found must be boolean", value=data__summaryblock__found, name="" + (name_prefix or "data") + ".summary_block.found", definition={'type': 'boolean'}, rule='type')
+                if "quality" in data__summaryblock_keys:
+                    data__summaryblock_keys.remove("quality")
+                    data__summaryblock__quality = data__summaryblock["quality"]
+                    if not isinstance(data__summaryblock__quality, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block.quality must be string", value=data__summaryblock__quality, name="" + (name_prefix or "data") + ".summary_block.quality", definition={'type': 'string'}, rule='type')
+                if "problems" in data__summaryblock_keys:
+                    data__summaryblock_keys.remove("problems")
+                    data__summaryblock__problems = data__summaryblock["problems"]
+                    if not isinstance(data__summaryblock__problems, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block.problems must be array", value=data__summaryblock__problems, name="" + (name_prefix or "data") + ".summary_block.problems", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__summaryblock__problems_is_list = isinstance(data__summaryblock__problems, (list, tuple))
+                    if data__summaryblock__problems_is_list:
+                        data__summaryblock__problems_len = len(data__summaryblock__problems)
+                        for data__summaryblock__problems_x, data__summaryblock__problems_item in enumerate(data__summaryblock__problems):
+                            if not isinstance(data__summaryblock__problems_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block.problems[{data__summaryblock__problems_x}]".format(**locals()) + " must be string", value=data__summaryblock__problems_item, name="" + (name_prefix or "data") + ".summary_block.problems[{data__summaryblock__problems_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "recommended_summary_block" in data__summaryblock_keys:
+                    data__summaryblock_keys.remove("recommended_summary_block")
+                    data__summaryblock__recommendedsummaryblock = data__summaryblock["recommended_summary_block"]
+                    if not isinstance(data__summaryblock__recommendedsummaryblock, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block.recommended_summary_block must be string", value=data__summaryblock__recommendedsummaryblock, name="" + (name_prefix or "data") + ".summary_block.recommended_summary_block", definition={'type': 'string'}, rule='type')
+                if data__summaryblock_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".summary_block must not contain "+str(data__summaryblock_keys)+" properties", value=data__summaryblock, name="" + (name_prefix or "data") + ".summary_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_summary_block': {'type': 'string'}}, 'required': ['score', 'found', 'quality', 'problems', 'recommended_summary_block'], 'additionalProperties': False}, rule='additionalProperties')
+        if "definitions_block" in data_keys:
+            data_keys.remove("definitions_block")
+            data__definitionsblock = data["definitions_block"]
+            if not isinstance(data__definitionsblock, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block must be object", value=data__definitionsblock, name="" + (name_prefix or "data") + ".definitions_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_critical_terms': {'type': 'array', 'items': {'type': 'string'}}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_definitions': {'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions'], 'additionalProperties': False}, rule='type')
+            data__definitionsblock_is_dict = isinstance(data__definitionsblock, dict)
+            if data__definitionsblock_is_dict:
+                data__definitionsblock__missing_keys = set(['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions']) - data__definitionsblock.keys()
+                if data__definitionsblock__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block must contain " + (str(sorted(data__definitionsblock__missing_keys)) + " properties"), value=data__definitionsblock, name="" + (name_prefix or "data") + ".definitions_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_critical_terms': {'type': 'array', 'items': {'type': 'string'}}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_definitions': {'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions'], 'additionalProperties': False}, rule='required')
+                data__definitionsblock_keys = set(data__definitionsblock.keys())
+                if "score" in data__definitionsblock_keys:
+                    data__definitionsblock_keys.remove("score")
+                    data__definitionsblock__score = data__definitionsblock["score"]
+                    if not isinstance(data__definitionsblock__score, (int)) and not (isinstance(data__definitionsblock__score, float) and data__definitionsblock__score.is_integer()) or isinstance(data__definitionsblock__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.score must be integer", value=data__definitionsblock__score, name="" + (name_prefix or "data") + ".definitions_block.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "found" in data__definitionsblock_keys:
+                    data__definitionsblock_keys.remove("found")
+                    data__definitionsblock__found = data__definitionsblock["found"]
+                    if not isinstance(data__definitionsblock__found, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.found must be boolean", value=data__definitionsblock__found, name="" + (name_prefix or "data") + ".definitions_block.found", definition={'type': 'boolean'}, rule='type')
+                if "missing_critical_terms" in data__definitionsblock_keys:
+                    data__definitionsblock_keys.remove("missing_critical_terms")
+                    data__definitionsblock__missingcriticalterms = data__definitionsblock["missing_critical_terms"]
+                    if not isinstance(data__definitionsblock__missingcriticalterms, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.missing_critical_terms must be array", value=data__definitionsblock__missingcriticalterms, name="" + (name_prefix or "data") + ".definitions_block.missing_critical_terms", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__definitionsblock__missingcriticalterms_is_list = isinstance(data__definitionsblock__missingcriticalterms, (list, tuple))
+                    if data__definitionsblock__missingcriticalterms_is_list:
+                        data__definitionsblock__missingcriticalterms_len = len(data__definitionsblock__missingcriticalterms)
+                        for data__definitionsblock__missingcriticalterms_x, data__definitionsblock__missingcriticalterms_item in enumerate(data__definitionsblock__missingcriticalterms):
+                            if not isinstance(data__definitionsblock__missingcriticalterms_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.missing_critical_terms[{data__definitionsblock__missingcriticalterms_x}]".format(**locals()) + " must be string", value=data__definitionsblock__missingcriticalterms_item, name="" + (name_prefix or "data") + ".definitions_block.missing_critical_terms[{data__definitionsblock__missingcriticalterms_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "quality_problems" in data__definitionsblock_keys:
+                    data__definitionsblock_keys.remove("quality_problems")
+                    data__definitionsblock__qualityproblems = data__definitionsblock["quality_problems"]
+                    if not isinstance(data__definitionsblock__qualityproblems, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.quality_problems must be array", value=data__definitionsblock__qualityproblems, name="" + (name_prefix or "data") + ".definitions_block.quality_problems", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__definitionsblock__qualityproblems_is_list = isinstance(data__definitionsblock__qualityproblems, (list, tuple))
+                    if data__definitionsblock__qualityproblems_is_list:
+                        data__definitionsblock__qualityproblems_len = len(data__definitionsblock__qualityproblems)
+                        for data__definitionsblock__qualityproblems_x, data__definitionsblock__qualityproblems_item in enumerate(data__definitionsblock__qualityproblems):
+                            if not isinstance(data__definitionsblock__qualityproblems_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.quality_problems[{data__definitionsblock__qualityproblems_x}]".format(**locals()) + " must be string", value=data__definitionsblock__qualityproblems_item, name="" + (name_prefix or "data") + ".definitions_block.quality_problems[{data__definitionsblock__qualityproblems_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "recommended_definitions" in data__definitionsblock_keys:
+                    data__definitionsblock_keys.remove("recommended_definitions")
+                    data__definitionsblock__recommendeddefinitions = data__definitionsblock["recommended_definitions"]
+                    if not isinstance(data__definitionsblock__recommendeddefinitions, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.recommended_definitions must be array", value=data__definitionsblock__recommendeddefinitions, name="" + (name_prefix or "data") + ".definitions_block.recommended_definitions", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}, rule='type')
+                    data__definitionsblock__recommendeddefinitions_is_list = isinstance(data__definitionsblock__recommendeddefinitions, (list, tuple))
+                    if data__definitionsblock__recommendeddefinitions_is_list:
+                        data__definitionsblock__recommendeddefinitions_len = len(data__definitionsblock__recommendeddefinitions)
+                        for data__definitionsblock__recommendeddefinitions_x, data__definitionsblock__recommendeddefinitions_item in enumerate(data__definitionsblock__recommendeddefinitions):
+                            if not isinstance(data__definitionsblock__recommendeddefinitions_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}]".format(**locals()) + " must be object", value=data__definitionsblock__recommendeddefinitions_item, name="" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}, rule='type')
+                            data__definitionsblock__recommendeddefinitions_item_is_dict = isinstance(data__definitionsblock__recommendeddefinitions_item, dict)
+                            if data__definitionsblock__recommendeddefinitions_item_is_dict:
+                                data__definitionsblock__recommendeddefinitions_item__missing_keys = set(['term', 'definition']) - data__definitionsblock__recommendeddefinitions_item.keys()
+                                if data__definitionsblock__recommendeddefinitions_item__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}]".format(**locals()) + " must contain " + (str(sorted(data__definitionsblock__recommendeddefinitions_item__missing_keys)) + " properties"), value=data__definitionsblock__recommendeddefinitions_item, name="" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}, rule='required')
+                                data__definitionsblock__recommendeddefinitions_item_keys = set(data__definitionsblock__recommendeddefinitions_item.keys())
+                                if "term" in data__definitionsblock__recommendeddefinitions_item_keys:
+                                    data__definitionsblock__recommendeddefinitions_item_keys.remove("term")
+                                    data__definitionsblock__recommendeddefinitions_item__term = data__definitionsblock__recommendeddefinitions_item["term"]
+                                    if not isinstance(data__definitionsblock__recommendeddefinitions_item__term, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}].term".format(**locals()) + " must be string", value=data__definitionsblock__recommendeddefinitions_item__term, name="" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}].term".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "definition" in data__definitionsblock__recommendeddefinitions_item_keys:
+                                    data__definitionsblock__recommendeddefinitions_item_keys.remove("definition")
+                                    data__definitionsblock__recommendeddefinitions_item__definition = data__definitionsblock__recommendeddefinitions_item["definition"]
+                                    if not isinstance(data__definitionsblock__recommendeddefinitions_item__definition, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}].definition".format(**locals()) + " must be string", value=data__definitionsblock__recommendeddefinitions_item__definition, name="" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}].definition".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if data__definitionsblock__recommendeddefinitions_item_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}]".format(**locals()) + " must not contain "+str(data__definitionsblock__recommendeddefinitions_item_keys)+" properties", value=data__definitionsblock__recommendeddefinitions_item, name="" + (name_prefix or "data") + ".definitions_block.recommended_definitions[{data__definitionsblock__recommendeddefinitions_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}, rule='additionalProperties')
+                if data__definitionsblock_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".definitions_block must not contain "+str(data__definitionsblock_keys)+" properties", value=data__definitionsblock, name="" + (name_prefix or "data") + ".definitions_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_critical_terms': {'type': 'array', 'items': {'type': 'string'}}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_definitions': {'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions'], 'additionalProperties': False}, rule='additionalProperties')
+        if "fanout_query_analysis" in data_keys:
+            data_keys.remove("fanout_query_analysis")
+            data__fanoutqueryanalysis = data["fanout_query_analysis"]
+            if not isinstance(data__fanoutqueryanalysis, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis must be object", value=data__fanoutqueryanalysis, name="" + (name_prefix or "data") + ".fanout_query_analysis", definition={'type': 'object', 'properties': {'sub_questions_generated': {'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, 'coverage_score': {'type': 'integer', 'description': '0-10'}, 'main_gaps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sub_questions_generated', 'coverage_score', 'main_gaps'], 'additionalProperties': False}, rule='type')
+            data__fanoutqueryanalysis_is_dict = isinstance(data__fanoutqueryanalysis, dict)
+            if data__fanoutqueryanalysis_is_dict:
+                data__fanoutqueryanalysis__missing_keys = set(['sub_questions_generated', 'coverage_score', 'main_gaps']) - data__fanoutqueryanalysis.keys()
+                if data__fanoutqueryanalysis__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis must contain " + (str(sorted(data__fanoutqueryanalysis__missing_keys)) + " properties"), value=data__fanoutqueryanalysis, name="" + (name_prefix or "data") + ".fanout_query_analysis", definition={'type': 'object', 'properties': {'sub_questions_generated': {'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, 'coverage_score': {'type': 'integer', 'description': '0-10'}, 'main_gaps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sub_questions_generated', 'coverage_score', 'main_gaps'], 'additionalProperties': False}, rule='required')
+                data__fanoutqueryanalysis_keys = set(data__fanoutqueryanalysis.keys())
+                if "sub_questions_generated" in data__fanoutqueryanalysis_keys:
+                    data__fanoutqueryanalysis_keys.remove("sub_questions_generated")
+                    data__fanoutqueryanalysis__subquestionsgenerated = data__fanoutqueryanalysis["sub_questions_generated"]
+                    if not isinstance(data__fanoutqueryanalysis__subquestionsgenerated, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated must be array", value=data__fanoutqueryanalysis__subquestionsgenerated, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, rule='type')
+                    data__fanoutqueryanalysis__subquestionsgenerated_is_list = isinstance(data__fanoutqueryanalysis__subquestionsgenerated, (list, tuple))
+                    if data__fanoutqueryanalysis__subquestionsgenerated_is_list:
+                        data__fanoutqueryanalysis__subquestionsgenerated_len = len(data__fanoutqueryanalysis__subquestionsgenerated)
+                        for data__fanoutqueryanalysis__subquestionsgenerated_x, data__fanoutqueryanalysis__subquestionsgenerated_item in enumerate(data__fanoutqueryanalysis__subquestionsgenerated):
+                            if not isinstance(data__fanoutqueryanalysis__subquestionsgenerated_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}]".format(**locals()) + " must be object", value=data__fanoutqueryanalysis__subquestionsgenerated_item, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}, rule='type')
+                            data__fanoutqueryanalysis__subquestionsgenerated_item_is_dict = isinstance(data__fanoutqueryanalysis__subquestionsgenerated_item, dict)
+                            if data__fanoutqueryanalysis__subquestionsgenerated_item_is_dict:
+                                data__fanoutqueryanalysis__subquestionsgenerated_item__missing_keys = set(['question', 'matched_content', 'match_quality', 'missing_answer_note']) - data__fanoutqueryanalysis__subquestionsgenerated_item.keys()
+                                if data__fanoutqueryanalysis__subquestionsgenerated_item__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}]".format(**locals()) + " must contain " + (str(sorted(data__fanoutqueryanalysis__subquestionsgenerated_item__missing_keys)) + " properties"), value=data__fanoutqueryanalysis__subquestionsgenerated_item, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}, rule='required')
+                                data__fanoutqueryanalysis__subquestionsgenerated_item_keys = set(data__fanoutqueryanalysis__subquestionsgenerated_item.keys())
+                                if "question" in data__fanoutqueryanalysis__subquestionsgenerated_item_keys:
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item_keys.remove("question")
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item__question = data__fanoutqueryanalysis__subquestionsgenerated_item["question"]
+                                    if not isinstance(data__fanoutqueryanalysis__subquestionsgenerated_item__question, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].question".format(**locals()) + " must be string", value=data__fanoutqueryanalysis__subquestionsgenerated_item__question, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].question".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "matched_content" in data__fanoutqueryanalysis__subquestionsgenerated_item_keys:
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item_keys.remove("matched_content")
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item__matchedcontent = data__fanoutqueryanalysis__subquestionsgenerated_item["matched_content"]
+                                    if not isinstance(data__fanoutqueryanalysis__subquestionsgenerated_item__matchedcontent, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].matched_content".format(**locals()) + " must be string", value=data__fanoutqueryanalysis__subquestionsgenerated_item__matchedcontent, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].matched_content".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "match_quality" in data__fanoutqueryanalysis__subquestionsgenerated_item_keys:
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item_keys.remove("match_quality")
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item__matchquality = data__fanoutqueryanalysis__subquestionsgenerated_item["match_quality"]
+                                    if not isinstance(data__fanoutqueryanalysis__subquestionsgenerated_item__matchquality, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].match_quality".format(**locals()) + " must be string", value=data__fanoutqueryanalysis__subquestionsgenerated_item__matchquality, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].match_quality".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "missing_answer_note" in data__fanoutqueryanalysis__subquestionsgenerated_item_keys:
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item_keys.remove("missing_answer_note")
+                                    data__fanoutqueryanalysis__subquestionsgenerated_item__missinganswernote = data__fanoutqueryanalysis__subquestionsgenerated_item["missing_answer_note"]
+                                    if not isinstance(data__fanoutqueryanalysis__subquestionsgenerated_item__missinganswernote, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].missing_answer_note".format(**locals()) + " must be string", value=data__fanoutqueryanalysis__subquestionsgenerated_item__missinganswernote, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}].missing_answer_note".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if data__fanoutqueryanalysis__subquestionsgenerated_item_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}]".format(**locals()) + " must not contain "+str(data__fanoutqueryanalysis__subquestionsgenerated_item_keys)+" properties", value=data__fanoutqueryanalysis__subquestionsgenerated_item, name="" + (name_prefix or "data") + ".fanout_query_analysis.sub_questions_generated[{data__fanoutqueryanalysis__subquestionsgenerated_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}, rule='additionalProperties')
+                if "coverage_score" in data__fanoutqueryanalysis_keys:
+                    data__fanoutqueryanalysis_keys.remove("coverage_score")
+                    data__fanoutqueryanalysis__coveragescore = data__fanoutqueryanalysis["coverage_score"]
+                    if not isinstance(data__fanoutqueryanalysis__coveragescore, (int)) and not (isinstance(data__fanoutqueryanalysis__coveragescore, float) and data__fanoutqueryanalysis__coveragescore.is_integer()) or isinstance(data__fanoutqueryanalysis__coveragescore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.coverage_score must be integer", value=data__fanoutqueryanalysis__coveragescore, name="" + (name_prefix or "data") + ".fanout_query_analysis.coverage_score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "main_gaps" in data__fanoutqueryanalysis_keys:
+                    data__fanoutqueryanalysis_keys.remove("main_gaps")
+                    data__fanoutqueryanalysis__maingaps = data__fanoutqueryanalysis["main_gaps"]
+                    if not isinstance(data__fanoutqueryanalysis__maingaps, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.main_gaps must be array", value=data__fanoutqueryanalysis__maingaps, name="" + (name_prefix or "data") + ".fanout_query_analysis.main_gaps", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__fanoutqueryanalysis__maingaps_is_list = isinstance(data__fanoutqueryanalysis__maingaps, (list, tuple))
+                    if data__fanoutqueryanalysis__maingaps_is_list:
+                        data__fanoutqueryanalysis__maingaps_len = len(data__fanoutqueryanalysis__maingaps)
+                        for data__fanoutqueryanalysis__maingaps_x, data__fanoutqueryanalysis__maingaps_item in enumerate(data__fanoutqueryanalysis__maingaps):
+                            if not isinstance(data__fanoutqueryanalysis__maingaps_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis.main_gaps[{data__fanoutqueryanalysis__maingaps_x}]".format(**locals()) + " must be string", value=data__fanoutqueryanalysis__maingaps_item, name="" + (name_prefix or "data") + ".fanout_query_analysis.main_gaps[{data__fanoutqueryanalysis__maingaps_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__fanoutqueryanalysis_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fanout_query_analysis must not contain "+str(data__fanoutqueryanalysis_keys)+" properties", value=data__fanoutqueryanalysis, name="" + (name_prefix or "data") + ".fanout_query_analysis", definition={'type': 'object', 'properties': {'sub_questions_generated': {'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, 'coverage_score': {'type': 'integer', 'description': '0-10'}, 'main_gaps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sub_questions_generated', 'coverage_score', 'main_gaps'], 'additionalProperties': False}, rule='additionalProperties')
+        if "faq_block" in data_keys:
+            data_keys.remove("faq_block")
+            data__faqblock = data["faq_block"]
+            if not isinstance(data__faqblock, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block must be object", value=data__faqblock, name="" + (name_prefix or "data") + ".faq_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_faqs': {'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'quality_problems', 'recommended_faqs'], 'additionalProperties': False}, rule='type')
+            data__faqblock_is_dict = isinstance(data__faqblock, dict)
+            if data__faqblock_is_dict:
+                data__faqblock__missing_keys = set(['score', 'found', 'quality_problems', 'recommended_faqs']) - data__faqblock.keys()
+                if data__faqblock__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block must contain " + (str(sorted(data__faqblock__missing_keys)) + " properties"), value=data__faqblock, name="" + (name_prefix or "data") + ".faq_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_faqs': {'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'quality_problems', 'recommended_faqs'], 'additionalProperties': False}, rule='required')
+                data__faqblock_keys = set(data__faqblock.keys())
+                if "score" in data__faqblock_keys:
+                    data__faqblock_keys.remove("score")
+                    data__faqblock__score = data__faqblock["score"]
+                    if not isinstance(data__faqblock__score, (int)) and not (isinstance(data__faqblock__score, float) and data__faqblock__score.is_integer()) or isinstance(data__faqblock__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.score must be integer", value=data__faqblock__score, name="" + (name_prefix or "data") + ".faq_block.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "found" in data__faqblock_keys:
+                    data__faqblock_keys.remove("found")
+                    data__faqblock__found = data__faqblock["found"]
+                    if not isinstance(data__faqblock__found, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.found must be boolean", value=data__faqblock__found, name="" + (name_prefix or "data") + ".faq_block.found", definition={'type': 'boolean'}, rule='type')
+                if "quality_problems" in data__faqblock_keys:
+                    data__faqblock_keys.remove("quality_problems")
+                    data__faqblock__qualityproblems = data__faqblock["quality_problems"]
+                    if not isinstance(data__faqblock__qualityproblems, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.quality_problems must be array", value=data__faqblock__qualityproblems, name="" + (name_prefix or "data") + ".faq_block.quality_problems", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__faqblock__qualityproblems_is_list = isinstance(data__faqblock__qualityproblems, (list, tuple))
+                    if data__faqblock__qualityproblems_is_list:
+                        data__faqblock__qualityproblems_len = len(data__faqblock__qualityproblems)
+                        for data__faqblock__qualityproblems_x, data__faqblock__qualityproblems_item in enumerate(data__faqblock__qualityproblems):
+                            if not isinstance(data__faqblock__qualityproblems_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.quality_problems[{data__faqblock__qualityproblems_x}]".format(**locals()) + " must be string", value=data__faqblock__qualityproblems_item, name="" + (name_prefix or "data") + ".faq_block.quality_problems[{data__faqblock__qualityproblems_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "recommended_faqs" in data__faqblock_keys:
+                    data__faqblock_keys.remove("recommended_faqs")
+                    data__faqblock__recommendedfaqs = data__faqblock["recommended_faqs"]
+                    if not isinstance(data__faqblock__recommendedfaqs, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.recommended_faqs must be array", value=data__faqblock__recommendedfaqs, name="" + (name_prefix or "data") + ".faq_block.recommended_faqs", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}, rule='type')
+                    data__faqblock__recommendedfaqs_is_list = isinstance(data__faqblock__recommendedfaqs, (list, tuple))
+                    if data__faqblock__recommendedfaqs_is_list:
+                        data__faqblock__recommendedfaqs_len = len(data__faqblock__recommendedfaqs)
+                        for data__faqblock__recommendedfaqs_x, data__faqblock__recommendedfaqs_item in enumerate(data__faqblock__recommendedfaqs):
+                            if not isinstance(data__faqblock__recommendedfaqs_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}]".format(**locals()) + " must be object", value=data__faqblock__recommendedfaqs_item, name="" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}, rule='type')
+                            data__faqblock__recommendedfaqs_item_is_dict = isinstance(data__faqblock__recommendedfaqs_item, dict)
+                            if data__faqblock__recommendedfaqs_item_is_dict:
+                                data__faqblock__recommendedfaqs_item__missing_keys = set(['q', 'a']) - data__faqblock__recommendedfaqs_item.keys()
+                                if data__faqblock__recommendedfaqs_item__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}]".format(**locals()) + " must contain " + (str(sorted(data__faqblock__recommendedfaqs_item__missing_keys)) + " properties"), value=data__faqblock__recommendedfaqs_item, name="" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}, rule='required')
+                                data__faqblock__recommendedfaqs_item_keys = set(data__faqblock__recommendedfaqs_item.keys())
+                                if "q" in data__faqblock__recommendedfaqs_item_keys:
+                                    data__faqblock__recommendedfaqs_item_keys.remove("q")
+                                    data__faqblock__recommendedfaqs_item__q = data__faqblock__recommendedfaqs_item["q"]
+                                    if not isinstance(data__faqblock__recommendedfaqs_item__q, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}].q".format(**locals()) + " must be string", value=data__faqblock__recommendedfaqs_item__q, name="" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}].q".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "a" in data__faqblock__recommendedfaqs_item_keys:
+                                    data__faqblock__recommendedfaqs_item_keys.remove("a")
+                                    data__faqblock__recommendedfaqs_item__a = data__faqblock__recommendedfaqs_item["a"]
+                                    if not isinstance(data__faqblock__recommendedfaqs_item__a, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}].a".format(**locals()) + " must be string", value=data__faqblock__recommendedfaqs_item__a, name="" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}].a".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if data__faqblock__recommendedfaqs_item_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}]".format(**locals()) + " must not contain "+str(data__faqblock__recommendedfaqs_item_keys)+" properties", value=data__faqblock__recommendedfaqs_item, name="" + (name_prefix or "data") + ".faq_block.recommended_faqs[{data__faqblock__recommendedfaqs_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}, rule='additionalProperties')
+                if data__faqblock_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".faq_block must not contain "+str(data__faqblock_keys)+" properties", value=data__faqblock, name="" + (name_prefix or "data") + ".faq_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_faqs': {'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'quality_problems', 'recommended_faqs'], 'additionalProperties': False}, rule='additionalProperties')
+        if "canonical_resources_block" in data_keys:
+            data_keys.remove("canonical_resources_block")
+            data__canonicalresourcesblock = data["canonical_resources_block"]
+            if not isinstance(data__canonicalresourcesblock, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block must be object", value=data__canonicalresourcesblock, name="" + (name_prefix or "data") + ".canonical_resources_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_resources': {'type': 'array', 'items': {'type': 'string'}}, 'why_it_matters': {'type': 'string'}, 'recommended_resources': {'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources'], 'additionalProperties': False}, rule='type')
+            data__canonicalresourcesblock_is_dict = isinstance(data__canonicalresourcesblock, dict)
+            if data__canonicalresourcesblock_is_dict:
+                data__canonicalresourcesblock__missing_keys = set(['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources']) - data__canonicalresourcesblock.keys()
+                if data__canonicalresourcesblock__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block must contain " + (str(sorted(data__canonicalresourcesblock__missing_keys)) + " properties"), value=data__canonicalresourcesblock, name="" + (name_prefix or "data") + ".canonical_resources_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_resources': {'type': 'array', 'items': {'type': 'string'}}, 'why_it_matters': {'type': 'string'}, 'recommended_resources': {'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources'], 'additionalProperties': False}, rule='required')
+                data__canonicalresourcesblock_keys = set(data__canonicalresourcesblock.keys())
+                if "score" in data__canonicalresourcesblock_keys:
+                    data__canonicalresourcesblock_keys.remove("score")
+                    data__canonicalresourcesblock__score = data__canonicalresourcesblock["score"]
+                    if not isinstance(data__canonicalresourcesblock__score, (int)) and not (isinstance(data__canonicalresourcesblock__score, float) and data__canonicalresourcesblock__score.is_integer()) or isinstance(data__canonicalresourcesblock__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.score must be integer", value=data__canonicalresourcesblock__score, name="" + (name_prefix or "data") + ".canonical_resources_block.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "found" in data__canonicalresourcesblock_keys:
+                    data__canonicalresourcesblock_keys.remove("found")
+                    data__canonicalresourcesblock__found = data__canonicalresourcesblock["found"]
+                    if not isinstance(data__canonicalresourcesblock__found, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.found must be boolean", value=data__canonicalresourcesblock__found, name="" + (name_prefix or "data") + ".canonical_resources_block.found", definition={'type': 'boolean'}, rule='type')
+                if "missing_resources" in data__canonicalresourcesblock_keys:
+                    data__canonicalresourcesblock_keys.remove("missing_resources")
+                    data__canonicalresourcesblock__missingresources = data__canonicalresourcesblock["missing_resources"]
+                    if not isinstance(data__canonicalresourcesblock__missingresources, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.missing_resources must be array", value=data__canonicalresourcesblock__missingresources, name="" + (name_prefix or "data") + ".canonical_resources_block.missing_resources", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__canonicalresourcesblock__missingresources_is_list = isinstance(data__canonicalresourcesblock__missingresources, (list, tuple))
+                    if data__canonicalresourcesblock__missingresources_is_list:
+                        data__canonicalresourcesblock__missingresources_len = len(data__canonicalresourcesblock__missingresources)
+                        for data__canonicalresourcesblock__missingresources_x, data__canonicalresourcesblock__missingresources_item in enumerate(data__canonicalresourcesblock__missingresources):
+                            if not isinstance(data__canonicalresourcesblock__missingresources_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.missing_resources[{data__canonicalresourcesblock__missingresources_x}]".format(**locals()) + " must be string", value=data__canonicalresourcesblock__missingresources_item, name="" + (name_prefix or "data") + ".canonical_resources_block.missing_resources[{data__canonicalresourcesblock__missingresources_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "why_it_matters" in data__canonicalresourcesblock_keys:
+                    data__canonicalresourcesblock_keys.remove("why_it_matters")
+                    data__canonicalresourcesblock__whyitmatters = data__canonicalresourcesblock["why_it_matters"]
+                    if not isinstance(data__canonicalresourcesblock__whyitmatters, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.why_it_matters must be string", value=data__canonicalresourcesblock__whyitmatters, name="" + (name_prefix or "data") + ".canonical_resources_block.why_it_matters", definition={'type': 'string'}, rule='type')
+                if "recommended_resources" in data__canonicalresourcesblock_keys:
+                    data__canonicalresourcesblock_keys.remove("recommended_resources")
+                    data__canonicalresourcesblock__recommendedresources = data__canonicalresourcesblock["recommended_resources"]
+                    if not isinstance(data__canonicalresourcesblock__recommendedresources, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources must be array", value=data__canonicalresourcesblock__recommendedresources, name="" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}, rule='type')
+                    data__canonicalresourcesblock__recommendedresources_is_list = isinstance(data__canonicalresourcesblock__recommendedresources, (list, tuple))
+                    if data__canonicalresourcesblock__recommendedresources_is_list:
+                        data__canonicalresourcesblock__recommendedresources_len = len(data__canonicalresourcesblock__recommendedresources)
+                        for data__canonicalresourcesblock__recommendedresources_x, data__canonicalresourcesblock__recommendedresources_item in enumerate(data__canonicalresourcesblock__recommendedresources):
+                            if not isinstance(data__canonicalresourcesblock__recommendedresources_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}]".format(**locals()) + " must be object", value=data__canonicalresourcesblock__recommendedresources_item, name="" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}, rule='type')
+                            data__canonicalresourcesblock__recommendedresources_item_is_dict = isinstance(data__canonicalresourcesblock__recommendedresources_item, dict)
+                            if data__canonicalresourcesblock__recommendedresources_item_is_dict:
+                                data__canonicalresourcesblock__recommendedresources_item__missing_keys = set(['title', 'url']) - data__canonicalresourcesblock__recommendedresources_item.keys()
+                                if data__canonicalresourcesblock__recommendedresources_item__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}]".format(**locals()) + " must contain " + (str(sorted(data__canonicalresourcesblock__recommendedresources_item__missing_keys)) + " properties"), value=data__canonicalresourcesblock__recommendedresources_item, name="" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}, rule='required')
+                                data__canonicalresourcesblock__recommendedresources_item_keys = set(data__canonicalresourcesblock__recommendedresources_item.keys())
+                                if "title" in data__canonicalresourcesblock__recommendedresources_item_keys:
+                                    data__canonicalresourcesblock__recommendedresources_item_keys.remove("title")
+                                    data__canonicalresourcesblock__recommendedresources_item__title = data__canonicalresourcesblock__recommendedresources_item["title"]
+                                    if not isinstance(data__canonicalresourcesblock__recommendedresources_item__title, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}].title".format(**locals()) + " must be string", value=data__canonicalresourcesblock__recommendedresources_item__title, name="" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}].title".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "url" in data__canonicalresourcesblock__recommendedresources_item_keys:
+                                    data__canonicalresourcesblock__recommendedresources_item_keys.remove("url")
+                                    data__canonicalresourcesblock__recommendedresources_item__url = data__canonicalresourcesblock__recommendedresources_item["url"]
+                                    if not isinstance(data__canonicalresourcesblock__recommendedresources_item__url, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}].url".format(**locals()) + " must be string", value=data__canonicalresourcesblock__recommendedresources_item__url, name="" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}].url".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if data__canonicalresourcesblock__recommendedresources_item_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}]".format(**locals()) + " must not contain "+str(data__canonicalresourcesblock__recommendedresources_item_keys)+" properties", value=data__canonicalresourcesblock__recommendedresources_item, name="" + (name_prefix or "data") + ".canonical_resources_block.recommended_resources[{data__canonicalresourcesblock__recommendedresources_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}, rule='additionalProperties')
+                if data__canonicalresourcesblock_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".canonical_resources_block must not contain "+str(data__canonicalresourcesblock_keys)+" properties", value=data__canonicalresourcesblock, name="" + (name_prefix or "data") + ".canonical_resources_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_resources': {'type': 'array', 'items': {'type': 'string'}}, 'why_it_matters': {'type': 'string'}, 'recommended_resources': {'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources'], 'additionalProperties': False}, rule='additionalProperties')
+        if "content_structure" in data_keys:
+            data_keys.remove("content_structure")
+            data__contentstructure = data["content_structure"]
+            if not isinstance(data__contentstructure, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure must be object", value=data__contentstructure, name="" + (name_prefix or "data") + ".content_structure", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'headings_quality': {'type': 'string'}, 'visual_structure': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_structure_changes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes'], 'additionalProperties': False}, rule='type')
+            data__contentstructure_is_dict = isinstance(data__contentstructure, dict)
+            if data__contentstructure_is_dict:
+                data__contentstructure__missing_keys = set(['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes']) - data__contentstructure.keys()
+                if data__contentstructure__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure must contain " + (str(sorted(data__contentstructure__missing_keys)) + " properties"), value=data__contentstructure, name="" + (name_prefix or "data") + ".content_structure", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'headings_quality': {'type': 'string'}, 'visual_structure': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_structure_changes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes'], 'additionalProperties': False}, rule='required')
+                data__contentstructure_keys = set(data__contentstructure.keys())
+                if "score" in data__contentstructure_keys:
+                    data__contentstructure_keys.remove("score")
+                    data__contentstructure__score = data__contentstructure["score"]
+                    if not isinstance(data__contentstructure__score, (int)) and not (isinstance(data__contentstructure__score, float) and data__contentstructure__score.is_integer()) or isinstance(data__contentstructure__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.score must be integer", value=data__contentstructure__score, name="" + (name_prefix or "data") + ".content_structure.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "headings_quality" in data__contentstructure_keys:
+                    data__contentstructure_keys.remove("headings_quality")
+                    data__contentstructure__headingsquality = data__contentstructure["headings_quality"]
+                    if not isinstance(data__contentstructure__headingsquality, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.headings_quality must be string", value=data__contentstructure__headingsquality, name="" + (name_prefix or "data") + ".content_structure.headings_quality", definition={'type': 'string'}, rule='type')
+                if "visual_structure" in data__contentstructure_keys:
+                    data__contentstructure_keys.remove("visual_structure")
+                    data__contentstructure__visualstructure = data__contentstructure["visual_structure"]
+                    if not isinstance(data__contentstructure__visualstructure, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.visual_structure must be string", value=data__contentstructure__visualstructure, name="" + (name_prefix or "data") + ".content_structure.visual_structure", definition={'type': 'string'}, rule='type')
+                if "problems" in data__contentstructure_keys:
+                    data__contentstructure_keys.remove("problems")
+                    data__contentstructure__problems = data__contentstructure["problems"]
+                    if not isinstance(data__contentstructure__problems, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.problems must be array", value=data__contentstructure__problems, name="" + (name_prefix or "data") + ".content_structure.problems", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__contentstructure__problems_is_list = isinstance(data__contentstructure__problems, (list, tuple))
+                    if data__contentstructure__problems_is_list:
+                        data__contentstructure__problems_len = len(data__contentstructure__problems)
+                        for data__contentstructure__problems_x, data__contentstructure__problems_item in enumerate(data__contentstructure__problems):
+                            if not isinstance(data__contentstructure__problems_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.problems[{data__contentstructure__problems_x}]".format(**locals()) + " must be string", value=data__contentstructure__problems_item, name="" + (name_prefix or "data") + ".content_structure.problems[{data__contentstructure__problems_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "recommended_structure_changes" in data__contentstructure_keys:
+                    data__contentstructure_keys.remove("recommended_structure_changes")
+                    data__contentstructure__recommendedstructurechanges = data__contentstructure["recommended_structure_changes"]
+                    if not isinstance(data__contentstructure__recommendedstructurechanges, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.recommended_structure_changes must be array", value=data__contentstructure__recommendedstructurechanges, name="" + (name_prefix or "data") + ".content_structure.recommended_structure_changes", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__contentstructure__recommendedstructurechanges_is_list = isinstance(data__contentstructure__recommendedstructurechanges, (list, tuple))
+                    if data__contentstructure__recommendedstructurechanges_is_list:
+                        data__contentstructure__recommendedstructurechanges_len = len(data__contentstructure__recommendedstructurechanges)
+                        for data__contentstructure__recommendedstructurechanges_x, data__contentstructure__recommendedstructurechanges_item in enumerate(data__contentstructure__recommendedstructurechanges):
+                            if not isinstance(data__contentstructure__recommendedstructurechanges_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure.recommended_structure_changes[{data__contentstructure__recommendedstructurechanges_x}]".format(**locals()) + " must be string", value=data__contentstructure__recommendedstructurechanges_item, name="" + (name_prefix or "data") + ".content_structure.recommended_structure_changes[{data__contentstructure__recommendedstructurechanges_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__contentstructure_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".content_structure must not contain "+str(data__contentstructure_keys)+" properties", value=data__contentstructure, name="" + (name_prefix or "data") + ".content_structure", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'headings_quality': {'type': 'string'}, 'visual_structure': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_structure_changes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes'], 'additionalProperties': False}, rule='additionalProperties')
+        if "clarity_readability" in data_keys:
+            data_keys.remove("clarity_readability")
+            data__clarityreadability = data["clarity_readability"]
+            if not isinstance(data__clarityreadability, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability must be object", value=data__clarityreadability, name="" + (name_prefix or "data") + ".clarity_readability", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'issues': {'type': 'array', 'items': {'type': 'string'}}, 'fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'issues', 'fixes'], 'additionalProperties': False}, rule='type')
+            data__clarityreadability_is_dict = isinstance(data__clarityreadability, dict)
+            if data__clarityreadability_is_dict:
+                data__clarityreadability__missing_keys = set(['score', 'issues', 'fixes']) - data__clarityreadability.keys()
+                if data__clarityreadability__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability must contain " + (str(sorted(data__clarityreadability__missing_keys)) + " properties"), value=data__clarityreadability, name="" + (name_prefix or "data") + ".clarity_readability", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'issues': {'type': 'array', 'items': {'type': 'string'}}, 'fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'issues', 'fixes'], 'additionalProperties': False}, rule='required')
+                data__clarityreadability_keys = set(data__clarityreadability.keys())
+                if "score" in data__clarityreadability_keys:
+                    data__clarityreadability_keys.remove("score")
+                    data__clarityreadability__score = data__clarityreadability["score"]
+                    if not isinstance(data__clarityreadability__score, (int)) and not (isinstance(data__clarityreadability__score, float) and data__clarityreadability__score.is_integer()) or isinstance(data__clarityreadability__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability.score must be integer", value=data__clarityreadability__score, name="" + (name_prefix or "data") + ".clarity_readability.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "issues" in data__clarityreadability_keys:
+                    data__clarityreadability_keys.remove("issues")
+                    data__clarityreadability__issues = data__clarityreadability["issues"]
+                    if not isinstance(data__clarityreadability__issues, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability.issues must be array", value=data__clarityreadability__issues, name="" + (name_prefix or "data") + ".clarity_readability.issues", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__clarityreadability__issues_is_list = isinstance(data__clarityreadability__issues, (list, tuple))
+                    if data__clarityreadability__issues_is_list:
+                        data__clarityreadability__issues_len = len(data__clarityreadability__issues)
+                        for data__clarityreadability__issues_x, data__clarityreadability__issues_item in enumerate(data__clarityreadability__issues):
+                            if not isinstance(data__clarityreadability__issues_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability.issues[{data__clarityreadability__issues_x}]".format(**locals()) + " must be string", value=data__clarityreadability__issues_item, name="" + (name_prefix or "data") + ".clarity_readability.issues[{data__clarityreadability__issues_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "fixes" in data__clarityreadability_keys:
+                    data__clarityreadability_keys.remove("fixes")
+                    data__clarityreadability__fixes = data__clarityreadability["fixes"]
+                    if not isinstance(data__clarityreadability__fixes, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability.fixes must be array", value=data__clarityreadability__fixes, name="" + (name_prefix or "data") + ".clarity_readability.fixes", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__clarityreadability__fixes_is_list = isinstance(data__clarityreadability__fixes, (list, tuple))
+                    if data__clarityreadability__fixes_is_list:
+                        data__clarityreadability__fixes_len = len(data__clarityreadability__fixes)
+                        for data__clarityreadability__fixes_x, data__clarityreadability__fixes_item in enumerate(data__clarityreadability__fixes):
+                            if not isinstance(data__clarityreadability__fixes_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability.fixes[{data__clarityreadability__fixes_x}]".format(**locals()) + " must be string", value=data__clarityreadability__fixes_item, name="" + (name_prefix or "data") + ".clarity_readability.fixes[{data__clarityreadability__fixes_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__clarityreadability_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".clarity_readability must not contain "+str(data__clarityreadability_keys)+" properties", value=data__clarityreadability, name="" + (name_prefix or "data") + ".clarity_readability", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'issues': {'type': 'array', 'items': {'type': 'string'}}, 'fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'issues', 'fixes'], 'additionalProperties': False}, rule='additionalProperties')
+        if "eeat_block" in data_keys:
+            data_keys.remove("eeat_block")
+            data__eeatblock = data["eeat_block"]
+            if not isinstance(data__eeatblock, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block must be object", value=data__eeatblock, name="" + (name_prefix or "data") + ".eeat_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'author_info_found': {'type': 'boolean'}, 'expertise_visibility': {'type': 'string'}, 'experience_signals': {'type': 'string'}, 'trust_signals': {'type': 'string'}, 'missing_elements': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements'], 'additionalProperties': False}, rule='type')
+            data__eeatblock_is_dict = isinstance(data__eeatblock, dict)
+            if data__eeatblock_is_dict:
+                data__eeatblock__missing_keys = set(['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements']) - data__eeatblock.keys()
+                if data__eeatblock__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block must contain " + (str(sorted(data__eeatblock__missing_keys)) + " properties"), value=data__eeatblock, name="" + (name_prefix or "data") + ".eeat_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'author_info_found': {'type': 'boolean'}, 'expertise_visibility': {'type': 'string'}, 'experience_signals': {'type': 'string'}, 'trust_signals': {'type': 'string'}, 'missing_elements': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements'], 'additionalProperties': False}, rule='required')
+                data__eeatblock_keys = set(data__eeatblock.keys())
+                if "score" in data__eeatblock_keys:
+                    data__eeatblock_keys.remove("score")
+                    data__eeatblock__score = data__eeatblock["score"]
+                    if not isinstance(data__eeatblock__score, (int)) and not (isinstance(data__eeatblock__score, float) and data__eeatblock__score.is_integer()) or isinstance(data__eeatblock__score, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.score must be integer", value=data__eeatblock__score, name="" + (name_prefix or "data") + ".eeat_block.score", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "author_info_found" in data__eeatblock_keys:
+                    data__eeatblock_keys.remove("author_info_found")
+                    data__eeatblock__authorinfofound = data__eeatblock["author_info_found"]
+                    if not isinstance(data__eeatblock__authorinfofound, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.author_info_found must be boolean", value=data__eeatblock__authorinfofound, name="" + (name_prefix or "data") + ".eeat_block.author_info_found", definition={'type': 'boolean'}, rule='type')
+                if "expertise_visibility" in data__eeatblock_keys:
+                    data__eeatblock_keys.remove("expertise_visibility")
+                    data__eeatblock__expertisevisibility = data__eeatblock["expertise_visibility"]
+                    if not isinstance(data__eeatblock__expertisevisibility, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.expertise_visibility must be string", value=data__eeatblock__expertisevisibility, name="" + (name_prefix or "data") + ".eeat_block.expertise_visibility", definition={'type': 'string'}, rule='type')
+                if "experience_signals" in data__eeatblock_keys:
+                    data__eeatblock_keys.remove("experience_signals")
+                    data__eeatblock__experiencesignals = data__eeatblock["experience_signals"]
+                    if not isinstance(data__eeatblock__experiencesignals, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.experience_signals must be string", value=data__eeatblock__experiencesignals, name="" + (name_prefix or "data") + ".eeat_block.experience_signals", definition={'type': 'string'}, rule='type')
+                if "trust_signals" in data__eeatblock_keys:
+                    data__eeatblock_keys.remove("trust_signals")
+                    data__eeatblock__trustsignals = data__eeatblock["trust_signals"]
+                    if not isinstance(data__eeatblock__trustsignals, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.trust_signals must be string", value=data__eeatblock__trustsignals, name="" + (name_prefix or "data") + ".eeat_block.trust_signals", definition={'type': 'string'}, rule='type')
+                if "missing_elements" in data__eeatblock_keys:
+                    data__eeatblock_keys.remove("missing_elements")
+                    data__eeatblock__missingelements = data__eeatblock["missing_elements"]
+                    if not isinstance(data__eeatblock__missingelements, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.missing_elements must be array", value=data__eeatblock__missingelements, name="" + (name_prefix or "data") + ".eeat_block.missing_elements", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__eeatblock__missingelements_is_list = isinstance(data__eeatblock__missingelements, (list, tuple))
+                    if data__eeatblock__missingelements_is_list:
+                        data__eeatblock__missingelements_len = len(data__eeatblock__missingelements)
+                        for data__eeatblock__missingelements_x, data__eeatblock__missingelements_item in enumerate(data__eeatblock__missingelements):
+                            if not isinstance(data__eeatblock__missingelements_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block.missing_elements[{data__eeatblock__missingelements_x}]".format(**locals()) + " must be string", value=data__eeatblock__missingelements_item, name="" + (name_prefix or "data") + ".eeat_block.missing_elements[{data__eeatblock__missingelements_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__eeatblock_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".eeat_block must not contain "+str(data__eeatblock_keys)+" properties", value=data__eeatblock, name="" + (name_prefix or "data") + ".eeat_block", definition={'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'author_info_found': {'type': 'boolean'}, 'expertise_visibility': {'type': 'string'}, 'experience_signals': {'type': 'string'}, 'trust_signals': {'type': 'string'}, 'missing_elements': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements'], 'additionalProperties': False}, rule='additionalProperties')
+        if "score_matrix" in data_keys:
+            data_keys.remove("score_matrix")
+            data__scorematrix = data["score_matrix"]
+            if not isinstance(data__scorematrix, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix must be object", value=data__scorematrix, name="" + (name_prefix or "data") + ".score_matrix", definition={'type': 'object', 'properties': {'summary_block': {'type': 'integer', 'description': '0-10'}, 'definitions': {'type': 'integer', 'description': '0-10'}, 'faq': {'type': 'integer', 'description': '0-10'}, 'fanout_match': {'type': 'integer', 'description': '0-10'}, 'canonical_resources': {'type': 'integer', 'description': '0-10'}, 'structure': {'type': 'integer', 'description': '0-10'}, 'clarity': {'type': 'integer', 'description': '0-10'}, 'eeat': {'type': 'integer', 'description': '0-10'}, 'final_score': {'type': 'integer', 'description': '0-100'}}, 'required': ['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score'], 'additionalProperties': False}, rule='type')
+            data__scorematrix_is_dict = isinstance(data__scorematrix, dict)
+            if data__scorematrix_is_dict:
+                data__scorematrix__missing_keys = set(['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score']) - data__scorematrix.keys()
+                if data__scorematrix__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix must contain " + (str(sorted(data__scorematrix__missing_keys)) + " properties"), value=data__scorematrix, name="" + (name_prefix or "data") + ".score_matrix", definition={'type': 'object', 'properties': {'summary_block': {'type': 'integer', 'description': '0-10'}, 'definitions': {'type': 'integer', 'description': '0-10'}, 'faq': {'type': 'integer', 'description': '0-10'}, 'fanout_match': {'type': 'integer', 'description': '0-10'}, 'canonical_resources': {'type': 'integer', 'description': '0-10'}, 'structure': {'type': 'integer', 'description': '0-10'}, 'clarity': {'type': 'integer', 'description': '0-10'}, 'eeat': {'type': 'integer', 'description': '0-10'}, 'final_score': {'type': 'integer', 'description': '0-100'}}, 'required': ['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score'], 'additionalProperties': False}, rule='required')
+                data__scorematrix_keys = set(data__scorematrix.keys())
+                if "summary_block" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("summary_block")
+                    data__scorematrix__summaryblock = data__scorematrix["summary_block"]
+                    if not isinstance(data__scorematrix__summaryblock, (int)) and not (isinstance(data__scorematrix__summaryblock, float) and data__scorematrix__summaryblock.is_integer()) or isinstance(data__scorematrix__summaryblock, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.summary_block must be integer", value=data__scorematrix__summaryblock, name="" + (name_prefix or "data") + ".score_matrix.summary_block", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "definitions" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("definitions")
+                    data__scorematrix__definitions = data__scorematrix["definitions"]
+                    if not isinstance(data__scorematrix__definitions, (int)) and not (isinstance(data__scorematrix__definitions, float) and data__scorematrix__definitions.is_integer()) or isinstance(data__scorematrix__definitions, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.definitions must be integer", value=data__scorematrix__definitions, name="" + (name_prefix or "data") + ".score_matrix.definitions", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "faq" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("faq")
+                    data__scorematrix__faq = data__scorematrix["faq"]
+                    if not isinstance(data__scorematrix__faq, (int)) and not (isinstance(data__scorematrix__faq, float) and data__scorematrix__faq.is_integer()) or isinstance(data__scorematrix__faq, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.faq must be integer", value=data__scorematrix__faq, name="" + (name_prefix or "data") + ".score_matrix.faq", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "fanout_match" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("fanout_match")
+                    data__scorematrix__fanoutmatch = data__scorematrix["fanout_match"]
+                    if not isinstance(data__scorematrix__fanoutmatch, (int)) and not (isinstance(data__scorematrix__fanoutmatch, float) and data__scorematrix__fanoutmatch.is_integer()) or isinstance(data__scorematrix__fanoutmatch, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.fanout_match must be integer", value=data__scorematrix__fanoutmatch, name="" + (name_prefix or "data") + ".score_matrix.fanout_match", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "canonical_resources" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("canonical_resources")
+                    data__scorematrix__canonicalresources = data__scorematrix["canonical_resources"]
+                    if not isinstance(data__scorematrix__canonicalresources, (int)) and not (isinstance(data__scorematrix__canonicalresources, float) and data__scorematrix__canonicalresources.is_integer()) or isinstance(data__scorematrix__canonicalresources, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.canonical_resources must be integer", value=data__scorematrix__canonicalresources, name="" + (name_prefix or "data") + ".score_matrix.canonical_resources", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "structure" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("structure")
+                    data__scorematrix__structure = data__scorematrix["structure"]
+                    if not isinstance(data__scorematrix__structure, (int)) and not (isinstance(data__scorematrix__structure, float) and data__scorematrix__structure.is_integer()) or isinstance(data__scorematrix__structure, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.structure must be integer", value=data__scorematrix__structure, name="" + (name_prefix or "data") + ".score_matrix.structure", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "clarity" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("clarity")
+                    data__scorematrix__clarity = data__scorematrix["clarity"]
+                    if not isinstance(data__scorematrix__clarity, (int)) and not (isinstance(data__scorematrix__clarity, float) and data__scorematrix__clarity.is_integer()) or isinstance(data__scorematrix__clarity, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.clarity must be integer", value=data__scorematrix__clarity, name="" + (name_prefix or "data") + ".score_matrix.clarity", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "eeat" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("eeat")
+                    data__scorematrix__eeat = data__scorematrix["eeat"]
+                    if not isinstance(data__scorematrix__eeat, (int)) and not (isinstance(data__scorematrix__eeat, float) and data__scorematrix__eeat.is_integer()) or isinstance(data__scorematrix__eeat, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.eeat must be integer", value=data__scorematrix__eeat, name="" + (name_prefix or "data") + ".score_matrix.eeat", definition={'type': 'integer', 'description': '0-10'}, rule='type')
+                if "final_score" in data__scorematrix_keys:
+                    data__scorematrix_keys.remove("final_score")
+                    data__scorematrix__finalscore = data__scorematrix["final_score"]
+                    if not isinstance(data__scorematrix__finalscore, (int)) and not (isinstance(data__scorematrix__finalscore, float) and data__scorematrix__finalscore.is_integer()) or isinstance(data__scorematrix__finalscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix.final_score must be integer", value=data__scorematrix__finalscore, name="" + (name_prefix or "data") + ".score_matrix.final_score", definition={'type': 'integer', 'description': '0-100'}, rule='type')
+                if data__scorematrix_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".score_matrix must not contain "+str(data__scorematrix_keys)+" properties", value=data__scorematrix, name="" + (name_prefix or "data") + ".score_matrix", definition={'type': 'object', 'properties': {'summary_block': {'type': 'integer', 'description': '0-10'}, 'definitions': {'type': 'integer', 'description': '0-10'}, 'faq': {'type': 'integer', 'description': '0-10'}, 'fanout_match': {'type': 'integer', 'description': '0-10'}, 'canonical_resources': {'type': 'integer', 'description': '0-10'}, 'structure': {'type': 'integer', 'description': '0-10'}, 'clarity': {'type': 'integer', 'description': '0-10'}, 'eeat': {'type': 'integer', 'description': '0-10'}, 'final_score': {'type': 'integer', 'description': '0-100'}}, 'required': ['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score'], 'additionalProperties': False}, rule='additionalProperties')
+        if "fix_roadmap" in data_keys:
+            data_keys.remove("fix_roadmap")
+            data__fixroadmap = data["fix_roadmap"]
+            if not isinstance(data__fixroadmap, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap must be object", value=data__fixroadmap, name="" + (name_prefix or "data") + ".fix_roadmap", definition={'type': 'object', 'properties': {'immediate_fixes_next_24h': {'type': 'array', 'items': {'type': 'string'}}, 'medium_priority_next_7_days': {'type': 'array', 'items': {'type': 'string'}}, 'long_term_next_30_days': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days'], 'additionalProperties': False}, rule='type')
+            data__fixroadmap_is_dict = isinstance(data__fixroadmap, dict)
+            if data__fixroadmap_is_dict:
+                data__fixroadmap__missing_keys = set(['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days']) - data__fixroadmap.keys()
+                if data__fixroadmap__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap must contain " + (str(sorted(data__fixroadmap__missing_keys)) + " properties"), value=data__fixroadmap, name="" + (name_prefix or "data") + ".fix_roadmap", definition={'type': 'object', 'properties': {'immediate_fixes_next_24h': {'type': 'array', 'items': {'type': 'string'}}, 'medium_priority_next_7_days': {'type': 'array', 'items': {'type': 'string'}}, 'long_term_next_30_days': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days'], 'additionalProperties': False}, rule='required')
+                data__fixroadmap_keys = set(data__fixroadmap.keys())
+                if "immediate_fixes_next_24h" in data__fixroadmap_keys:
+                    data__fixroadmap_keys.remove("immediate_fixes_next_24h")
+                    data__fixroadmap__immediatefixesnext24h = data__fixroadmap["immediate_fixes_next_24h"]
+                    if not isinstance(data__fixroadmap__immediatefixesnext24h, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap.immediate_fixes_next_24h must be array", value=data__fixroadmap__immediatefixesnext24h, name="" + (name_prefix or "data") + ".fix_roadmap.immediate_fixes_next_24h", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__fixroadmap__immediatefixesnext24h_is_list = isinstance(data__fixroadmap__immediatefixesnext24h, (list, tuple))
+                    if data__fixroadmap__immediatefixesnext24h_is_list:
+                        data__fixroadmap__immediatefixesnext24h_len = len(data__fixroadmap__immediatefixesnext24h)
+                        for data__fixroadmap__immediatefixesnext24h_x, data__fixroadmap__immediatefixesnext24h_item in enumerate(data__fixroadmap__immediatefixesnext24h):
+                            if not isinstance(data__fixroadmap__immediatefixesnext24h_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap.immediate_fixes_next_24h[{data__fixroadmap__immediatefixesnext24h_x}]".format(**locals()) + " must be string", value=data__fixroadmap__immediatefixesnext24h_item, name="" + (name_prefix or "data") + ".fix_roadmap.immediate_fixes_next_24h[{data__fixroadmap__immediatefixesnext24h_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "medium_priority_next_7_days" in data__fixroadmap_keys:
+                    data__fixroadmap_keys.remove("medium_priority_next_7_days")
+                    data__fixroadmap__mediumprioritynext7days = data__fixroadmap["medium_priority_next_7_days"]
+                    if not isinstance(data__fixroadmap__mediumprioritynext7days, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap.medium_priority_next_7_days must be array", value=data__fixroadmap__mediumprioritynext7days, name="" + (name_prefix or "data") + ".fix_roadmap.medium_priority_next_7_days", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__fixroadmap__mediumprioritynext7days_is_list = isinstance(data__fixroadmap__mediumprioritynext7days, (list, tuple))
+                    if data__fixroadmap__mediumprioritynext7days_is_list:
+                        data__fixroadmap__mediumprioritynext7days_len = len(data__fixroadmap__mediumprioritynext7days)
+                        for data__fixroadmap__mediumprioritynext7days_x, data__fixroadmap__mediumprioritynext7days_item in enumerate(data__fixroadmap__mediumprioritynext7days):
+                            if not isinstance(data__fixroadmap__mediumprioritynext7days_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap.medium_priority_next_7_days[{data__fixroadmap__mediumprioritynext7days_x}]".format(**locals()) + " must be string", value=data__fixroadmap__mediumprioritynext7days_item, name="" + (name_prefix or "data") + ".fix_roadmap.medium_priority_next_7_days[{data__fixroadmap__mediumprioritynext7days_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "long_term_next_30_days" in data__fixroadmap_keys:
+                    data__fixroadmap_keys.remove("long_term_next_30_days")
+                    data__fixroadmap__longtermnext30days = data__fixroadmap["long_term_next_30_days"]
+                    if not isinstance(data__fixroadmap__longtermnext30days, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap.long_term_next_30_days must be array", value=data__fixroadmap__longtermnext30days, name="" + (name_prefix or "data") + ".fix_roadmap.long_term_next_30_days", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__fixroadmap__longtermnext30days_is_list = isinstance(data__fixroadmap__longtermnext30days, (list, tuple))
+                    if data__fixroadmap__longtermnext30days_is_list:
+                        data__fixroadmap__longtermnext30days_len = len(data__fixroadmap__longtermnext30days)
+                        for data__fixroadmap__longtermnext30days_x, data__fixroadmap__longtermnext30days_item in enumerate(data__fixroadmap__longtermnext30days):
+                            if not isinstance(data__fixroadmap__longtermnext30days_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap.long_term_next_30_days[{data__fixroadmap__longtermnext30days_x}]".format(**locals()) + " must be string", value=data__fixroadmap__longtermnext30days_item, name="" + (name_prefix or "data") + ".fix_roadmap.long_term_next_30_days[{data__fixroadmap__longtermnext30days_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if data__fixroadmap_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fix_roadmap must not contain "+str(data__fixroadmap_keys)+" properties", value=data__fixroadmap, name="" + (name_prefix or "data") + ".fix_roadmap", definition={'type': 'object', 'properties': {'immediate_fixes_next_24h': {'type': 'array', 'items': {'type': 'string'}}, 'medium_priority_next_7_days': {'type': 'array', 'items': {'type': 'string'}}, 'long_term_next_30_days': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days'], 'additionalProperties': False}, rule='additionalProperties')
+        if "page_metadata" in data_keys:
+            data_keys.remove("page_metadata")
+            data__pagemetadata = data["page_metadata"]
+            if not isinstance(data__pagemetadata, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".page_metadata must be object", value=data__pagemetadata, name="" + (name_prefix or "data") + ".page_metadata", definition={'type': 'object'}, rule='type')
+        if "raw_data" in data_keys:
+            data_keys.remove("raw_data")
+            data__rawdata = data["raw_data"]
+            if not isinstance(data__rawdata, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".raw_data must be object", value=data__rawdata, name="" + (name_prefix or "data") + ".raw_data", definition={'type': 'object'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'executive_summary': {'type': 'object', 'properties': {'overall_llm_readiness_score': {'type': 'integer', 'description': '0-100'}, 'verdict': {'type': 'string', 'enum': ['Ready', 'Partially Ready', 'Needs Work', 'Poor']}, 'main_issue': {'type': 'string'}, 'top_3_fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['overall_llm_readiness_score', 'verdict', 'main_issue', 'top_3_fixes'], 'additionalProperties': False}, 'llm_interpretation': {'type': 'object', 'properties': {'primary_topic': {'type': 'string'}, 'secondary_topics': {'type': 'array', 'items': {'type': 'string'}}, 'detected_intent': {'type': 'string'}, 'summary_llm_generated': {'type': 'string'}, 'key_claims_llm_detected': {'type': 'array', 'items': {'type': 'string'}}, 'confidence_level': {'type': 'string'}}, 'required': ['primary_topic', 'secondary_topics', 'detected_intent', 'summary_llm_generated', 'key_claims_llm_detected', 'confidence_level'], 'additionalProperties': False}, 'summary_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_summary_block': {'type': 'string'}}, 'required': ['score', 'found', 'quality', 'problems', 'recommended_summary_block'], 'additionalProperties': False}, 'definitions_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_critical_terms': {'type': 'array', 'items': {'type': 'string'}}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_definitions': {'type': 'array', 'items': {'type': 'object', 'properties': {'term': {'type': 'string'}, 'definition': {'type': 'string'}}, 'required': ['term', 'definition'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_critical_terms', 'quality_problems', 'recommended_definitions'], 'additionalProperties': False}, 'fanout_query_analysis': {'type': 'object', 'properties': {'sub_questions_generated': {'type': 'array', 'items': {'type': 'object', 'properties': {'question': {'type': 'string'}, 'matched_content': {'type': 'string'}, 'match_quality': {'type': 'string'}, 'missing_answer_note': {'type': 'string'}}, 'required': ['question', 'matched_content', 'match_quality', 'missing_answer_note'], 'additionalProperties': False}}, 'coverage_score': {'type': 'integer', 'description': '0-10'}, 'main_gaps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sub_questions_generated', 'coverage_score', 'main_gaps'], 'additionalProperties': False}, 'faq_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'quality_problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_faqs': {'type': 'array', 'items': {'type': 'object', 'properties': {'q': {'type': 'string'}, 'a': {'type': 'string'}}, 'required': ['q', 'a'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'quality_problems', 'recommended_faqs'], 'additionalProperties': False}, 'canonical_resources_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'found': {'type': 'boolean'}, 'missing_resources': {'type': 'array', 'items': {'type': 'string'}}, 'why_it_matters': {'type': 'string'}, 'recommended_resources': {'type': 'array', 'items': {'type': 'object', 'properties': {'title': {'type': 'string'}, 'url': {'type': 'string'}}, 'required': ['title', 'url'], 'additionalProperties': False}}}, 'required': ['score', 'found', 'missing_resources', 'why_it_matters', 'recommended_resources'], 'additionalProperties': False}, 'content_structure': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'headings_quality': {'type': 'string'}, 'visual_structure': {'type': 'string'}, 'problems': {'type': 'array', 'items': {'type': 'string'}}, 'recommended_structure_changes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'headings_quality', 'visual_structure', 'problems', 'recommended_structure_changes'], 'additionalProperties': False}, 'clarity_readability': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'issues': {'type': 'array', 'items': {'type': 'string'}}, 'fixes': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'issues', 'fixes'], 'additionalProperties': False}, 'eeat_block': {'type': 'object', 'properties': {'score': {'type': 'integer', 'description': '0-10'}, 'author_info_found': {'type': 'boolean'}, 'expertise_visibility': {'type': 'string'}, 'experience_signals': {'type': 'string'}, 'trust_signals': {'type': 'string'}, 'missing_elements': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['score', 'author_info_found', 'expertise_visibility', 'experience_signals', 'trust_signals', 'missing_elements'], 'additionalProperties': False}, 'score_matrix': {'type': 'object', 'properties': {'summary_block': {'type': 'integer', 'description': '0-10'}, 'definitions': {'type': 'integer', 'description': '0-10'}, 'faq': {'type': 'integer', 'description': '0-10'}, 'fanout_match': {'type': 'integer', 'description': '0-10'}, 'canonical_resources': {'type': 'integer', 'description': '0-10'}, 'structure': {'type': 'integer', 'description': '0-10'}, 'clarity': {'type': 'integer', 'description': '0-10'}, 'eeat': {'type': 'integer', 'description': '0-10'}, 'final_score': {'type': 'integer', 'description': '0-100'}}, 'required': ['summary_block', 'definitions', 'faq', 'fanout_match', 'canonical_resources', 'structure', 'clarity', 'eeat', 'final_score'], 'additionalProperties': False}, 'fix_roadmap': {'type': 'object', 'properties': {'immediate_fixes_next_24h': {'type': 'array', 'items': {'type': 'string'}}, 'medium_priority_next_7_days': {'type': 'array', 'items': {'type': 'string'}}, 'long_term_next_30_days': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['immediate_fixes_next_24h', 'medium_priority_next_7_days', 'long_term_next_30_days'], 'additionalProperties': False}, 'page_metadata': {'type': 'object'}, 'raw_data': {'type': 'object'}}, 'required': ['executive_summary', 'llm_interpretation', 'summary_block', 'definitions_block', 'fanout_query_analysis', 'faq_block', 'canonical_resources_block', 'content_structure', 'clarity_readability', 'eeat_block', 'score_matrix', 'fix_roadmap', 'page_metadata', 'raw_data'], 'additionalProperties': False}, rule='additionalProperties')
+    return data
\ No newline at end of file
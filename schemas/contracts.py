@@ -18,9 +18,13 @@ class AIAnswerPresenceResponse(BaseModel):
     echo: AIAnswerPresenceRequest
 
 
+# The models never change at runtime, so the schemas are generated once
+_CONTRACT = {
+    "version": CONTRACT_VERSION,
+    "request": AIAnswerPresenceRequest.model_json_schema(),
+    "response": AIAnswerPresenceResponse.model_json_schema(),
+}
+
+
 def get_ai_answer_presence_contract():
-    return {
-        "version": CONTRACT_VERSION,
-        "request": AIAnswerPresenceRequest.model_json_schema(),
-        "response": AIAnswerPresenceResponse.model_json_schema(),
-    }
\ No newline at end of file
+    return _CONTRACT
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+One-off migration: drops idx_ai_preview_runs_project_id, which
+idx_ai_preview_runs_project_created (project_id, created_at DESC) now covers.
+
+Both steps use CONCURRENTLY, so inserts into ai_preview_runs keep going;
+that can't run inside a transaction, hence not part of ensure_tables().
+Run once per database from the repo root:
+    DATABASE_URL=... python scripts/drop_preview_project_index.py
+"""
+
+import os
+import sys
+
+import psycopg2
+
+STATEMENTS = (
+    # Already there if the app has started since the index was added
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ai_preview_runs_project_created "
+    "ON ai_preview_runs(project_id, created_at DESC)",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_ai_preview_runs_project_id",
+)
+
+
+def main() -> int:
+    db_url = os.getenv("DATABASE_URL")
+    if not db_url:
+        print("DATABASE_URL is missing", file=sys.stderr)
+        return 1
+
+    conn = psycopg2.connect(db_url, connect_timeout=5)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            for sql in STATEMENTS:
+                cur.execute(sql)
+                print(sql)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
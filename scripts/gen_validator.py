@@ -0,0 +1,38 @@
+"""
+Regenerates schemas/arc_rank_checker_validator.py from FINISHED_REPORT_SCHEMA.
+
+Run from the repo root after changing schemas/arc_rank_checker.py:
+    python scripts/gen_validator.py
+"""
+
+import os
+import sys
+
+import fastjsonschema
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from schemas.arc_rank_checker import FINISHED_REPORT_SCHEMA, FINISHED_REPORT_SCHEMA_SHA256  # noqa: E402
+
+OUTPUT = os.path.join(ROOT, "schemas", "arc_rank_checker_validator.py")
+
+HEADER = '''"""
+Generated by scripts/gen_validator.py from FINISHED_REPORT_SCHEMA. Do not edit.
+"""
+# fmt: off
+SCHEMA_SHA256 = "{sha}"
+'''
+
+
+def main() -> int:
+    code = fastjsonschema.compile_to_code(FINISHED_REPORT_SCHEMA)
+    with open(OUTPUT, "w", encoding="utf-8") as f:
+        f.write(HEADER.format(sha=FINISHED_REPORT_SCHEMA_SHA256))
+        f.write(code)
+    print(f"wrote {os.path.relpath(OUTPUT, ROOT)} ({len(code)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,9 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE = "https://queryarc-backend-staging.up.railway.app"
 
@@ -8,31 +12,39 @@ def check(name: str, ok: bool, details: str = ""):
     print(f"[{status}] {name}" + (f" - {details}" if details else ""))
     return ok
 
-def main() -> int:
-    failures = 0
+def make_session() -> requests.Session:
+    # One session for all checks: TLS to BASE is set up once and reused.
+    # Retry covers transient edge errors (idempotent methods only).
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+    return session
+
+# Each check returns (name, ok, details); they are independent, so they run concurrently
 
-    # 1) /health
-    r = requests.get(f"{BASE}/health", timeout=20)
-    failures += 0 if check("/health returns 200", r.status_code == 200, f"status={r.status_code}") else 1
+def check_health(session: requests.Session):
+    r = session.get(f"{BASE}/health", timeout=20)
+    return "/health returns 200", r.status_code == 200, f"status={r.status_code}"
 
-    # 2) /contract
-    r = requests.get(f"{BASE}/api/tools/ai-answer-presence/contract", timeout=20)
+def check_contract(session: requests.Session):
+    r = session.get(f"{BASE}/api/tools/ai-answer-presence/contract", timeout=20)
     ok = r.status_code == 200 and isinstance(r.json(), dict) and "version" in r.json()
-    failures += 0 if check("ai-answer-presence /contract returns version", ok, f"status={r.status_code}") else 1
+    return "ai-answer-presence /contract returns version", ok, f"status={r.status_code}"
 
-    # 3) /test-contract valid
+def check_test_contract(session: requests.Session):
     payload = {
         "project_name": "QueryArc",
         "core_topic": "LLM SEO",
         "brand_terms": ["QueryArc", "Arc Rank"],
     }
-    r = requests.post(f"{BASE}/api/tools/ai-answer-presence/test-contract", json=payload, timeout=20)
+    r = session.post(f"{BASE}/api/tools/ai-answer-presence/test-contract", json=payload, timeout=20)
     body = r.json() if r.headers.get("content-type","").startswith("application/json") else {}
     ok = r.status_code == 200 and body.get("accepted") is True and body.get("echo", {}) == payload
-    failures += 0 if check("ai-answer-presence /test-contract echoes payload", ok, f"status={r.status_code}") else 1
+    return "ai-answer-presence /test-contract echoes payload", ok, f"status={r.status_code}"
 
-    # 4) arc-rank-checker /analyze returns required top-level keys (smoke test)
-    r = requests.post(
+def check_analyze(session: requests.Session):
+    # arc-rank-checker /analyze returns required top-level keys (smoke test)
+    r = session.post(
         f"{BASE}/api/tools/arc-rank-checker/analyze",
         json={"url": "https://queryarc.com"},
         timeout=60,
@@ -40,10 +52,24 @@ def main() -> int:
     required_keys = {"page_metadata", "executive_summary", "score_matrix", "fix_roadmap"}
     body = r.json() if r.headers.get("content-type","").startswith("application/json") else {}
     ok = r.status_code == 200 and required_keys.issubset(set(body.keys()))
-    failures += 0 if check("arc-rank-checker /analyze returns required keys", ok, f"status={r.status_code}") else 1
+    return "arc-rank-checker /analyze returns required keys", ok, f"status={r.status_code}"
+
+CHECKS = [check_health, check_contract, check_test_contract, check_analyze]
+
+def main() -> int:
+    failures = 0
+    with make_session() as session, ThreadPoolExecutor(max_workers=len(CHECKS)) as ex:
+        futures = [ex.submit(fn, session) for fn in CHECKS]
+        # Report in declaration order so the output stays stable
+        for fn, f in zip(CHECKS, futures):
+            try:
+                name, ok, details = f.result()
+            except Exception as e:
+                name, ok, details = fn.__name__, False, f"{type(e).__name__}: {e}"
+            failures += 0 if check(name, ok, details) else 1
 
     print("\nDone.")
     return 0 if failures == 0 else 1
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
@@ -1,27 +1,34 @@
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
+import asyncio
+import hashlib
+import io
 import os
-import json
-import uuid
+import random
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, Optional, Tuple
 
-from openai import OpenAI
-from psycopg2.extras import Json
+import httpx
+import orjson
+from cachetools import TTLCache
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
-from db import (
-    get_conn,
-    ensure_ai_projects_table,
-    ensure_ai_preview_runs_table,
-)
+from db import Json, get_conn, new_id
 
+from schemas.ai_answer_presence import PREVIEW_TEXT_FORMAT, RUN_ANSWERS_TEXT_FORMAT
 from schemas.contracts import (
     AIAnswerPresenceRequest,
     AIAnswerPresenceResponse,
     CONTRACT_VERSION,
     get_ai_answer_presence_contract,
 )
+from tools.openai_limits import (
+    LLM_CHARS_PER_TOKEN,
+    is_retryable_openai_error,
+    llm_limiter,
+    retry_after_seconds,
+)
 
 # ---------------------------------------------------------
 # Router
@@ -32,6 +39,82 @@ router = APIRouter(
     tags=["ai-answer-presence"],
 )
 
+# ---------------------------------------------------------
+# OpenAI clients (one per process, pooled keep-alive connections)
+# ---------------------------------------------------------
+
+OPENAI_TIMEOUT_S = 60.0
+OPENAI_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+# With the openai[aiohttp] extra installed, requests go out over aiohttp,
+# which holds up better than httpx's transport at /run's fan-out
+try:
+    import aiohttp  # noqa: F401
+    from openai import DefaultAioHttpClient as _OpenAIHttpClient
+except ImportError:
+    _OpenAIHttpClient = DefaultAsyncHttpxClient
+
+
+# api_key -> client, so shutdown can close them
+_openai_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def _async_openai(api_key: str) -> AsyncOpenAI:
+    client = _openai_clients.get(api_key)
+    if client is None:
+        client = _openai_clients[api_key] = AsyncOpenAI(
+            api_key=api_key,
+            timeout=OPENAI_TIMEOUT_S,
+            http_client=_OpenAIHttpClient(limits=OPENAI_HTTP_LIMITS),
+        )
+    return client
+
+
+async def close_clients() -> None:
+    """Called from the app shutdown hook."""
+    clients = list(_openai_clients.values())
+    _openai_clients.clear()
+    for client in clients:
+        await client.close()
+
+# ---------------------------------------------------------
+# Answer caches (per process)
+# ---------------------------------------------------------
+
+# Prompts carry no per-user data, so an identical (model, prompt) within the
+# TTL reuses the earlier answer instead of paying for another call
+ANSWER_CACHE_SIZE = 10_000
+ANSWER_CACHE_TTL_S = 3600
+# /run answers are also kept in llm_response_cache, shared across workers
+LLM_RESPONSE_CACHE_TTL_DAYS = int(os.getenv("LLM_RESPONSE_CACHE_TTL_DAYS", "7"))
+
+# /run: sha256(model, prompt) -> (raw_answer, raw_meta)
+_answer_cache: TTLCache = TTLCache(maxsize=ANSWER_CACHE_SIZE, ttl=ANSWER_CACHE_TTL_S)
+# /preview: sha256(model, prompt) -> parsed answer
+_preview_cache: TTLCache = TTLCache(maxsize=ANSWER_CACHE_SIZE, ttl=ANSWER_CACHE_TTL_S)
+
+
+def _answer_cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(orjson.dumps([model, prompt])).hexdigest()
+
+
+def _load_cached_answers(keys: list) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """llm_response_cache lookup for a whole run: key -> (raw_answer, raw_meta)."""
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT key, response FROM llm_response_cache
+            WHERE key = ANY(%s) AND created_at > now() - make_interval(days => %s)
+            """,
+            (keys, LLM_RESPONSE_CACHE_TTL_DAYS),
+        )
+        return {key: (r["raw_answer"], r["raw_meta"]) for key, r in cur.fetchall()}
+
 # ---------------------------------------------------------
 # Test contract endpoint (used by staging + CI)
 # ---------------------------------------------------------
@@ -52,24 +135,133 @@ def test_contract(payload: AIAnswerPresenceRequest):
 # Preview endpoint (supports project_id mode + direct payload)
 # ---------------------------------------------------------
 
-@router.post("/preview")
-def preview(payload: dict = Body(...)):
-    project_id = payload.get("project_id")
-
-    # Mode 1: load from db using project_id
-    if project_id:
-        ensure_ai_projects_table()
-        ensure_ai_preview_runs_table()
-
-        conn = get_conn()
-        cur = conn.cursor()
+def _load_project(project_id: str) -> Optional[tuple]:
+    with get_conn() as conn, conn.cursor() as cur:
         cur.execute(
             "SELECT website, topics, competitors, questions FROM ai_projects WHERE id = %s",
             (project_id,),
         )
-        row = cur.fetchone()
-        cur.close()
-        conn.close()
+        return cur.fetchone()
+
+
+def _save_preview_run(run_id: str, project_id: str, result: Dict[str, Any]) -> None:
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO ai_preview_runs (id, project_id, result) VALUES (%s, %s, %s)",
+            (run_id, project_id, Json(result)),
+        )
+        conn.commit()
+
+
+# Filled per question with str.format (website, topics, competitors, question)
+PREVIEW_PROMPT_TEMPLATE = """
+You are analyzing brand presence in LLM answers.
+
+Brand website: {website}
+Topics: {topics}
+Known competitors: {competitors}
+
+Question: {question}
+""".strip()
+
+
+async def _preview_question(client: AsyncOpenAI, model: str, prompt: str, q: Any) -> Dict[str, Any]:
+    cache_key = _answer_cache_key(model, prompt)
+    cached = _preview_cache.get(cache_key)
+    if cached is not None:
+        return {"question": q, "result": dict(cached)}
+
+    # Strict structured output: the answer is a bare JSON object of
+    # PREVIEW_ANSWER_SCHEMA (the schema, not the prompt, defines the keys).
+    # Streamed so we can stop reading as soon as that object is complete
+    # (a JSON answer can be padded with trailing whitespace).
+    stream = await client.responses.create(
+        model=model, input=prompt, text=PREVIEW_TEXT_FORMAT, stream=True
+    )
+    parts = []
+    parsed = None
+    async with stream:
+        async for event in stream:
+            if event.type != "response.output_text.delta":
+                continue
+            parts.append(event.delta)
+            if "}" not in event.delta:
+                continue
+            try:
+                parsed = orjson.loads("".join(parts))
+                break
+            except orjson.JSONDecodeError:
+                continue
+
+    text = "".join(parts).strip()
+    if not isinstance(parsed, dict):
+        try:
+            parsed = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+    if isinstance(parsed, dict):
+        _preview_cache[cache_key] = parsed
+        return {"question": q, "result": dict(parsed)}
+
+    parsed = {
+        "brand_mentioned": None,
+        "competitors_mentioned": [],
+        "recommendation_strength": None,
+        "short_summary": "Could not parse JSON output",
+        "evidence_snippet": "",
+        "raw": text[:800],
+    }
+    return {"question": q, "result": parsed}
+
+
+def _without_raw(results: list) -> list:
+    """Response copy of preview results: the raw fallback text stays in the DB only."""
+    out = []
+    for r in results:
+        if "raw" in r["result"]:
+            result = {k: v for k, v in r["result"].items() if k != "raw"}
+            result["raw_truncated"] = True
+            r = {**r, "result": result}
+        out.append(r)
+    return out
+
+
+def _preview_failed(q: Any, err: Exception) -> Dict[str, Any]:
+    return {
+        "question": q,
+        "result": {
+            "brand_mentioned": None,
+            "competitors_mentioned": [],
+            "recommendation_strength": None,
+            "short_summary": "LLM call failed",
+            "evidence_snippet": "",
+            "error": {"type": type(err).__name__, "message": str(err)[:800]},
+        },
+    }
+
+
+def _mention_rate(results: list) -> float:
+    # Only answers with a parsed true/false count toward the rate
+    hits = total = 0
+    for r in results:
+        mentioned = r["result"].get("brand_mentioned")
+        if isinstance(mentioned, bool):
+            total += 1
+            hits += mentioned
+    return hits / total if total else 0.0
+
+
+async def _preview_setup(payload: dict) -> Dict[str, Any]:
+    """
+    Validates a /preview payload (project_id or direct mode) and renders one
+    prompt per question. Shared by /preview and /preview/stream.
+    """
+    project_id = payload.get("project_id")
+
+    # Mode 1: load from db using project_id
+    if project_id:
+        row = await asyncio.to_thread(_load_project, project_id)
 
         if not row:
             raise HTTPException(status_code=404, detail="project not found")
@@ -94,148 +286,215 @@ def preview(payload: dict = Body(...)):
     if not api_key:
         raise HTTPException(status_code=500, detail="OPENAI_API_KEY is missing on server")
 
-    client = OpenAI(api_key=api_key)
-    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
     questions_used = (questions or [])[:3]
-    results = []
-
-    for q in questions_used:
-        prompt = f"""
-You are analyzing brand presence in LLM answers.
 
-Brand website: {website}
-Topics: {topics}
-Known competitors: {competitors}
+    # Shared by every question's prompt, so serialized once
+    topics_str = orjson.dumps(topics).decode()
+    competitors_str = orjson.dumps(competitors).decode()
 
-Question: {q}
-
-Return ONLY valid JSON with exactly these keys:
-{{
-  "brand_mentioned": true/false,
-  "competitors_mentioned": ["..."],
-  "recommendation_strength": 0.0,
-  "short_summary": "one sentence",
-  "evidence_snippet": "short quote from the answer"
-}}
-""".strip()
+    return {
+        "mode": mode,
+        "project_id": project_id,
+        "website": website,
+        "questions_used": questions_used,
+        "client": _async_openai(api_key),
+        "model": os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        "prompts": [
+            PREVIEW_PROMPT_TEMPLATE.format(
+                website=website,
+                topics=topics_str,
+                competitors=competitors_str,
+                question=q,
+            )
+            for q in questions_used
+        ],
+    }
 
-        resp = client.responses.create(model=model, input=prompt)
-        text = (resp.output_text or "").strip()
 
-        clean = text
-        if clean.startswith("```"):
-            clean = clean.strip().lstrip("`")
-            if clean.lower().startswith("json"):
-                clean = clean[4:].lstrip()
-            if clean.endswith("```"):
-                clean = clean[:-3].strip()
+async def _save_preview(setup: Dict[str, Any], results: list, mention_rate: float) -> Optional[str]:
+    # Only project_id mode previews are kept (they feed latest-preview)
+    if not setup["project_id"]:
+        return None
+    run_id = new_id()
+    await asyncio.to_thread(
+        _save_preview_run,
+        run_id,
+        setup["project_id"],
+        {
+            "website": setup["website"],
+            "questions_used": setup["questions_used"],
+            "brand_mention_rate": mention_rate,
+            "results": results,
+        },
+    )
+    return run_id
 
-        try:
-            parsed = json.loads(clean)
-        except Exception:
-            parsed = {
-                "brand_mentioned": None,
-                "competitors_mentioned": [],
-                "recommendation_strength": None,
-                "short_summary": "Could not parse JSON output",
-                "evidence_snippet": "",
-                "raw": text[:800],
-            }
 
-        results.append({"question": q, "result": parsed})
+@router.post("/preview")
+async def preview(request: Request, payload: dict = Body(...)):
+    setup = await _preview_setup(payload)
+    questions_used = setup["questions_used"]
+
+    # Questions are independent: ask them concurrently, keep input order
+    outcomes = await asyncio.gather(
+        *(
+            _preview_question(setup["client"], setup["model"], prompt, q)
+            for q, prompt in zip(questions_used, setup["prompts"])
+        ),
+        return_exceptions=True,
+    )
 
-    mention_bools = [
-        r["result"].get("brand_mentioned")
-        for r in results
-        if isinstance(r["result"].get("brand_mentioned"), bool)
+    # A failed call only costs its own slot; if every call failed (bad key,
+    # OpenAI down) the request fails as a whole
+    failures = [o for o in outcomes if isinstance(o, BaseException)]
+    for failure in failures:
+        if not isinstance(failure, Exception):
+            raise failure
+    if failures and len(failures) == len(outcomes):
+        raise failures[0]
+
+    results = [
+        outcome if not isinstance(outcome, BaseException) else _preview_failed(q, outcome)
+        for q, outcome in zip(questions_used, outcomes)
     ]
-    mention_rate = (sum(1 for v in mention_bools if v) / len(mention_bools)) if mention_bools else 0.0
-
-    run_id = None
-    if project_id:
-        run_id = str(uuid.uuid4())
-        conn = get_conn()
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO ai_preview_runs (id, project_id, result) VALUES (%s, %s, %s)",
-            (
-                run_id,
-                project_id,
-                Json(
-                    {
-                        "website": website,
-                        "questions_used": questions_used,
-                        "brand_mention_rate": mention_rate,
-                        "results": results,
-                    }
-                ),
-            ),
-        )
-        conn.commit()
-        cur.close()
-        conn.close()
+    mention_rate = _mention_rate(results)
+    run_id = await _save_preview(setup, results, mention_rate)
 
     return {
         "ok": True,
-        "mode": mode,
-        "project_id": project_id,
+        "mode": setup["mode"],
+        "project_id": setup["project_id"],
         "run_id": run_id,
-        "website": website,
+        "website": setup["website"],
         "questions_used": questions_used,
         "brand_mention_rate": mention_rate,
-        "results": results,
+        # Send x-debug: 1 to get the raw text of unparseable answers back
+        "results": results if request.headers.get("x-debug") == "1" else _without_raw(results),
         "locked": True,
     }
 
+
+def _ndjson(event: dict) -> bytes:
+    return orjson.dumps(event) + b"\n"
+
+
+async def _stream_preview(setup: Dict[str, Any], debug: bool):
+    questions_used = setup["questions_used"]
+    yield _ndjson(
+        {
+            "type": "start",
+            "mode": setup["mode"],
+            "project_id": setup["project_id"],
+            "website": setup["website"],
+            "questions_used": questions_used,
+        }
+    )
+
+    async def ask(i: int, q: Any, prompt: str):
+        try:
+            return i, await _preview_question(setup["client"], setup["model"], prompt, q), None
+        except Exception as e:
+            return i, _preview_failed(q, e), e
+
+    results: list = [None] * len(questions_used)
+    failures = []
+    for next_done in asyncio.as_completed(
+        [ask(i, q, prompt) for i, (q, prompt) in enumerate(zip(questions_used, setup["prompts"]))]
+    ):
+        i, result, err = await next_done
+        results[i] = result
+        if err is not None:
+            failures.append(err)
+        sent = result if debug else _without_raw([result])[0]
+        yield _ndjson({"type": "result", "index": i, **sent})
+
+    # Same rule as /preview: if every call failed, nothing is saved
+    if failures and len(failures) == len(results):
+        err = failures[0]
+        yield _ndjson({"type": "error", "status": 500, "detail": f"{type(err).__name__}: {err}"})
+        return
+
+    mention_rate = _mention_rate(results)
+    try:
+        run_id = await _save_preview(setup, results, mention_rate)
+    except Exception as e:
+        yield _ndjson({"type": "error", "status": 500, "detail": f"Preview save failed: {type(e).__name__}: {e}"})
+        return
+    yield _ndjson(
+        {
+            "type": "done",
+            "run_id": run_id,
+            "brand_mention_rate": mention_rate,
+            "locked": True,
+        }
+    )
+
+
+@router.post("/preview/stream")
+async def preview_stream(request: Request, payload: dict = Body(...)):
+    """
+    NDJSON version of /preview: a "start" event, one "result" event per
+    question as soon as its answer is in (index = position in
+    questions_used), then "done" with run_id and brand_mention_rate.
+    Failures after the stream has started arrive as an "error" event.
+    """
+    setup = await _preview_setup(payload)
+    return StreamingResponse(
+        _stream_preview(setup, request.headers.get("x-debug") == "1"),
+        media_type="application/x-ndjson",
+    )
+
 # ---------------------------------------------------------
 # Latest preview endpoint
 # ---------------------------------------------------------
 
 @router.get("/project/{project_id}/latest-preview")
 def latest_preview(project_id: str):
-    ensure_ai_projects_table()
-    ensure_ai_preview_runs_table()
-
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT id, created_at, result
-        FROM ai_preview_runs
-        WHERE project_id = %s
-        ORDER BY created_at DESC
-        LIMIT 1
-        """,
-        (project_id,),
-    )
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
+    with get_conn() as conn, conn.cursor() as cur:
+        # result::text: the stored JSON is passed through as-is instead of
+        # being decoded by psycopg2 and re-encoded for the response
+        cur.execute(
+            """
+            SELECT id, created_at, result::text
+            FROM ai_preview_runs
+            WHERE project_id = %s
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            (project_id,),
+        )
+        row = cur.fetchone()
 
     if not row:
         raise HTTPException(status_code=404, detail="no preview runs found")
 
-    run_id, created_at, result = row
-    return {
-        "ok": True,
-        "project_id": project_id,
-        "run_id": str(run_id),
-        "created_at": created_at,
-        "result": result,
-    }
+    run_id, created_at, result_text = row
+    head = orjson.dumps(
+        {
+            "ok": True,
+            "project_id": project_id,
+            "run_id": str(run_id),
+            "created_at": created_at,
+        }
+    )
+    body = head[:-1] + b',"result":' + result_text.encode("utf-8") + b"}"
+    return Response(content=body, media_type="application/json")
 
 # ---------------------------------------------------------
 # Contract introspection endpoint
 # ---------------------------------------------------------
 
+# The contract is constant per deployment: encode it once
+_CONTRACT_JSON = orjson.dumps(get_ai_answer_presence_contract())
+
+
 @router.get("/contract")
-def contract():
+async def contract():
     """
     Returns the locked request/response schema for this tool.
     Used by frontend generators (Lovable, etc.) and tests.
     """
-    return get_ai_answer_presence_contract()
+    return Response(content=_CONTRACT_JSON, media_type="application/json")
 
 # ---------------------------------------------------------
 # Create project endpoint
@@ -251,22 +510,18 @@ def create_project(payload: dict = Body(...)):
     if not website:
         raise HTTPException(status_code=400, detail="website is required")
 
-    project_id = str(uuid.uuid4())
+    project_id = new_id()
 
     try:
-        ensure_ai_projects_table()
-        conn = get_conn()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO ai_projects (id, website, topics, competitors, questions)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (project_id, website, Json(topics), Json(competitors), Json(questions)),
-        )
-        conn.commit()
-        cur.close()
-        conn.close()
+        with get_conn() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO ai_projects (id, website, topics, competitors, questions)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                (project_id, website, Json(topics), Json(competitors), Json(questions)),
+            )
+            conn.commit()
         return {"ok": True, "project_id": project_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Project insert failed: {type(e).__name__}: {e}")
@@ -281,33 +536,12 @@ def debug_seed_run():
     if os.getenv("ENV") == "production":
         raise HTTPException(status_code=403, detail="disabled in production")
 
-    # Ensure legacy tables still exist (no-op if already)
-    ensure_ai_projects_table()
-    ensure_ai_preview_runs_table()
-
-    # Ensure phase 1 tables exist
-    from db import (
-        ensure_projects_table,
-        ensure_entities_table,
-        ensure_question_sets_table,
-        ensure_runs_table,
-        ensure_run_items_table,
-        ensure_analysis_items_table,
-    )
-
-    ensure_projects_table()
-    ensure_entities_table()
-    ensure_question_sets_table()
-    ensure_runs_table()
-    ensure_run_items_table()
-    ensure_analysis_items_table()
-
-    project_id = str(uuid.uuid4())
-    entity_id = str(uuid.uuid4())
-    qs_id = str(uuid.uuid4())
-    run_id = str(uuid.uuid4())
-    run_item_id = str(uuid.uuid4())
-    analysis_id = str(uuid.uuid4())
+    project_id = new_id()
+    entity_id = new_id()
+    qs_id = new_id()
+    run_id = new_id()
+    run_item_id = new_id()
+    analysis_id = new_id()
 
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     prompt_version = os.getenv("PROMPT_VERSION", "v1")
@@ -316,92 +550,55 @@ def debug_seed_run():
 
     question_text = "Seed question: does this schema work?"
 
-    conn = get_conn()
-    cur = conn.cursor()
+    now = datetime.now(timezone.utc)
 
-    # projects
-    cur.execute(
-        "INSERT INTO projects (id, name) VALUES (%s, %s)",
-        (project_id, "seed project"),
-    )
+    # All six rows in one statement batch: a single round trip to Postgres.
+    # Seed data is disposable, so this transaction's commit doesn't wait
+    # for the WAL flush.
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SET LOCAL synchronous_commit = off;
 
-    # entities
-    cur.execute(
-        """
-        INSERT INTO entities (id, project_id, type, name, website, brand_terms)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        """,
-        (entity_id, project_id, "customer", "Seed brand", "https://example.com", Json(["Seed brand"])),
-    )
+            INSERT INTO projects (id, name)
+            VALUES (%(project_id)s, 'seed project');
 
-    # question_sets
-    cur.execute(
-        """
-        INSERT INTO question_sets (id, project_id, version, questions)
-        VALUES (%s, %s, %s, %s)
-        """,
-        (qs_id, project_id, qs_version, Json([question_text])),
-    )
+            INSERT INTO entities (id, project_id, type, name, website, brand_terms)
+            VALUES (%(entity_id)s, %(project_id)s, 'customer', 'Seed brand', 'https://example.com', %(brand_terms)s);
 
-    # runs
-    now = datetime.now(timezone.utc)
-    cur.execute(
-        """
-        INSERT INTO runs (id, project_id, question_set_version, model, prompt_version, status, started_at, finished_at, input_snapshot)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """,
-        (
-            run_id,
-            project_id,
-            qs_version,
-            model,
-            prompt_version,
-            "succeeded",
-            now,
-            now,
-            Json({"seed": True, "prompt_template": "seed"}),
-        ),
-    )
+            INSERT INTO question_sets (id, project_id, version, questions)
+            VALUES (%(qs_id)s, %(project_id)s, %(qs_version)s, %(questions)s);
 
-    # run_items
-    cur.execute(
-        """
-        INSERT INTO run_items (id, run_id, entity_id, question_index, question_text, raw_answer, raw_meta, error)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """,
-        (
-            run_item_id,
-            run_id,
-            entity_id,
-            0,
-            question_text,
-            "Seed raw answer text",
-            Json({"seed": True}),
-            None,
-        ),
-    )
+            INSERT INTO runs (id, project_id, question_set_version, model, prompt_version, status, started_at, finished_at, input_snapshot)
+            VALUES (%(run_id)s, %(project_id)s, %(qs_version)s, %(model)s, %(prompt_version)s, 'succeeded', %(now)s, %(now)s, %(input_snapshot)s);
 
-    # analysis_items
-    cur.execute(
-        """
-        INSERT INTO analysis_items (id, run_item_id, analyzer_version, brand_mentioned, competitors_mentioned, strength_score, evidence_snippet, summary)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """,
-        (
-            analysis_id,
-            run_item_id,
-            analyzer_version,
-            True,
-            Json([]),
-            1.0,
-            "Seed brand",
-            "Seed analysis summary",
-        ),
-    )
+            INSERT INTO run_items (id, run_id, entity_id, question_index, question_text, raw_answer, raw_meta, error)
+            VALUES (%(run_item_id)s, %(run_id)s, %(entity_id)s, 0, %(question_text)s, 'Seed raw answer text', %(raw_meta)s, NULL);
 
-    conn.commit()
-    cur.close()
-    conn.close()
+            INSERT INTO analysis_items (id, run_item_id, analyzer_version, brand_mentioned, competitors_mentioned, strength_score, evidence_snippet, summary)
+            VALUES (%(analysis_id)s, %(run_item_id)s, %(analyzer_version)s, TRUE, %(competitors)s, 1.0, 'Seed brand', 'Seed analysis summary');
+            """,
+            {
+                "project_id": project_id,
+                "entity_id": entity_id,
+                "qs_id": qs_id,
+                "run_id": run_id,
+                "run_item_id": run_item_id,
+                "analysis_id": analysis_id,
+                "qs_version": qs_version,
+                "model": model,
+                "prompt_version": prompt_version,
+                "analyzer_version": analyzer_version,
+                "question_text": question_text,
+                "now": now,
+                "brand_terms": Json(["Seed brand"]),
+                "questions": Json([question_text]),
+                "input_snapshot": Json({"seed": True, "prompt_template": "seed"}),
+                "raw_meta": Json({"seed": True}),
+                "competitors": Json([]),
+            },
+        )
+        conn.commit()
 
     return {
         "ok": True,
@@ -428,22 +625,34 @@ def _safe_usage_to_json(usage: Any) -> Any:
         pass
     return str(usage)
 
-def _call_openai_with_retries(
+# Transient failures; anything else (bad request, auth, quota) fails fast
+OPENAI_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+# Added to every retry delay so concurrent /run calls don't retry in lockstep
+OPENAI_BACKOFF_JITTER_S = 0.25
+async def _call_openai_with_retries(
     *,
     api_key: str,
     model: str,
     prompt: str,
     max_retries: int = 3,
     base_backoff_s: float = 0.6,
+    text_format: Optional[Dict[str, Any]] = None,
+    expected_qis: Optional[Tuple[int, ...]] = None,
 ) -> Tuple[Optional[str], Dict[str, Any], Optional[Dict[str, Any]]]:
     """
     Returns: (raw_answer, raw_meta, error_obj)
+
+    text_format, when given, is passed through as the Responses API text=
+    (structured output); the cache key is the prompt, which already differs.
+
+    Answers are cached by (model, prompt); a hit is returned without a call
+    and its raw_meta is marked cached. For a grouped call, expected_qis are
+    the question indexes asked: the answer is only cached if it covers all.
     """
-    try:
-        from openai import RateLimitError, APIError, APITimeoutError, APIConnectionError  # type: ignore
-        retryable = (RateLimitError, APIError, APITimeoutError, APIConnectionError)
-    except Exception:
-        retryable = (Exception,)
+    cache_key = _answer_cache_key(model, prompt)
+    cached = _answer_cache.get(cache_key)
+    if cached is not None:
+        return cached[0], {**cached[1], "cached": True}, None
 
     attempts = 0
     last_err: Optional[Dict[str, Any]] = None
@@ -452,9 +661,13 @@ def _call_openai_with_retries(
 
     while attempts <= max_retries:
         attempts += 1
+        # Same account budget as arc-rank-checker's calls
+        await llm_limiter.acquire(len(prompt or "") // LLM_CHARS_PER_TOKEN)
         try:
-            client = OpenAI(api_key=api_key)
-            resp = client.responses.create(model=model, input=prompt)
+            # This loop owns the retries, so the SDK's own are turned off
+            resp = await _async_openai(api_key).with_options(max_retries=0).responses.create(
+                model=model, input=prompt, **({"text": text_format} if text_format else {})
+            )
             raw_answer = (getattr(resp, "output_text", "") or "").strip()
 
             raw_meta: Dict[str, Any] = {
@@ -470,20 +683,20 @@ def _call_openai_with_retries(
             if usage is not None:
                 raw_meta["usage"] = _safe_usage_to_json(usage)
 
+            if expected_qis is None or _grouped_answers(raw_answer).keys() >= set(expected_qis):
+                _answer_cache[cache_key] = (raw_answer, raw_meta)
             return raw_answer, raw_meta, None
 
-        except retryable as e:
+        except Exception as e:
             last_err = {"type": type(e).__name__, "message": str(e)[:800], "attempts": attempts}
-            if attempts > max_retries:
+            if attempts > max_retries or not is_retryable_openai_error(e, OPENAI_RETRYABLE_STATUS):
                 break
 
-            sleep_s = base_backoff_s * (2 ** (attempts - 1))
+            # Never sooner than OpenAI's Retry-After, plus jitter
+            sleep_s = max(retry_after_seconds(e) or 0.0, base_backoff_s * (2 ** (attempts - 1)))
+            sleep_s += random.uniform(0, OPENAI_BACKOFF_JITTER_S)
             backoff_total_s += sleep_s
-            time.sleep(sleep_s)
-
-        except Exception as e:
-            last_err = {"type": type(e).__name__, "message": str(e)[:800], "attempts": attempts}
-            break
+            await asyncio.sleep(sleep_s)
 
     raw_meta = {
         "model": model,
@@ -494,27 +707,301 @@ def _call_openai_with_retries(
     }
     return None, raw_meta, last_err
 
+# ---------------------------------------------------------
+# Batch API mode for /run (half price, results within 24h)
+# ---------------------------------------------------------
+
+BATCH_ACTIVE_STATUSES = {"validating", "in_progress", "finalizing", "cancelling"}
+
+
+def _batch_custom_id(entity_id: str, qi: int) -> str:
+    return f"{entity_id}:{qi}"
+
+
+def _queue_batch_run(run_id: str, batch: Dict[str, Any]) -> None:
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE runs
+            SET status = 'queued',
+                input_snapshot = jsonb_set(input_snapshot, '{batch}', %s::jsonb, true)
+            WHERE id = %s
+            """,
+            (orjson.dumps(batch).decode(), run_id),
+        )
+        conn.commit()
+
+
+def _load_batch_run(run_id: str) -> Optional[tuple]:
+    """Returns (status, model, batch, questions) for a run, or None."""
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT r.status, r.model, r.input_snapshot->'batch', qs.questions
+            FROM runs r
+            LEFT JOIN question_sets qs
+              ON qs.project_id = r.project_id AND qs.version = r.question_set_version
+            WHERE r.id = %s
+            """,
+            (run_id,),
+        )
+        return cur.fetchone()
+
+
+def _response_body_text(body: Dict[str, Any]) -> str:
+    # Raw Responses API JSON has no output_text shortcut; join the text parts
+    return "".join(
+        part.get("text", "")
+        for item in body.get("output") or []
+        if item.get("type") == "message"
+        for part in item.get("content") or []
+        if part.get("type") == "output_text"
+    ).strip()
+
+
+def _batch_result_row(run_id: str, model: str, batch_id: str, questions: list, line: Dict[str, Any]) -> Optional[tuple]:
+    entity_id, _, qi = (line.get("custom_id") or "").rpartition(":")
+    if not entity_id or not qi.isdigit() or int(qi) >= len(questions):
+        return None
+    qi = int(qi)
+
+    response = line.get("response") or {}
+    body = response.get("body") or {}
+    raw_meta: Dict[str, Any] = {
+        "model": model,
+        "batch_id": batch_id,
+        "response_id": body.get("id"),
+    }
+    if body.get("usage") is not None:
+        raw_meta["usage"] = body["usage"]
+
+    raw_answer = None
+    err_obj = None
+    if line.get("error"):
+        err_obj = {"type": "BatchError", "message": str(line["error"])[:800]}
+    elif response.get("status_code") != 200:
+        err_obj = {
+            "type": "BatchError",
+            "message": str(body.get("error") or body)[:800],
+            "status_code": response.get("status_code"),
+        }
+    else:
+        raw_answer = _response_body_text(body)
+
+    return (
+        new_id(),
+        run_id,
+        entity_id,
+        qi,
+        str(questions[qi]),
+        raw_answer,
+        Json(raw_meta),
+        Json(err_obj) if err_obj else None,
+    )
+
+
 # ---------------------------------------------------------
 # Phase 2: Fetch layer endpoint (fills run_items for entities × questions)
 # Optimized: concurrency + retries + batch inserts + progress updates
 # ---------------------------------------------------------
 
-@router.post("/run")
-def run_fetch(payload: dict = Body(...)):
-    # Ensure phase 1 tables exist
-    from db import (
-        ensure_projects_table,
-        ensure_entities_table,
-        ensure_question_sets_table,
-        ensure_runs_table,
-        ensure_run_items_table,
+def _create_fetch_run(
+    run_id: str,
+    project_id: str,
+    question_set_version: str,
+    questions: list,
+    entity_specs: list,
+    model: str,
+    prompt_version: str,
+    topics: Any,
+    competitors: Any,
+    settings: Dict[str, Any],
+) -> list:
+    """
+    Writes the project, question set, entities and the running run as one
+    multi-statement execute (one round trip); returns [(entity_id, spec)].
+    """
+    entity_rows = [(new_id(), es) for es in entity_specs]
+    total_items = len(entity_rows) * len(questions)
+
+    with get_conn() as conn, conn.cursor() as cur:
+        entity_values = b",".join(
+            cur.mogrify(
+                "(%s, %s, %s, %s, %s, %s)",
+                (entity_id, project_id, es["type"], es["name"], es["website"], Json(es["brand_terms"])),
+            )
+            for entity_id, es in entity_rows
+        )
+        statements = [
+            cur.mogrify(
+                "INSERT INTO projects (id, name) VALUES (%s, %s)",
+                (project_id, "phase2 project"),
+            ),
+            cur.mogrify(
+                "INSERT INTO question_sets (id, project_id, version, questions) VALUES (%s, %s, %s, %s)",
+                (new_id(), project_id, question_set_version, Json(questions)),
+            ),
+            # All entities in one multi-row INSERT
+            b"INSERT INTO entities (id, project_id, type, name, website, brand_terms) VALUES " + entity_values,
+            cur.mogrify(
+                """
+                INSERT INTO runs (id, project_id, question_set_version, model, prompt_version, status, started_at, input_snapshot)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    run_id,
+                    project_id,
+                    question_set_version,
+                    model,
+                    prompt_version,
+                    "running",
+                    datetime.now(timezone.utc),
+                    Json({
+                        "prompt_template": "phase2_fetch_v2",
+                        "topics": topics,
+                        "competitors": competitors,
+                        "progress": {"total": total_items, "done": 0, "errors": 0},
+                        "settings": settings,
+                    }),
+                ),
+            ),
+            cur.mogrify(
+                "INSERT INTO run_progress (run_id, total) VALUES (%s, %s)",
+                (run_id, total_items),
+            ),
+        ]
+        cur.execute(b";\n".join(statements))
+        conn.commit()
+
+    return entity_rows
+
+
+# Flushes at least this big (e.g. a large batch-mode refresh) are loaded
+# with COPY into a temp table and upserted from there
+RUN_ITEMS_COPY_MIN_ROWS = 500
+
+_RUN_ITEMS_COLUMNS = "id, run_id, entity_id, question_index, question_text, raw_answer, raw_meta, error"
+
+
+def _copy_field(value: Any) -> str:
+    # COPY text format: \N is NULL; backslash, tab and newlines are escaped
+    if value is None:
+        return "\\N"
+    if isinstance(value, Json):
+        value = value.dumps(value.adapted)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_run_items(cur, rows: list) -> bytes:
+    """COPYs rows into the session's run_items_copy temp table; returns the INSERT ... SELECT out of it."""
+    cur.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS run_items_copy (LIKE run_items INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
     )
-    ensure_projects_table()
-    ensure_entities_table()
-    ensure_question_sets_table()
-    ensure_runs_table()
-    ensure_run_items_table()
+    data = "".join("\t".join(_copy_field(v) for v in row) + "\n" for row in rows)
+    cur.copy_expert(f"COPY run_items_copy ({_RUN_ITEMS_COLUMNS}) FROM STDIN", io.StringIO(data))
+    return f"INSERT INTO run_items ({_RUN_ITEMS_COLUMNS}) SELECT {_RUN_ITEMS_COLUMNS} FROM run_items_copy".encode()
+
+
+def _insert_run_items(
+    cur,
+    run_id: str,
+    rows: list,
+    progress: Dict[str, int],
+    status: Optional[str] = None,
+    cache_rows: list = (),
+) -> None:
+    """
+    Upserts a flush of run_items, updates the run's progress (and, on the
+    last flush, its status) and stores new answers in llm_response_cache as
+    one multi-statement execute: one round trip.
+    """
+    statements = [
+        cur.mogrify(
+            "UPDATE run_progress SET total = %s, done = %s, errors = %s, updated_at = now() WHERE run_id = %s",
+            (progress["total"], progress["done"], progress["errors"], run_id),
+        )
+    ]
+    if status is not None:
+        # The final counts are also kept with the run's input_snapshot
+        statements.append(
+            cur.mogrify(
+                """
+                UPDATE runs
+                SET input_snapshot = jsonb_set(input_snapshot, '{progress}', %s::jsonb, true),
+                    status = %s, finished_at = %s
+                WHERE id = %s
+                """,
+                (orjson.dumps(progress).decode(), status, datetime.now(timezone.utc), run_id),
+            )
+        )
 
+    if rows:
+        if len(rows) >= RUN_ITEMS_COPY_MIN_ROWS:
+            insert = _copy_run_items(cur, rows)
+        else:
+            # One multi-row INSERT per flush instead of one statement per row
+            values = b",".join(cur.mogrify("(%s, %s, %s, %s, %s, %s, %s, %s)", row) for row in rows)
+            insert = f"INSERT INTO run_items ({_RUN_ITEMS_COLUMNS}) VALUES ".encode() + values
+        statements.insert(
+            0,
+            insert
+            + b""" ON CONFLICT (run_id, entity_id, question_index) DO UPDATE
+            SET raw_answer = EXCLUDED.raw_answer, raw_meta = EXCLUDED.raw_meta, error = EXCLUDED.error""",
+        )
+    if cache_rows:
+        # (key, model, response); a re-asked expired key is refreshed in place
+        values = b",".join(cur.mogrify("(%s, %s, %s)", row) for row in cache_rows)
+        statements.append(
+            b"INSERT INTO llm_response_cache (key, model, response) VALUES "
+            + values
+            + b""" ON CONFLICT (key) DO UPDATE
+            SET response = EXCLUDED.response, created_at = EXCLUDED.created_at"""
+        )
+    cur.execute(b";\n".join(statements))
+
+
+def _flush_run_items(run_id: str, rows: list, progress: Dict[str, int], cache_rows: list = ()) -> None:
+    with get_conn() as conn, conn.cursor() as cur:
+        _insert_run_items(cur, run_id, rows, progress, cache_rows=cache_rows)
+        conn.commit()
+
+
+def _finish_fetch_run(
+    run_id: str, rows: list, progress: Dict[str, int], status: str, cache_rows: list = ()
+) -> None:
+    with get_conn() as conn, conn.cursor() as cur:
+        _insert_run_items(cur, run_id, rows, progress, status, cache_rows)
+        conn.commit()
+
+
+# Upper bound on the questions_per_call knob of /run
+RUN_MAX_QUESTIONS_PER_CALL = 20
+
+
+def _grouped_answers(raw_answer: Optional[str]) -> Dict[int, str]:
+    """question_index -> answer, from a RUN_ANSWERS_TEXT_FORMAT response."""
+    try:
+        parsed = orjson.loads(raw_answer or "")
+    except orjson.JSONDecodeError:
+        return {}
+    answers = parsed.get("answers") if isinstance(parsed, dict) else None
+    if not isinstance(answers, list):
+        return {}
+    return {
+        a["qi"]: a["answer"]
+        for a in answers
+        if isinstance(a, dict) and isinstance(a.get("qi"), int) and isinstance(a.get("answer"), str)
+    }
+
+
+@router.post("/run")
+async def run_fetch(payload: dict = Body(...)):
     website = (payload.get("website") or "").strip()
     topics = payload.get("topics") or []
     competitors = payload.get("competitors") or []
@@ -559,183 +1046,265 @@ def run_fetch(payload: dict = Body(...)):
     if not isinstance(max_retries, int) or max_retries < 0:
         max_retries = 3
 
-    run_id = str(uuid.uuid4())
-    project_id = str(uuid.uuid4())
-
-    prompt_template = (
-        "You are an assistant.\n"
-        "Entity: {entity_name}\n"
-        "Website: {entity_website}\n"
-        "Topics: {topics}\n"
-        "Competitors: {competitors}\n\n"
-        "Question: {question}\n"
+    # Sync mode only: ask up to this many of an entity's questions in one
+    # call, sharing the prompt prefix. 1 (default) = one free-text answer per call
+    questions_per_call = payload.get("questions_per_call")
+    if not isinstance(questions_per_call, int) or questions_per_call <= 0:
+        questions_per_call = 1
+    questions_per_call = min(questions_per_call, RUN_MAX_QUESTIONS_PER_CALL)
+
+    # "batch": queue every call on OpenAI's Batch API and collect the
+    # answers later with POST /run/{run_id}/refresh
+    mode = payload.get("mode") or "sync"
+    if mode not in ("sync", "batch"):
+        raise HTTPException(status_code=400, detail="mode must be 'sync' or 'batch'")
+
+    run_id = new_id()
+    project_id = new_id()
+
+    # Prompt "phase2_fetch_v2". Everything shared by the run's calls comes
+    # first and is rendered once, so every call starts with the same bytes
+    # (OpenAI's prompt cache matches on prefixes); the entity lines and the
+    # question come last.
+    shared_prefix = (
+        f"You are an assistant.\n"
+        f"Topics: {orjson.dumps(topics).decode()}\n"
+        f"Competitors: {orjson.dumps(competitors).decode()}\n\n"
     )
-
-    conn = get_conn()
-    cur = conn.cursor()
-
-    # Create project
-    cur.execute(
-        "INSERT INTO projects (id, name) VALUES (%s, %s)",
-        (project_id, "phase2 project"),
-    )
-
-    # Create question set
-    qs_id = str(uuid.uuid4())
-    cur.execute(
-        "INSERT INTO question_sets (id, project_id, version, questions) VALUES (%s, %s, %s, %s)",
-        (qs_id, project_id, question_set_version, Json(questions)),
+    group_prefix = (
+        f"{shared_prefix}"
+        f"Answer each question below on its own, as if it were the only one asked.\n"
+        f"Return one answer per question, with qi set to its number.\n\n"
     )
+    question_texts = [str(q) for q in questions]
+
+    def render_prompt(es: dict, qi: int) -> str:
+        return (
+            f"{shared_prefix}"
+            f"Entity: {es['name']}\n"
+            f"Website: {es['website'] or ''}\n"
+            f"Question: {question_texts[qi]}\n"
+        )
 
-    # Create entities
-    entity_rows = []
-    for es in entity_specs:
-        entity_id = str(uuid.uuid4())
-        entity_rows.append((entity_id, es))
-        cur.execute(
-            """
-            INSERT INTO entities (id, project_id, type, name, website, brand_terms)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            """,
-            (entity_id, project_id, es["type"], es["name"], es["website"], Json(es["brand_terms"])),
+    def render_group_prompt(es: dict, qis: Tuple[int, ...]) -> str:
+        return (
+            f"{group_prefix}"
+            f"Entity: {es['name']}\n"
+            f"Website: {es['website'] or ''}\n"
+            + "".join(f"Question {qi}: {question_texts[qi]}\n" for qi in qis)
         )
 
+    settings = {
+        "max_concurrency": max_concurrency,
+        "max_retries": max_retries,
+        "mode": mode,
+        "questions_per_call": questions_per_call,
+    }
+    entity_rows = await asyncio.to_thread(
+        _create_fetch_run,
+        run_id,
+        project_id,
+        question_set_version,
+        questions,
+        entity_specs,
+        model,
+        prompt_version,
+        topics,
+        competitors,
+        settings,
+    )
     total_items = len(entity_rows) * len(questions)
 
-    # Create run
-    started = datetime.now(timezone.utc)
-    cur.execute(
-        """
-        INSERT INTO runs (id, project_id, question_set_version, model, prompt_version, status, started_at, input_snapshot)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """,
-        (
-            run_id,
-            project_id,
-            question_set_version,
-            model,
-            prompt_version,
-            "running",
-            started,
-            Json({
-                "prompt_template": "phase2_fetch_v1",
-                "topics": topics,
-                "competitors": competitors,
-                "progress": {"total": total_items, "done": 0, "errors": 0},
-                "settings": {"max_concurrency": max_concurrency, "max_retries": max_retries},
-            }),
-        ),
-    )
-    conn.commit()
-
-    def build_task(entity_id: str, es: dict, qi: int, q: str):
-        prompt = prompt_template.format(
-            entity_name=es["name"],
-            entity_website=es["website"] or "",
-            topics=topics,
-            competitors=competitors,
-            question=str(q),
+    if mode == "batch":
+        return await _submit_batch_run(
+            api_key, model, run_id, project_id, entity_rows, questions, render_prompt, settings
         )
-        return entity_id, qi, str(q), prompt
-
-    tasks = []
-    for (entity_id, es) in entity_rows:
-        for qi, q in enumerate(questions):
-            tasks.append(build_task(entity_id, es, qi, q))
 
     created = 0
     errors = 0
 
-    # Batch insert buffer
-    batch_size = 25
+    # Batch insert buffer. Each flush is one multi-row INSERT, so bigger
+    # batches mean fewer round trips and commits per run
+    batch_size = 200
+    # ... or sooner once this long has passed, so progress keeps moving
+    flush_interval_s = 1.0
+    last_flush = time.monotonic()
     buffer_rows = []
+    # New answers for llm_response_cache, written with the same flushes
+    buffer_cache = []
 
-    def worker(task):
-        entity_id, qi, q_text, prompt = task
-        raw_answer, raw_meta, err_obj = _call_openai_with_retries(
-            api_key=api_key,
-            model=model,
-            prompt=prompt,
-            max_retries=max_retries,
-        )
-        item_id = str(uuid.uuid4())
-        return item_id, entity_id, qi, q_text, raw_answer, raw_meta, err_obj
+    # Caps in-flight OpenAI calls (and so the request rate) per run
+    sem = asyncio.Semaphore(max_concurrency)
 
-    def flush_buffer():
-        nonlocal buffer_rows, created, errors
-        if not buffer_rows:
-            return
+    grouped = questions_per_call > 1
+    question_groups = [
+        tuple(range(start, min(start + questions_per_call, len(questions))))
+        for start in range(0, len(questions), questions_per_call)
+    ]
 
-        cur.executemany(
-            """
-            INSERT INTO run_items (id, run_id, entity_id, question_index, question_text, raw_answer, raw_meta, error)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """,
-            buffer_rows,
-        )
-        buffer_rows = []
+    # Identical prompts (e.g. a competitor listed twice) are asked once; the
+    # answer is fanned back out to every (entity, questions) that rendered it
+    prompt_targets: Dict[str, list] = {}
+    for (entity_id, es) in entity_rows:
+        for qis in question_groups:
+            prompt = render_group_prompt(es, qis) if grouped else render_prompt(es, qis[0])
+            prompt_targets.setdefault(prompt, []).append((entity_id, qis))
+
+    # Answers other workers (or earlier deploys) already paid for are pulled
+    # into the in-process cache with one query, ahead of the fan-out
+    cache_keys = {prompt: _answer_cache_key(model, prompt) for prompt in prompt_targets}
+    uncached = [key for key in cache_keys.values() if key not in _answer_cache]
+    if uncached:
+        _answer_cache.update(await asyncio.to_thread(_load_cached_answers, uncached))
+
+    async def fetch(prompt: str, targets: list):
+        async with sem:
+            raw_answer, raw_meta, err_obj = await _call_openai_with_retries(
+                api_key=api_key,
+                model=model,
+                prompt=prompt,
+                max_retries=max_retries,
+                text_format=RUN_ANSWERS_TEXT_FORMAT if grouped else None,
+                # Every target of a prompt asks the same questions
+                expected_qis=targets[0][1] if grouped else None,
+            )
+        return prompt, targets, raw_answer, raw_meta, err_obj
 
-        # Update progress inside input_snapshot (no schema changes needed)
-        progress_json = json.dumps({"total": total_items, "done": created, "errors": errors})
-        cur.execute(
-            """
-            UPDATE runs
-            SET input_snapshot = jsonb_set(input_snapshot, '{progress}', %s::jsonb, true)
-            WHERE id = %s
-            """,
-            (progress_json, run_id),
-        )
-        conn.commit()
+    tasks = [asyncio.ensure_future(fetch(prompt, targets)) for prompt, targets in prompt_targets.items()]
 
-    with ThreadPoolExecutor(max_workers=max_concurrency) as ex:
-        futures = [ex.submit(worker, t) for t in tasks]
-        for fut in as_completed(futures):
-            item_id, entity_id, qi, q_text, raw_answer, raw_meta, err_obj = fut.result()
+    # Flushes are handed to a single writer task, so collecting answers
+    # never waits on the database; the writer keeps the flushes in order
+    flush_q: asyncio.Queue = asyncio.Queue()
 
-            buffer_rows.append(
-                (
-                    item_id,
-                    run_id,
-                    entity_id,
-                    qi,
-                    q_text,
-                    raw_answer,
-                    Json(raw_meta),
-                    Json(err_obj) if err_obj else None,
-                )
-            )
+    async def writer():
+        while (batch := await flush_q.get()) is not None:
+            await asyncio.to_thread(_flush_run_items, run_id, *batch)
 
-            created += 1
-            if err_obj:
-                errors += 1
+    writer_task = asyncio.create_task(writer())
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            prompt, targets, raw_answer, raw_meta, err_obj = await next_done
+            answers = _grouped_answers(raw_answer) if grouped and not err_obj else None
+            # A grouped answer missing any question is not cached, so the
+            # next run asks again instead of replaying MissingAnswer
+            complete = answers is None or answers.keys() >= set(targets[0][1])
+            if not err_obj and not raw_meta.get("cached") and complete:
+                buffer_cache.append(
+                    (cache_keys[prompt], model, Json({"raw_answer": raw_answer, "raw_meta": raw_meta}))
+                )
 
-            if len(buffer_rows) >= batch_size:
-                flush_buffer()
+            for entity_id, qis in targets:
+                for qi in qis:
+                    answer, item_err = raw_answer, err_obj
+                    if answers is not None:
+                        answer = answers.get(qi)
+                        if answer is None:
+                            item_err = {"type": "MissingAnswer", "message": f"no answer for question {qi} in the grouped response"}
+
+                    buffer_rows.append(
+                        (
+                            new_id(),
+                            run_id,
+                            entity_id,
+                            qi,
+                            question_texts[qi],
+                            answer,
+                            Json(raw_meta),
+                            Json(item_err) if item_err else None,
+                        )
+                    )
+
+                    created += 1
+                    if item_err:
+                        errors += 1
+
+            if len(buffer_rows) >= batch_size or time.monotonic() - last_flush >= flush_interval_s:
+                last_flush = time.monotonic()
+                rows, buffer_rows = buffer_rows, []
+                cache_rows, buffer_cache = buffer_cache, []
+                progress = {"total": total_items, "done": created, "errors": errors}
+                if writer_task.done():
+                    writer_task.result()  # a failed write stops the run here
+                flush_q.put_nowait((rows, progress, cache_rows))
+
+        flush_q.put_nowait(None)
+        await writer_task
+    except Exception:
+        # A failed write ends the run: stop the remaining calls and mark the
+        # run failed so it doesn't sit in 'running' forever
+        for t in tasks:
+            t.cancel()
+        progress = {"total": total_items, "done": created, "errors": errors}
+        try:
+            await asyncio.to_thread(_finish_fetch_run, run_id, [], progress, "failed", [])
+        except Exception:
+            pass  # the original error is the one worth raising
+        raise
+    finally:
+        writer_task.cancel()
 
     # Final flush
-    flush_buffer()
-
-    finished = datetime.now(timezone.utc)
+    progress = {"total": total_items, "done": created, "errors": errors}
     status = "succeeded" if created > 0 else "failed"
-    cur.execute(
-        "UPDATE runs SET status=%s, finished_at=%s WHERE id=%s",
-        (status, finished, run_id),
-    )
+    await asyncio.to_thread(_finish_fetch_run, run_id, buffer_rows, progress, status, buffer_cache)
 
-    # Final progress update
-    final_progress_json = json.dumps({"total": total_items, "done": created, "errors": errors})
-    cur.execute(
-        """
-        UPDATE runs
-        SET input_snapshot = jsonb_set(input_snapshot, '{progress}', %s::jsonb, true)
-        WHERE id = %s
-        """,
-        (final_progress_json, run_id),
-    )
+    return {
+        "ok": True,
+        "run_id": run_id,
+        "project_id": project_id,
+        "entities_count": len(entity_rows),
+        "questions_count": len(questions),
+        "run_items_created": created,
+        "run_items_errors": errors,
+        "status": status,
+        "settings": settings,
+    }
 
-    conn.commit()
-    cur.close()
-    conn.close()
+
+async def _submit_batch_run(
+    api_key: str,
+    model: str,
+    run_id: str,
+    project_id: str,
+    entity_rows: list,
+    questions: list,
+    render_prompt,
+    settings: Dict[str, Any],
+) -> Dict[str, Any]:
+    lines = [
+        orjson.dumps(
+            {
+                "custom_id": _batch_custom_id(entity_id, qi),
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {"model": model, "input": render_prompt(es, qi)},
+            }
+        )
+        for (entity_id, es) in entity_rows
+        for qi in range(len(questions))
+    ]
+    total_items = len(lines)
+
+    client = _async_openai(api_key)
+    try:
+        input_file = await client.files.create(
+            file=(f"run-{run_id}.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/responses",
+            completion_window="24h",
+            metadata={"run_id": run_id},
+        )
+    except Exception as e:
+        progress = {"total": total_items, "done": 0, "errors": 0}
+        await asyncio.to_thread(_finish_fetch_run, run_id, [], progress, "failed")
+        raise HTTPException(status_code=502, detail=f"Batch submit failed: {type(e).__name__}: {e}")
+
+    await asyncio.to_thread(
+        _queue_batch_run, run_id, {"id": batch.id, "input_file_id": input_file.id}
+    )
 
     return {
         "ok": True,
@@ -743,8 +1312,76 @@ def run_fetch(payload: dict = Body(...)):
         "project_id": project_id,
         "entities_count": len(entity_rows),
         "questions_count": len(questions),
+        "run_items_created": 0,
+        "run_items_errors": 0,
+        "status": "queued",
+        "batch_id": batch.id,
+        "settings": settings,
+    }
+
+
+@router.post("/run/{run_id}/refresh")
+async def refresh_batch_run(run_id: str):
+    """
+    Checks a mode="batch" run. Once OpenAI has finished the batch, its
+    answers are written to run_items and the run is closed.
+    """
+    row = await asyncio.to_thread(_load_batch_run, run_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="run not found")
+
+    status, model, batch_info, questions = row
+    if not batch_info:
+        raise HTTPException(status_code=400, detail="run was not submitted in batch mode")
+    batch_id = batch_info["id"]
+
+    if status in ("succeeded", "failed"):
+        return {"ok": True, "run_id": run_id, "status": status, "batch_id": batch_id}
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise HTTPException(status_code=500, detail="OPENAI_API_KEY is missing on server")
+    client = _async_openai(api_key)
+
+    batch = await client.batches.retrieve(batch_id)
+    counts = batch.request_counts.model_dump() if batch.request_counts else None
+    if batch.status in BATCH_ACTIVE_STATUSES:
+        return {
+            "ok": True,
+            "run_id": run_id,
+            "status": status,
+            "batch_id": batch_id,
+            "batch_status": batch.status,
+            "request_counts": counts,
+        }
+
+    # completed / failed / expired / cancelled: keep whatever came back
+    questions = questions or []
+    rows = []
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        content = await client.files.content(file_id)
+        for raw in content.text.splitlines():
+            if not raw.strip():
+                continue
+            result_row = _batch_result_row(run_id, model, batch_id, questions, orjson.loads(raw))
+            if result_row is not None:
+                rows.append(result_row)
+
+    errors = sum(1 for r in rows if r[7] is not None)
+    created = len(rows)
+    status = "succeeded" if created > 0 else "failed"
+    progress = {"total": counts["total"] if counts else created, "done": created, "errors": errors}
+    await asyncio.to_thread(_finish_fetch_run, run_id, rows, progress, status)
+
+    return {
+        "ok": True,
+        "run_id": run_id,
+        "status": status,
+        "batch_id": batch_id,
+        "batch_status": batch.status,
+        "request_counts": counts,
         "run_items_created": created,
         "run_items_errors": errors,
-        "status": status,
-        "settings": {"max_concurrency": max_concurrency, "max_retries": max_retries},
-    }
\ No newline at end of file
+    }
@@ -1,56 +1,330 @@
 import os
-import json
 import time
+import hashlib
+import re
+import random
+import asyncio
+import multiprocessing
 import urllib.parse
-from datetime import datetime
-from typing import Dict, Any
-
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Annotated, Dict, Any, List, Optional, Tuple
+
+import httpx
+import fastjsonschema
+import jiter
+import orjson
+import tiktoken
+import lxml.html
+from cachetools import TTLCache
+from lxml import etree
 from readability import Document
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from openai import OpenAI, RateLimitError
+from fastapi.responses import StreamingResponse
+from pydantic import AfterValidator, BaseModel, Field, HttpUrl, TypeAdapter, ValidationError
+from openai import (
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    APIConnectionError,
+    APIStatusError,
+    RateLimitError,
+)
+
+from schemas.arc_rank_checker import (
+    BATCH_REPORT_RESPONSE_FORMAT,
+    FINISHED_REPORT_SCHEMA,
+    FINISHED_REPORT_SCHEMA_SHA256,
+    REPORT_RESPONSE_FORMAT,
+)
+from schemas import arc_rank_checker_validator as _generated_validator
+from tools.openai_limits import (
+    LLM_CHARS_PER_TOKEN,
+    is_retryable_openai_error,
+    llm_limiter,
+    retry_after_seconds,
+)
 
 # -------------------------------------------------------------------
 # Config
 # -------------------------------------------------------------------
 
-MAX_TEXT_CHARS = 8000
+# Body text is collected up to MAX_TEXT_CHARS, then trimmed to MAX_TEXT_TOKENS
+# so the prompt size does not depend on the page's script (Latin vs CJK).
+# MAX_TEXT_CHARS only bounds the extraction work: at ~4 chars/token English
+# text it is ~4000 tokens and CJK far more, so the token cap always binds
+# first; keep it comfortably above MAX_TEXT_TOKENS * LLM_CHARS_PER_TOKEN
+MAX_TEXT_CHARS = 16000
+MAX_TEXT_TOKENS = 2500
 MAX_HTML_CHARS = 6000
 
+# Force UTF-8 since we always hand lxml an already-decoded page
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# Text inside these tags is never visible page copy
+_NON_TEXT_TAGS = ("script", "style", "template")
+MAX_H2_HEADINGS = 10
+# 0 parses pages in a thread; N > 0 uses N worker processes so heavy pages
+# don't hold this process's GIL
+PARSE_WORKERS = int(os.getenv("ARC_PARSE_WORKERS", "0"))
+
+# Metadata selectors, compiled once and evaluated in libxml2
+_XP_TITLE = etree.XPath("string((//title)[1])", smart_strings=False)
+_XP_DESCRIPTION = etree.XPath(
+    "string((//meta[@name='description'])[1]/@content)", smart_strings=False
+)
+_XP_H1 = etree.XPath("string((//h1)[1])", smart_strings=False)
+
+# URL path segments that classify a page (matched as whole segments)
+_COLLECTION_PATH = re.compile(r"(?:^|/)(?:categor(?:y|ies)|tags?|sections?|topics?)(?:/|$)")
+_PRODUCT_PATH = re.compile(r"(?:^|/)(?:products?|shop|cart)(?:/|$)")
+
+LLM_MODEL = "gpt-4o-mini"
+# Per-attempt bounds on the report call (a full report is ~2-3k tokens)
+LLM_TIMEOUT_S = 60.0
+LLM_MAX_TOKENS = 4000
+
+# /analyze-batch packs several pages into one completion; the cap keeps
+# LLM_MAX_TOKENS per page within the model's 16k output limit
+BATCH_MAX_URLS = 4
+LLM_BATCH_MAX_TOKENS = 16000
+
+# /analyze/stream re-parses the partial model output after this many new chars
+STREAM_PARSE_EVERY_CHARS = 256
+
+# score_matrix key -> weight in the final 0-100 score (weights sum to 1.0)
+SCORE_WEIGHTS = (
+    ("summary_block", 0.15),
+    ("definitions", 0.10),
+    ("faq", 0.10),
+    ("fanout_match", 0.20),
+    ("canonical_resources", 0.10),
+    ("structure", 0.10),
+    ("clarity", 0.10),
+    ("eeat", 0.15),
+)
+
+# Backoff for transient OpenAI failures (429 / 5xx / timeouts)
+LLM_MAX_ATTEMPTS = 8
+LLM_BACKOFF_BASE_S = 1.0
+LLM_BACKOFF_CAP_S = 30.0
+LLM_BACKOFF_JITTER_S = 0.5
+LLM_RETRYABLE_STATUS = {429, 502, 503}
+# All OpenAI calls share one pooled HTTP/2 connection to api.openai.com
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+MAX_URL_LENGTH = 2048
+
+# Page fetches share one pooled client (keep-alive / TLS reuse per origin)
+FETCH_TIMEOUT_S = 15
+FETCH_USER_AGENT = "QueryArcBot/1.0 (+https://queryarc.com)"
+FETCH_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# Only the first MAX_FETCH_BYTES of a page are downloaded and parsed
+MAX_FETCH_BYTES = 2_000_000
+FETCH_CHUNK_BYTES = 65536
+
+# Reports for identical (url, html) pairs are reused instead of re-asking the LLM
+ANALYSIS_CACHE_SIZE = 1024
+ANALYSIS_CACHE_TTL_S = 3600
+# Within this window a repeat URL is served from cache without fetching;
+# after it, the page is revalidated with If-None-Match / If-Modified-Since
+URL_REVALIDATE_AFTER_S = 300
+
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+# Retries are handled by _call_llm_with_backoff, not by the SDK
+client = (
+    AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        timeout=LLM_TIMEOUT_S,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(limits=LLM_HTTP_LIMITS, http2=True),
+    )
+    if OPENAI_API_KEY
+    else None
+)
+
+# -------------------------------------------------------------------
+# Prompts
+# -------------------------------------------------------------------
+
+# Evaluation rules only: the report structure is enforced by
+# REPORT_RESPONSE_FORMAT (strict structured outputs)
+SYSTEM_PROMPT = """
+You are an LLM-SEO evaluator. Fill in the JSON report defined by the response schema.
+
+Scores:
+- Block scores and score_matrix entries are integers 0-10.
+- score_matrix.final_score and executive_summary.overall_llm_readiness_score are integers 0-100.
+
+Rules:
+- recommended_definitions: at least 3 items when possible.
+- recommended_faqs: at least 5 items when possible.
+- canonical_resources_block.recommended_resources: at least 3 items;
+  first item MUST be the analyzed page URL.
+- If content is thin, still infer helpful definitions, FAQ, and resources from
+  URL, title, and visible text.
+- Keep explanations concise and practical.
+"""
+
+# User prompt with page-specific data (filled with str.format_map)
+USER_PROMPT_TEMPLATE = """
+Analyze this web page and fill the JSON report.
+
+Metadata:
+- URL: {url}
+- Crawl status: {crawl_status}
+- Detected language: {detected_language}
+- Content type: {content_type}
+- Last crawled: {last_crawled}
+- LLM version: {llm_version}
+- Word count: {word_count}
+- Token estimate: {tokens}
+- Processing time (seconds): {processing_time}
+
+CLEAN TEXT (trimmed):
+{text}
+
+HTML SNIPPET (trimmed):
+{cleaned_html}
+
+Use the clean text as your main signal. Use HTML only for structure (headings, sections, presence of FAQ/definitions).
+If the page is thin or mostly UI, still propose an ideal summary, definitions, FAQ, and canonical resources
+for what this page appears to be about.
+
+Return ONLY the JSON object.
+"""
+
+# Part of the LLM output cache key, so prompt or schema edits invalidate it
+PROMPT_FINGERPRINT = hashlib.sha256(
+    orjson.dumps([SYSTEM_PROMPT, USER_PROMPT_TEMPLATE, REPORT_RESPONSE_FORMAT])
+).hexdigest()[:16]
+
+# Prepended to the per-page prompts of a batch request
+BATCH_PROMPT_HEADER = """
+Several web pages follow, each introduced by a PAGE line with its id.
+Evaluate every page independently, exactly as you would a single page.
+Return one entry in results per page, with id set to that page's id.
+"""
 
 router = APIRouter(
     prefix="/api/tools/arc-rank-checker",
     tags=["arc-rank-checker"],
 )
 
-class AnalyzeRequest(BaseModel):
-    url: str
+_http_client: Optional[httpx.AsyncClient] = None
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+# (url, sha256(html)) -> orjson-encoded report, before apply_scoring_algorithm
+_analysis_cache: TTLCache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL_S)
+# url -> (analysis cache key, etag, last_modified, checked_at)
+_url_validators: TTLCache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL_S)
+# sha256(model, prompt, page content) -> orjson-encoded raw LLM output. Pages
+# whose HTML changes on every fetch (nonces, ads) but whose text doesn't hit here
+_llm_output_cache: TTLCache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL_S)
+# In-flight analyses, so concurrent duplicates share one LLM call
+_analysis_inflight: Dict[Tuple[str, str], "asyncio.Future[bytes]"] = {}
+# [epoch second, formatted timestamp] for _now_iso
+_ts_cache: list = [0, ""]
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+# An explicit scheme at the start; "://" later on (e.g. in a query) is not one
+_URL_SCHEME_RE = re.compile(r"\s*([A-Za-z][A-Za-z0-9+.-]*)://")
+
+
+def _check_url(value: str) -> str:
+    # Only a missing scheme is filled in; ftp://, file:// etc. are rejected
+    scheme = _URL_SCHEME_RE.match(value)
+    if scheme and scheme.group(1).lower() not in ("http", "https"):
+        raise ValueError("only http(s) URLs are supported")
+    url = _normalize_url(value)
+    try:
+        _HTTP_URL.validate_python(url)
+    except ValidationError:
+        raise ValueError("not a valid http(s) URL")
+    return url
+
 
+# Rejected at the request boundary, before any fetch; scheme-less input is
+# still accepted and normalized to https://
+AnalyzeURL = Annotated[str, Field(min_length=1, max_length=MAX_URL_LENGTH), AfterValidator(_check_url)]
 
-def extract_page_metadata(html: str, url: str) -> Dict[str, Any]:
-    soup = BeautifulSoup(html, "html.parser")
 
-    title = (soup.title.string or "").strip() if soup.title and soup.title.string else ""
+class AnalyzeRequest(BaseModel):
+    url: AnalyzeURL
+
+
+class AnalyzeBatchRequest(BaseModel):
+    urls: List[AnalyzeURL] = Field(..., min_length=1, max_length=BATCH_MAX_URLS)
+
+
+def parse_html(html: str) -> lxml.html.HtmlElement:
+    if not html.strip():
+        return lxml.html.document_fromstring("<html></html>")
+    return lxml.html.document_fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+
+
+def bounded_text(el: lxml.html.HtmlElement, cap: int) -> str:
+    """Newline-joined visible text of el, stopping once cap chars are collected."""
+    out = []
+    n = 0
+    for s in el.itertext():
+        s = s.strip()
+        if not s:
+            continue
+        out.append(s)
+        n += len(s) + 1
+        if n >= cap:
+            break
+    return "\n".join(out)[:cap]
+
+
+def bounded_html(el: lxml.html.HtmlElement, cap: int) -> str:
+    """Serialized children of el, stopping once cap chars are collected."""
+    out = [el.text or ""]
+    n = len(out[0])
+    for child in el:
+        if n >= cap:
+            break
+        chunk = lxml.html.tostring(child, encoding="unicode")
+        out.append(chunk)
+        n += len(chunk)
+    return "".join(out)[:cap]
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> Optional["tiktoken.Encoding"]:
+    # The BPE file is downloaded on first use; without it, trim by characters
+    try:
+        return tiktoken.encoding_for_model(LLM_MODEL)
+    except Exception:
+        return None
 
-    desc_tag = soup.find("meta", attrs={"name": "description"})
-    meta_description = desc_tag.get("content", "").strip() if desc_tag else ""
 
-    h1_tag = soup.find("h1")
-    h1 = h1_tag.get_text(strip=True) if h1_tag else ""
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    enc = _token_encoding()
+    if enc is None:
+        return text[: max_tokens * LLM_CHARS_PER_TOKEN]
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
 
-    h2_tags = soup.find_all("h2")
-    h2_headings = [h.get_text(strip=True) for h in h2_tags[:10]]
 
-    html_tag = soup.find("html")
+def extract_page_metadata(tree: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
+    title = _XP_TITLE(tree).strip()
+    meta_description = _XP_DESCRIPTION(tree).strip()
+    h1 = _XP_H1(tree).strip()
+
+    h2_headings = [
+        h.text_content().strip() for h in islice(tree.iter("h2"), MAX_H2_HEADINGS)
+    ]
+
     detected_language = ""
-    if html_tag and html_tag.get("lang"):
-        detected_language = html_tag.get("lang").split("-")[0].lower()
+    if tree.get("lang"):
+        detected_language = tree.get("lang").split("-")[0].lower()
 
     return {
         "url": url,
@@ -62,87 +336,26 @@ def extract_page_metadata(html: str, url: str) -> Dict[str, Any]:
     }
 
 
-def validate_llm_output(data: dict):
-    required_top = [
-        "page_metadata",
-        "executive_summary",
-        "llm_interpretation",
-        "summary_block",
-        "definitions_block",
-        "fanout_query_analysis",
-        "faq_block",
-        "canonical_resources_block",
-        "content_structure",
-        "clarity_readability",
-        "eeat_block",
-        "score_matrix",
-        "fix_roadmap",
-        "raw_data",
-    ]
-    missing_top = [k for k in required_top if k not in data]
-    if missing_top:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid format: missing top-level keys {missing_top}",
-        )
+# Straight-line Python checks generated ahead of time by scripts/gen_validator.py;
+# compiled here instead if the schema changed without regenerating
+if _generated_validator.SCHEMA_SHA256 == FINISHED_REPORT_SCHEMA_SHA256:
+    _validate_report = _generated_validator.validate
+else:
+    _validate_report = fastjsonschema.compile(FINISHED_REPORT_SCHEMA)
 
-    sm = data.get("score_matrix", {})
-    required_scores = [
-        "summary_block",
-        "definitions",
-        "faq",
-        "fanout_match",
-        "canonical_resources",
-        "structure",
-        "clarity",
-        "eeat",
-        "final_score",
-    ]
-    missing_scores = [k for k in required_scores if k not in sm]
-    if missing_scores:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid format: missing score_matrix keys {missing_scores}",
-        )
-
-    if not isinstance(sm.get("final_score"), int):
-        raise HTTPException(
-            status_code=422,
-            detail="Invalid format: score_matrix.final_score must be an integer",
-        )
-
-    ex = data.get("executive_summary", {})
-    if "overall_llm_readiness_score" not in ex or "verdict" not in ex:
-        raise HTTPException(
-            status_code=422,
-            detail="Invalid format: executive_summary must contain overall_llm_readiness_score and verdict",
-        )
 
+def validate_llm_output(data: dict):
+    try:
+        _validate_report(data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        raise HTTPException(status_code=422, detail=f"Invalid format: {e.message}")
     return True
 
 
 def apply_scoring_algorithm(report: dict) -> dict:
     sm = report.get("score_matrix", {})
 
-    summary = sm.get("summary_block", 0)
-    definitions = sm.get("definitions", 0)
-    faq = sm.get("faq", 0)
-    fanout = sm.get("fanout_match", 0)
-    canonical_resources = sm.get("canonical_resources", 0)
-    structure = sm.get("structure", 0)
-    clarity = sm.get("clarity", 0)
-    eeat = sm.get("eeat", 0)
-
-    base = (
-        summary * 0.15
-        + definitions * 0.10
-        + faq * 0.10
-        + fanout * 0.20
-        + canonical_resources * 0.10
-        + structure * 0.10
-        + clarity * 0.10
-        + eeat * 0.15
-    )
+    base = sum(sm.get(key, 0) * weight for key, weight in SCORE_WEIGHTS)
 
     final_score = round(base * 10)
 
@@ -171,255 +384,657 @@ def apply_scoring_algorithm(report: dict) -> dict:
     return report
 
 
-def run_llm_seo_analysis(url: str) -> dict:
-    url = url.strip()
-    if not url.startswith("http://") and not url.startswith("https://"):
-        url = "https://" + url
+def _now_iso() -> str:
+    """UTC timestamp with 1-second resolution, formatted once per second."""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))]
+    return _ts_cache[1]
 
-    start_time = time.time()
 
+def _parse_page(html: str, url: str) -> Tuple[Dict[str, Any], str, str, int]:
+    """
+    CPU-bound part of the pipeline (lxml + readability).
+    Returns: (metadata, text, cleaned_html, word_count)
+    """
+    # One parse of the raw page, reused for metadata and the body fallback
     try:
-        response = requests.get(url, timeout=15)
-        html = response.text
-        crawl_status = "success" if response.status_code == 200 else "partial"
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {str(e)}")
-
-    try:
-        metadata = extract_page_metadata(html, url)
+        tree = parse_html(html)
+        metadata = extract_page_metadata(tree, url)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to extract metadata: {str(e)}")
 
     try:
+        etree.strip_elements(tree, *_NON_TEXT_TAGS, with_tail=False)
+
         doc = Document(html)
         cleaned_html = doc.summary()
-        soup = BeautifulSoup(cleaned_html, "html.parser")
+        summary_tree = parse_html(cleaned_html)
 
-        text = soup.get_text("\n", strip=True)[:MAX_TEXT_CHARS]
+        text = bounded_text(summary_tree, MAX_TEXT_CHARS)
         word_count = len(text.split()) if text else 0
 
         if word_count < 150:
-            soup_full = BeautifulSoup(html, "html.parser")
-            body = soup_full.body or soup_full
-            full_text = body.get_text("\n", strip=True)[:MAX_TEXT_CHARS]
+            body = tree.body if tree.find("body") is not None else tree
+            full_text = bounded_text(body, MAX_TEXT_CHARS)
             full_wc = len(full_text.split()) if full_text else 0
             if full_wc > word_count:
                 text = full_text
-                cleaned_html = str(body)
+                cleaned_html = bounded_html(body, MAX_HTML_CHARS)
                 word_count = full_wc
 
         cleaned_html = cleaned_html[:MAX_HTML_CHARS]
 
+        trimmed = trim_to_tokens(text, MAX_TEXT_TOKENS)
+        if len(trimmed) < len(text):
+            text = trimmed
+            word_count = len(text.split())
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process HTML: {str(e)}")
 
-    tokens = word_count
-    processing_time = round(time.time() - start_time, 3)
-
-    parsed_url = urllib.parse.urlparse(url)
-    path = parsed_url.path or "/"
-    lower_path = path.lower()
-    if path == "/" or path == "":
-        content_type = "homepage"
-    elif any(seg in lower_path for seg in ["category", "tag", "section", "topics"]):
-        content_type = "collection"
-    elif any(seg in lower_path for seg in ["product", "shop", "cart"]):
-        content_type = "product"
-    else:
-        content_type = "article"
-
-    detected_language = metadata.get("detected_language", "en")
-    last_crawled = datetime.utcnow().isoformat() + "Z"
-    llm_version = "gpt-4o-mini"
-    
-    # Compact system prompt: defines structure and rules
-    system_prompt = """
-You are an LLM-SEO evaluator. Output strict json only.
-
-The json must have these top-level keys:
-- page_metadata
-- executive_summary
-- llm_interpretation
-- summary_block
-- definitions_block
-- fanout_query_analysis
-- faq_block
-- canonical_resources_block
-- content_structure
-- clarity_readability
-- eeat_block
-- score_matrix
-- fix_roadmap
-- raw_data
-
-Required inner fields (exact keys):
-
-page_metadata:
-  url, crawl_status, detected_language, content_type, word_count, last_crawled, llm_version
-
-executive_summary:
-  overall_llm_readiness_score (int 0-100),
-  verdict ("Ready" | "Partially Ready" | "Needs Work" | "Poor"),
-  main_issue (string),
-  top_3_fixes (array of strings)
-
-llm_interpretation:
-  primary_topic, secondary_topics (array), detected_intent,
-  summary_llm_generated, key_claims_llm_detected (array), confidence_level
-
-summary_block:
-  score (0-10), found (bool), quality, problems (array), recommended_summary_block
-
-definitions_block:
-  score (0-10), found (bool),
-  missing_critical_terms (array),
-  quality_problems (array),
-  recommended_definitions (array of {term, definition})
-
-fanout_query_analysis:
-  sub_questions_generated (array of {question, matched_content, match_quality, missing_answer_note}),
-  coverage_score (0-10),
-  main_gaps (array)
-
-faq_block:
-  score (0-10), found (bool),
-  quality_problems (array),
-  recommended_faqs (array of {q, a})
-
-canonical_resources_block:
-  score (0-10), found (bool),
-  missing_resources (array),
-  why_it_matters (string),
-  recommended_resources (array of {title, url})
-
-content_structure:
-  score (0-10),
-  headings_quality, visual_structure,
-  problems (array),
-  recommended_structure_changes (array)
-
-clarity_readability:
-  score (0-10),
-  issues (array of strings),
-  fixes (array of strings)
-
-eeat_block:
-  score (0-10),
-  author_info_found (bool),
-  expertise_visibility,
-  experience_signals,
-  trust_signals,
-  missing_elements (array)
-
-score_matrix:
-  summary_block, definitions, faq, fanout_match,
-  canonical_resources, structure, clarity, eeat (0-10 each),
-  final_score (int 0-100)
-
-fix_roadmap:
-  immediate_fixes_next_24h (array),
-  medium_priority_next_7_days (array),
-  long_term_next_30_days (array)
-
-raw_data:
-  clean_text, html_extracted, tokens, processing_time
-
-Rules:
-- Never omit required keys.
-- recommended_definitions: at least 3 items when possible.
-- recommended_faqs: at least 5 items when possible.
-- canonical_resources_block.recommended_resources: at least 3 items;
-  first item MUST be the analyzed page URL.
-- If content is thin, still infer helpful definitions, FAQ, and resources from
-  URL, title, and visible text.
-- Keep explanations concise and practical.
-- Output JSON object only, no extra text.
-"""
-
-    # User prompt with page-specific data
-    user_prompt = f"""
-Analyze this web page and fill the JSON report.
+    return metadata, text, cleaned_html, word_count
 
-Metadata:
-- URL: {url}
-- Crawl status: {crawl_status}
-- Detected language: {detected_language}
-- Content type: {content_type}
-- Last crawled: {last_crawled}
-- LLM version: {llm_version}
-- Word count: {word_count}
-- Token estimate: {tokens}
-- Processing time (seconds): {processing_time}
 
-CLEAN TEXT (trimmed):
-{text}
-
-HTML SNIPPET (trimmed):
-{cleaned_html}
-
-Use the clean text as your main signal. Use HTML only for structure (headings, sections, presence of FAQ/definitions).
-If the page is thin or mostly UI, still propose an ideal summary, definitions, FAQ, and canonical resources
-for what this page appears to be about.
-
-Return ONLY the JSON object.
-"""
-
-    
+def _parse_page_worker(html: str, url: str) -> Tuple[Optional[tuple], Optional[tuple]]:
+    """
+    _parse_page for a worker process. HTTPException can't be pickled back,
+    so failures come back as (None, (status_code, detail)).
+    """
+    try:
+        return _parse_page(html, url), None
+    except HTTPException as e:
+        return None, (e.status_code, e.detail)
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        # spawn: forking a process that already runs threads can deadlock
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+async def parse_page(html: str, url: str) -> Tuple[Dict[str, Any], str, str, int]:
+    """Runs _parse_page off the event loop (thread or worker process)."""
+    if PARSE_WORKERS <= 0:
+        return await asyncio.to_thread(_parse_page, html, url)
+
+    loop = asyncio.get_running_loop()
+    result, error = await loop.run_in_executor(_get_parse_pool(), _parse_page_worker, html, url)
+    if error is not None:
+        raise HTTPException(status_code=error[0], detail=error[1])
+    return result
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=FETCH_TIMEOUT_S,
+            follow_redirects=True,
+            limits=FETCH_LIMITS,
+            http2=True,
+            headers={"User-Agent": FETCH_USER_AGENT},
+        )
+    return _http_client
+
+
+async def fetch_page(
+    url: str, headers: Optional[Dict[str, str]] = None
+) -> Tuple[str, int, httpx.Headers]:
+    """
+    Streams the page and stops reading at MAX_FETCH_BYTES.
+    Returns: (html, status_code, response headers)
+    """
+    async with get_http_client().stream("GET", url, headers=headers) as response:
+        chunks = []
+        total = 0
+        async for chunk in response.aiter_bytes(FETCH_CHUNK_BYTES):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_FETCH_BYTES:
+                break
+        body = b"".join(chunks)[:MAX_FETCH_BYTES]
+        html = body.decode(response.encoding or "utf-8", errors="replace")
+    return html, response.status_code, response.headers
+
+
+async def close_clients() -> None:
+    """Called from the app shutdown hook."""
+    global _http_client, _parse_pool
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if client is not None:
+        await client.close()
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
+
+async def _call_llm_with_backoff(
+    messages: list, response_format: dict, max_tokens: int, stream: bool = False
+):
+    """
+    chat.completions.create with exponential backoff + jitter.
+    Honors Retry-After when OpenAI sends it. Re-raises the last error once
+    LLM_MAX_ATTEMPTS is reached or the error is not retryable. With stream=True
+    only opening the stream is retried.
+    """
+    # OpenAI counts max_tokens against TPM up front, so budget for it too
+    estimated_tokens = (
+        sum(len(m["content"]) for m in messages) // LLM_CHARS_PER_TOKEN + max_tokens
+    )
+    attempt = 0
+    while True:
+        await llm_limiter.acquire(estimated_tokens)
+        try:
+            return await client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=messages,
+                temperature=0.2,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                stream=stream,
+            )
+        except (APIStatusError, APIConnectionError) as e:
+            attempt += 1
+            if attempt >= LLM_MAX_ATTEMPTS or not is_retryable_openai_error(e, LLM_RETRYABLE_STATUS):
+                raise
+
+            delay = retry_after_seconds(e)
+            if delay is None:
+                delay = LLM_BACKOFF_BASE_S * (2 ** (attempt - 1))
+            delay = min(LLM_BACKOFF_CAP_S, delay) + random.uniform(0, LLM_BACKOFF_JITTER_S)
+            await asyncio.sleep(delay)
+
+
+def _require_client() -> None:
     if client is None:
         raise HTTPException(
             status_code=500,
             detail="OPENAI_API_KEY is not set. The server can run, but /api/tools/arc-rank-checker/analyze requires the key.",
         )
 
-    try:
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"},
-        )
-    except RateLimitError:
-        raise HTTPException(
+
+def _llm_http_error(err: Exception) -> HTTPException:
+    if isinstance(err, RateLimitError):
+        return HTTPException(
             status_code=429,
             detail="OpenAI quota exceeded or no credits available. Check your billing.",
         )
+    return HTTPException(status_code=500, detail=f"LLM error: {str(err)}")
+
+
+def _report_messages(user_prompt: str) -> list:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+async def _complete_json(user_prompt: str, response_format: dict, max_tokens: int) -> dict:
+    """Runs the LLM call and returns its parsed JSON, mapping failures to HTTPException."""
+    _require_client()
+    try:
+        completion = await _call_llm_with_backoff(
+            _report_messages(user_prompt), response_format, max_tokens
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"LLM error: {str(e)}")
+        raise _llm_http_error(e)
 
-    raw_content = completion.choices[0].message.content
+    choice = completion.choices[0]
+    if choice.finish_reason == "length":
+        raise HTTPException(status_code=500, detail="Model output was cut off at the max_tokens limit.")
+
+    raw_content = choice.message.content
     if raw_content is None:
         raise HTTPException(status_code=500, detail="Model returned empty content.")
 
     try:
-        parsed = raw_content if isinstance(raw_content, dict) else json.loads(raw_content)
+        return raw_content if isinstance(raw_content, dict) else orjson.loads(raw_content)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Model returned malformed JSON: {str(e)}")
 
+
+def _normalize_url(url: str) -> str:
+    url = url.strip()
+    if not url.lower().startswith(("http://", "https://")):
+        url = "https://" + url
+    return url
+
+
+def _fresh_cached_report(url: str, now: float) -> Optional[dict]:
+    """Report for a URL analyzed within URL_REVALIDATE_AFTER_S, without fetching."""
+    known = _url_validators.get(url)
+    if known is None or now - known[3] >= URL_REVALIDATE_AFTER_S:
+        return None
+    blob = _analysis_cache.get(known[0])
+    if blob is None:
+        return None
+    return _report_from_cache(blob, recrawled=False)
+
+
+def _remember_validators(url: str, key: Tuple[str, str], status_code: int, headers: httpx.Headers) -> None:
+    # Only successful fetches are worth revalidating later
+    if status_code == 200:
+        _url_validators[url] = (
+            key,
+            headers.get("etag"),
+            headers.get("last-modified"),
+            time.time(),
+        )
+
+
+async def _fetch_or_cached(url: str, start_time: float) -> Tuple[Optional[dict], Optional[tuple]]:
+    """
+    Fetch step shared by /analyze and /analyze/stream.
+    Returns (report, None) when a cached report can be served, otherwise
+    (None, (html, crawl_status, cache_key, status_code, headers)).
+    """
+    cached = _fresh_cached_report(url, start_time)
+    if cached is not None:
+        return cached, None
+
+    conditional: Dict[str, str] = {}
+    known = _url_validators.get(url)
+    if known is not None and known[0] in _analysis_cache:
+        if known[1]:
+            conditional["If-None-Match"] = known[1]
+        if known[2]:
+            conditional["If-Modified-Since"] = known[2]
+
+    try:
+        html, status_code, headers = await fetch_page(url, conditional or None)
+        if status_code == 304 and known is not None:
+            blob = _analysis_cache.get(known[0])
+            if blob is not None:
+                _url_validators[url] = (known[0], known[1], known[2], time.time())
+                return _report_from_cache(blob, recrawled=True), None
+            # Evicted while revalidating: fall back to a full fetch
+            html, status_code, headers = await fetch_page(url)
+        crawl_status = "success" if status_code == 200 else "partial"
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {str(e)}")
+
+    key = (url, hashlib.sha256(html.encode("utf-8")).hexdigest())
+    blob = _analysis_cache.get(key)
+    if blob is not None:
+        _remember_validators(url, key, status_code, headers)
+        return _report_from_cache(blob, recrawled=True), None
+    return None, (html, crawl_status, key, status_code, headers)
+
+
+async def run_llm_seo_analysis(url: str) -> dict:
+    url = _normalize_url(url)
+    start_time = time.time()
+
+    report, fetched = await _fetch_or_cached(url, start_time)
+    if report is not None:
+        return report
+    html, crawl_status, key, status_code, headers = fetched
+
+    task = _analysis_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_analyze_html(url, html, crawl_status, start_time, key))
+        _analysis_inflight[key] = task
+        task.add_done_callback(lambda _t: _analysis_inflight.pop(key, None))
+    # shield: a disconnecting client must not cancel the shared analysis
+    blob = await asyncio.shield(task)
+
+    _remember_validators(url, key, status_code, headers)
+    return _report_from_cache(blob, recrawled=True)
+
+
+def _report_from_cache(blob: bytes, recrawled: bool) -> dict:
+    # Decoding the cached bytes gives every caller its own copy to score
+    report = orjson.loads(blob)
+    if recrawled:
+        report["page_metadata"]["last_crawled"] = _now_iso()
+    return apply_scoring_algorithm(report)
+
+
+async def _prepare_analysis(url: str, html: str, crawl_status: str, start_time: float) -> Dict[str, Any]:
+    """
+    Parses the page and collects the server-side fields of the report.
+    The returned dict doubles as the USER_PROMPT_TEMPLATE mapping.
+    """
+    # Keep parsing off the event loop so other requests keep flowing
+    metadata, text, cleaned_html, word_count = await parse_page(html, url)
+
+    parsed_url = urllib.parse.urlparse(url)
+    path = parsed_url.path or "/"
+    lower_path = path.lower()
+    if path == "/" or path == "":
+        content_type = "homepage"
+    elif _COLLECTION_PATH.search(lower_path):
+        content_type = "collection"
+    elif _PRODUCT_PATH.search(lower_path):
+        content_type = "product"
+    else:
+        content_type = "article"
+
+    return {
+        "url": url,
+        "crawl_status": crawl_status,
+        "detected_language": metadata.get("detected_language", "en"),
+        "content_type": content_type,
+        "last_crawled": _now_iso(),
+        "llm_version": LLM_MODEL,
+        "word_count": word_count,
+        "tokens": word_count,
+        "processing_time": round(time.time() - start_time, 3),
+        "text": text,
+        "cleaned_html": cleaned_html,
+    }
+
+
+def _finalize_report(parsed: dict, page: Dict[str, Any]) -> bytes:
+    """Fills the server-side fields, validates, and encodes the report for the cache."""
     parsed.setdefault("page_metadata", {})
     parsed.setdefault("raw_data", {})
     parsed.setdefault("score_matrix", {})
     parsed.setdefault("executive_summary", {})
-    parsed["page_metadata"]["url"] = url
-    parsed["page_metadata"]["crawl_status"] = crawl_status
-    parsed["page_metadata"]["detected_language"] = detected_language
-    parsed["page_metadata"]["content_type"] = content_type
-    parsed["page_metadata"]["word_count"] = word_count
-    parsed["page_metadata"]["last_crawled"] = last_crawled
-    parsed["page_metadata"]["llm_version"] = llm_version
-
-    parsed["raw_data"]["clean_text"] = text
-    parsed["raw_data"]["html_extracted"] = cleaned_html
-    parsed["raw_data"]["tokens"] = tokens
-    parsed["raw_data"]["processing_time"] = processing_time
+    parsed["page_metadata"]["url"] = page["url"]
+    parsed["page_metadata"]["crawl_status"] = page["crawl_status"]
+    parsed["page_metadata"]["detected_language"] = page["detected_language"]
+    parsed["page_metadata"]["content_type"] = page["content_type"]
+    parsed["page_metadata"]["word_count"] = page["word_count"]
+    parsed["page_metadata"]["last_crawled"] = page["last_crawled"]
+    parsed["page_metadata"]["llm_version"] = page["llm_version"]
+
+    parsed["raw_data"]["clean_text"] = page["text"]
+    parsed["raw_data"]["html_extracted"] = page["cleaned_html"]
+    parsed["raw_data"]["tokens"] = page["tokens"]
+    parsed["raw_data"]["processing_time"] = page["processing_time"]
 
     validate_llm_output(parsed)
-    parsed = apply_scoring_algorithm(parsed)
-    return parsed
+    return orjson.dumps(parsed)
+
+
+def _llm_cache_key(page: Dict[str, Any]) -> str:
+    # The page's text and identity only: timings and dates change every call, and
+    # the HTML snippet carries per-request markup (nonces, tracking attributes)
+    return hashlib.sha256(
+        orjson.dumps(
+            [
+                LLM_MODEL,
+                PROMPT_FINGERPRINT,
+                page["url"],
+                page["content_type"],
+                page["detected_language"],
+                page["text"],
+            ]
+        )
+    ).hexdigest()
+
+
+async def _analyze_html(
+    url: str,
+    html: str,
+    crawl_status: str,
+    start_time: float,
+    cache_key: Tuple[str, str],
+) -> bytes:
+    page = await _prepare_analysis(url, html, crawl_status, start_time)
+
+    llm_key = _llm_cache_key(page)
+    llm_blob = _llm_output_cache.get(llm_key)
+    if llm_blob is not None:
+        parsed = orjson.loads(llm_blob)
+    else:
+        parsed = await _complete_json(
+            USER_PROMPT_TEMPLATE.format_map(page), REPORT_RESPONSE_FORMAT, LLM_MAX_TOKENS
+        )
+        llm_blob = orjson.dumps(parsed)
+
+    blob = _finalize_report(parsed, page)
+    _llm_output_cache[llm_key] = llm_blob
+    _analysis_cache[cache_key] = blob
+    return blob
+
+
+async def _stream_report(
+    url: str,
+    html: str,
+    crawl_status: str,
+    start_time: float,
+    cache_key: Tuple[str, str],
+):
+    """
+    Streaming variant of _analyze_html. Yields {"type": "block"} events for
+    each top-level report key as soon as the model has finished writing it,
+    then the encoded, validated report (bytes) last.
+    """
+    page = await _prepare_analysis(url, html, crawl_status, start_time)
+
+    llm_key = _llm_cache_key(page)
+    llm_blob = _llm_output_cache.get(llm_key)
+    if llm_blob is not None:
+        parsed = orjson.loads(llm_blob)
+    else:
+        _require_client()
+        try:
+            stream = await _call_llm_with_backoff(
+                _report_messages(USER_PROMPT_TEMPLATE.format_map(page)),
+                REPORT_RESPONSE_FORMAT,
+                LLM_MAX_TOKENS,
+                stream=True,
+            )
+        except Exception as e:
+            raise _llm_http_error(e)
+
+        buf: List[str] = []
+        unparsed = 0
+        emitted = 0
+        finish_reason = None
+        async with stream:
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                    if not choice.delta.content:
+                        continue
+                    buf.append(choice.delta.content)
+                    unparsed += len(choice.delta.content)
+                    if unparsed < STREAM_PARSE_EVERY_CHARS:
+                        continue
+                    unparsed = 0
+
+                    # Every key except the last one present is complete
+                    partial = jiter.from_json("".join(buf).encode("utf-8"), partial_mode=True)
+                    if not isinstance(partial, dict):
+                        continue
+                    keys = list(partial)
+                    for key in keys[emitted:-1]:
+                        yield {"type": "block", "key": key, "value": partial[key]}
+                    emitted = max(emitted, len(keys) - 1)
+            except Exception as e:
+                raise _llm_http_error(e)
+
+        if finish_reason == "length":
+            raise HTTPException(status_code=500, detail="Model output was cut off at the max_tokens limit.")
+        try:
+            parsed = orjson.loads("".join(buf))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Model returned malformed JSON: {str(e)}")
+        llm_blob = orjson.dumps(parsed)
+        for key in list(parsed)[emitted:]:
+            yield {"type": "block", "key": key, "value": parsed[key]}
+
+    blob = _finalize_report(parsed, page)
+    _llm_output_cache[llm_key] = llm_blob
+    _analysis_cache[cache_key] = blob
+    yield blob
+
+
+def _ndjson(event: dict) -> bytes:
+    return orjson.dumps(event) + b"\n"
+
+
+async def _stream_analysis(url: str, start_time: float, report: Optional[dict], fetched: Optional[tuple]):
+    if report is not None:
+        yield _ndjson({"type": "report", "report": report})
+        return
+
+    html, crawl_status, key, status_code, headers = fetched
+    try:
+        task = _analysis_inflight.get(key)
+        if task is not None:
+            # Same page already being analyzed: wait for it instead of a second LLM call
+            blob = await asyncio.shield(task)
+        else:
+            # Registered like run_llm_seo_analysis's task, so a concurrent
+            # request for this page waits on this stream's result
+            fut = asyncio.get_running_loop().create_future()
+            _analysis_inflight[key] = fut
+            fut.add_done_callback(lambda _f: _analysis_inflight.pop(key, None))
+            blob = b""
+            try:
+                async for event in _stream_report(url, html, crawl_status, start_time, key):
+                    if isinstance(event, bytes):
+                        blob = event
+                    else:
+                        yield _ndjson(event)
+            except Exception as e:
+                fut.set_exception(e)
+                fut.exception()  # waiters re-raise it; don't warn if there are none
+                raise
+            finally:
+                if not fut.done():
+                    if blob:
+                        fut.set_result(blob)
+                    else:
+                        # Client went away before the report was built
+                        fut.set_exception(HTTPException(status_code=503, detail="Analysis was interrupted, please retry."))
+                        fut.exception()
+    except HTTPException as e:
+        yield _ndjson({"type": "error", "status": e.status_code, "detail": e.detail})
+        return
+
+    _remember_validators(url, key, status_code, headers)
+    yield _ndjson({"type": "report", "report": _report_from_cache(blob, recrawled=True)})
+
+
+async def run_llm_seo_batch(urls: List[str]) -> List[dict]:
+    """
+    Analyzes several URLs with a single LLM call.
+    Cached pages are answered from cache and left out of the prompt. A page
+    that fails yields an {"url", "error"} entry instead of failing the batch.
+    """
+    start_time = time.time()
+    urls = list(dict.fromkeys(_normalize_url(u) for u in urls))
+    results: Dict[str, dict] = {}
+    # (url, cache key, status_code, headers, prepared page)
+    pending: List[tuple] = []
+
+    async def collect(url: str) -> None:
+        cached = _fresh_cached_report(url, start_time)
+        if cached is not None:
+            results[url] = {"url": url, "report": cached}
+            return
+
+        try:
+            html, status_code, headers = await fetch_page(url)
+        except Exception as e:
+            results[url] = {"url": url, "error": f"Failed to fetch URL: {str(e)}"}
+            return
+
+        key = (url, hashlib.sha256(html.encode("utf-8")).hexdigest())
+        blob = _analysis_cache.get(key)
+        if blob is not None:
+            _remember_validators(url, key, status_code, headers)
+            results[url] = {"url": url, "report": _report_from_cache(blob, recrawled=True)}
+            return
+
+        crawl_status = "success" if status_code == 200 else "partial"
+        try:
+            page = await _prepare_analysis(url, html, crawl_status, start_time)
+        except Exception as e:
+            results[url] = {"url": url, "error": f"Failed to parse page: {str(e)}"}
+            return
+
+        llm_blob = _llm_output_cache.get(_llm_cache_key(page))
+        if llm_blob is None:
+            pending.append((url, key, status_code, headers, page))
+            return
+        try:
+            blob = _finalize_report(orjson.loads(llm_blob), page)
+        except HTTPException as e:
+            results[url] = {"url": url, "error": e.detail}
+            return
+        _analysis_cache[key] = blob
+        _remember_validators(url, key, status_code, headers)
+        results[url] = {"url": url, "report": _report_from_cache(blob, recrawled=False)}
+
+    await asyncio.gather(*(collect(u) for u in urls))
+
+    if pending:
+        user_prompt = BATCH_PROMPT_HEADER + "".join(
+            f"\n=== PAGE id={i} ===\n" + USER_PROMPT_TEMPLATE.format_map(entry[4])
+            for i, entry in enumerate(pending)
+        )
+        try:
+            parsed = await _complete_json(
+                user_prompt,
+                BATCH_REPORT_RESPONSE_FORMAT,
+                min(LLM_MAX_TOKENS * len(pending), LLM_BATCH_MAX_TOKENS),
+            )
+            reports = {item.pop("id", None): item for item in parsed.get("results", [])}
+        except HTTPException as e:
+            reports = {}
+            for url, *_ in pending:
+                results[url] = {"url": url, "error": e.detail}
+
+        for i, (url, key, status_code, headers, page) in enumerate(pending):
+            if url in results:
+                continue
+            report = reports.get(i)
+            if report is None:
+                results[url] = {"url": url, "error": "Model returned no report for this page."}
+                continue
+            llm_blob = orjson.dumps(report)
+            try:
+                blob = _finalize_report(report, page)
+            except HTTPException as e:
+                results[url] = {"url": url, "error": e.detail}
+                continue
+            _llm_output_cache[_llm_cache_key(page)] = llm_blob
+            _analysis_cache[key] = blob
+            _remember_validators(url, key, status_code, headers)
+            results[url] = {"url": url, "report": _report_from_cache(blob, recrawled=False)}
+
+    return [results[u] for u in urls]
 
 
 @router.post("/analyze")
-def api_analyze_page(payload: AnalyzeRequest):
-    return run_llm_seo_analysis(payload.url.strip())
\ No newline at end of file
+async def api_analyze_page(payload: AnalyzeRequest):
+    return await run_llm_seo_analysis(payload.url)
+
+
+@router.post("/analyze/stream")
+async def api_analyze_page_stream(payload: AnalyzeRequest):
+    """
+    NDJSON stream: "block" events carry the model's raw top-level blocks as
+    they complete; the final "report" event is the scored report (same body
+    as /analyze). Failures after the stream has started arrive as an "error"
+    event.
+    """
+    start_time = time.time()
+    report, fetched = await _fetch_or_cached(payload.url, start_time)
+    return StreamingResponse(
+        _stream_analysis(payload.url, start_time, report, fetched),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/analyze-batch")
+async def api_analyze_batch(payload: AnalyzeBatchRequest):
+    return {"results": await run_llm_seo_batch(payload.urls)}
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import time
+from typing import Iterable, Optional
+
+from openai import APIConnectionError, APIStatusError, RateLimitError
+
+# -------------------------------------------------------------------
+# Client-side budget for the OpenAI account limits, shared by every tool
+# in the process so bursts queue here instead of collecting 429s
+# (defaults: gpt-4o-mini, usage tier 1)
+# -------------------------------------------------------------------
+
+# OPENAI_RPM_LIMIT / OPENAI_TPM_LIMIT are the account-wide limits; every
+# uvicorn worker has its own limiter, so each gets an equal share
+WEB_WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+LLM_RPM_LIMIT = max(1, int(os.getenv("OPENAI_RPM_LIMIT", "500")) // WEB_WORKERS)
+LLM_TPM_LIMIT = max(1, int(os.getenv("OPENAI_TPM_LIMIT", "200000")) // WEB_WORKERS)
+# Rough prompt-size estimate used for the TPM budget
+LLM_CHARS_PER_TOKEN = 4
+
+
+class RateLimiter:
+    """
+    Request and token buckets that refill continuously up to one minute of
+    budget. acquire() waits until both have room; waiters are served in order.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+        self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, tokens: int) -> None:
+        tokens = min(tokens, self.tpm)
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.requests >= 1 and self.tokens >= tokens:
+                    self.requests -= 1
+                    self.tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self.requests) * 60.0 / self.rpm,
+                    (tokens - self.tokens) * 60.0 / self.tpm,
+                )
+                await asyncio.sleep(wait)
+
+
+llm_limiter = RateLimiter(LLM_RPM_LIMIT, LLM_TPM_LIMIT)
+
+
+def retry_after_seconds(err: Exception) -> Optional[float]:
+    response = getattr(err, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        # HTTP-date form of Retry-After: fall back to our own backoff
+        return None
+    return None
+
+
+def is_retryable_openai_error(err: Exception, retryable_status: Iterable[int]) -> bool:
+    # Exhausted quota will not recover by waiting
+    if isinstance(err, RateLimitError) and getattr(err, "code", None) == "insufficient_quota":
+        return False
+    if isinstance(err, APIStatusError):
+        return err.status_code in retryable_status
+    # APIConnectionError also covers APITimeoutError
+    return isinstance(err, APIConnectionError)